@@ -0,0 +1,111 @@
+"""Non-blocking traversal animation driven by the Tk event loop"""
+import queue
+import time
+
+
+class AnimationScheduler:
+    """Plays traversal steps from a queue with root.after instead of sleeping.
+
+    The playback position advances by speed() steps per second of unpaused time.
+    Each tick renders every step that has come due since the previous tick as one
+    frame, so slow renders drop intermediate frames instead of stretching playback.
+    Producers may put steps on the queue from any thread and finish with END.
+    """
+
+    END = object()
+    FRAME_BUDGET_MS = 33
+    MAX_IDLE_MS = 100
+
+    def __init__(self, root, render, speed, on_finish=None):
+        self.root = root
+        self.render = render
+        self.speed = speed
+        self.on_finish = on_finish
+        self.queue = queue.Queue()
+        self.running = False
+        self.paused = False
+        self._after_id = None
+        self._position = 0.0
+        self._shown = 0
+        self._last_tick = 0.0
+
+    def start(self, steps=(), finished=True):
+        """Cancel any current animation and play steps, plus whatever is queued later"""
+        self.cancel()
+        for step in steps:
+            self.queue.put(step)
+        if finished:
+            self.queue.put(self.END)
+        self.running = True
+        self.paused = False
+        self._position = 0.0
+        self._shown = 0
+        self._last_tick = time.perf_counter()
+        self._schedule(0)
+
+    def pause(self):
+        if self.running and not self.paused:
+            self.paused = True
+            self._unschedule()
+
+    def resume(self):
+        if self.running and self.paused:
+            self.paused = False
+            self._last_tick = time.perf_counter()
+            self._schedule(0)
+
+    def cancel(self):
+        """Stop playback and discard any steps still queued"""
+        self._unschedule()
+        self.running = False
+        self.paused = False
+        while True:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def _schedule(self, delay_ms):
+        self._after_id = self.root.after(int(delay_ms), self._tick)
+
+    def _unschedule(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self):
+        self._after_id = None
+        now = time.perf_counter()
+        speed = max(self.speed(), 1e-6)
+        self._position += (now - self._last_tick) * speed
+        self._last_tick = now
+
+        # Coalesce every step that came due since the last frame into this one
+        steps = []
+        finished = False
+        while self._shown + len(steps) < int(self._position) + 1:
+            try:
+                step = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if step is self.END:
+                finished = True
+                break
+            steps.append(step)
+        if steps:
+            self.render(steps)
+            self._shown += len(steps)
+
+        if finished:
+            self.running = False
+            if self.on_finish:
+                self.on_finish()
+            return
+        if self._shown > int(self._position):
+            # Ahead of the clock: sleep until the next step is due
+            wait_ms = (self._shown - self._position) / speed * 1000
+        else:
+            # Behind (or waiting on the producer): try again after one frame budget
+            wait_ms = self.FRAME_BUDGET_MS
+        self._position = min(self._position, self._shown + 1)
+        self._schedule(min(max(wait_ms, self.FRAME_BUDGET_MS), self.MAX_IDLE_MS))
@@ -0,0 +1,270 @@
+"""Process-pool traversals over one read-only CSR graph in shared memory: multi-source
+batch BFS and level-synchronous parallel BFS"""
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+import os
+import threading
+import time
+from traversal_engine import CSRGraph, _run
+
+DEFAULT_TASK_SIZE = 64
+
+# Frontiers smaller than this are expanded in the calling process, where a level
+# costs less than a round trip to the pool
+MIN_PARALLEL_FRONTIER = 2048
+
+# Set in each pool process by _attach
+_graph = None
+_blocks = None
+_visited = None
+_frontier = None
+
+
+def spawn_context():
+    """Multiprocessing context for the process pools"""
+    # spawn keeps the children clear of Tk and the worker threads' locks
+    return multiprocessing.get_context("spawn")
+
+
+def _share(values, itemsize):
+    nbytes = len(values) * itemsize
+    block = SharedMemory(create=True, size=max(nbytes, 1))
+    block.buf[:nbytes] = memoryview(values).cast('B')
+    return block
+
+
+class SharedCSR:
+    """A copy of a CSRGraph's offset and target arrays in shared memory.
+
+    Pool processes attach to the blocks by name, so the arrays are copied once no
+    matter how many processes or tasks read them; only the labels are pickled, once
+    per process. close() releases the blocks.
+    """
+
+    def __init__(self, graph):
+        self.labels = list(graph.labels)
+        self.num_edges = graph.num_edges
+        self._offsets = _share(graph.offsets, 8)
+        self._targets = _share(graph.targets, 4)
+
+    def spec(self):
+        return self.labels, self._offsets.name, self._targets.name, self.num_edges
+
+    def close(self):
+        for block in (self._offsets, self._targets):
+            block.close()
+            block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _attach(spec, level_names=None):
+    global _graph, _blocks, _visited, _frontier
+    labels, offsets_name, targets_name, num_edges = spec
+    _blocks = [SharedMemory(offsets_name), SharedMemory(targets_name)]
+    offsets = _blocks[0].buf[:8 * (len(labels) + 1)].cast('q')
+    targets = _blocks[1].buf[:4 * num_edges].cast('i')
+    _graph = CSRGraph(labels, offsets, targets)
+    if level_names is not None:
+        _blocks += [SharedMemory(name) for name in level_names]
+        _visited = _blocks[2].buf[:len(labels)]
+        _frontier = _blocks[3].buf[:4 * len(labels)].cast('i')
+
+
+def bfs_levels(graph, start_id, goal_id=-1):
+    """Level-synchronous BFS from start_id returning (distance, nodes_visited, depth).
+
+    distance holds the hop count of every discovered node id, or -1. The search
+    stops after the level that discovers goal_id, if one is given; depth is the
+    last level reached.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    distance = array('i', [-1]) * len(graph)
+    distance[start_id] = 0
+    frontier = [start_id]
+    visited = 1
+    depth = 0
+    while frontier and start_id != goal_id:
+        next_frontier = []
+        for u in frontier:
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if distance[v] < 0:
+                    distance[v] = depth + 1
+                    next_frontier.append(v)
+        if not next_frontier:
+            break
+        depth += 1
+        visited += len(next_frontier)
+        if goal_id >= 0 and distance[goal_id] >= 0:
+            break
+        frontier = next_frontier
+    return distance, visited, depth
+
+
+def query_result(graph, source, goal=None, keep_distances=False):
+    """BFS from one source and summarize it as a result dict"""
+    if source not in graph:
+        return {"source": source, "goal": goal, "error": "Start node not in graph"}
+    goal_id = graph.index.get(goal, -1) if goal is not None else -1
+    start_ns = time.perf_counter_ns()
+    distance, visited, depth = bfs_levels(graph, graph.index[source], goal_id)
+    result = {
+        "source": source,
+        "goal": goal,
+        "nodes_visited": visited,
+        "depth": depth,
+        "distance": distance[goal_id] if goal_id >= 0 and distance[goal_id] >= 0 else None,
+        "execution_time": (time.perf_counter_ns() - start_ns) / 1e6,  # in milliseconds
+    }
+    if keep_distances:
+        result["distances"] = distance
+    return result
+
+
+def _run_task(queries, keep_distances):
+    return [query_result(_graph, source, goal, keep_distances) for source, goal in queries]
+
+
+def batch_bfs(graph, sources, goals=None, processes=None, task_size=DEFAULT_TASK_SIZE,
+              keep_distances=False):
+    """BFS from every source (towards goals[i], if goals is given) across a process
+    pool, yielding result dicts in completion order.
+
+    The graph is placed in shared memory once for the whole batch and queries are
+    sent in tasks of task_size sources. With keep_distances=True each result also
+    carries the distance array indexed by node id (graph.labels order). Closing the
+    generator early cancels the tasks that have not started.
+    """
+    goals = goals if goals is not None else [None] * len(sources)
+    queries = list(zip(sources, goals))
+    if not queries:
+        return
+    with SharedCSR(graph) as shared:
+        pool = ProcessPoolExecutor(processes, mp_context=spawn_context(),
+                                   initializer=_attach, initargs=(shared.spec(),))
+        try:
+            futures = [pool.submit(_run_task, queries[i:i + task_size], keep_distances)
+                       for i in range(0, len(queries), task_size)]
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def expand_frontier(graph, visited, frontier):
+    """Return (nodes, parents): the unvisited successors of a frontier slice, each
+    once, with the first frontier node that reaches it"""
+    offsets, targets = graph.offsets, graph.targets
+    seen = set()
+    nodes = array('i')
+    parents = array('i')
+    for u in frontier:
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if not visited[v] and v not in seen:
+                seen.add(v)
+                nodes.append(v)
+                parents.append(u)
+    return nodes, parents
+
+
+def _expand_range(lo, hi):
+    return expand_frontier(_graph, _visited, _frontier[lo:hi])
+
+
+class ParallelBFS:
+    """Level-synchronous BFS on one graph whose frontier expansion is split across a
+    process pool.
+
+    The pool, the shared CSR and the shared visited/frontier arrays are set up once
+    and reused by every search; call close() (or use it as a context manager) when
+    done. Each level is cut into one contiguous frontier range per process; workers
+    read the shared visited bytes to drop already-visited successors, and the merge
+    marks the new level in frontier order, so traversal_path, parents and goal_path
+    match breadth_first_search exactly. Instances are called like the engine's
+    traversal functions.
+    """
+
+    def __init__(self, graph, processes=None, min_parallel_frontier=MIN_PARALLEL_FRONTIER):
+        self.graph = graph
+        self.processes = processes or os.cpu_count()
+        self.min_parallel_frontier = min_parallel_frontier
+        n = len(graph)
+        self._shared = SharedCSR(graph)
+        self._visited_block = SharedMemory(create=True, size=max(n, 1))
+        self._frontier_block = SharedMemory(create=True, size=max(4 * n, 1))
+        self._visited = self._visited_block.buf[:n]
+        self._frontier = self._frontier_block.buf[:4 * n].cast('i')
+        self._lock = threading.Lock()  # one search at a time owns the shared arrays
+        self._pool = ProcessPoolExecutor(
+            self.processes, mp_context=spawn_context(), initializer=_attach,
+            initargs=(self._shared.spec(), (self._visited_block.name, self._frontier_block.name)))
+
+    def __call__(self, graph, start, goal=None, progress=None, counters=False):
+        """Perform parallel BFS and return path with statistics"""
+        if graph is not self.graph:
+            return [], {"error": "ParallelBFS was set up for a different graph"}
+        return _run(self._search, "BFS (parallel)", graph, start, goal, progress, counters)
+
+    def _search(self, graph, start_id, goal_id, progress=None):
+        with self._lock:
+            return self._levels(graph, start_id, goal_id, progress)
+
+    def _levels(self, graph, start_id, goal_id, progress):
+        n = len(graph)
+        visited = self._visited
+        visited[:] = bytes(n)
+        parent = array('i', [-1]) * n
+        visited[start_id] = 1
+        parent[start_id] = start_id
+        order = [start_id]
+        if start_id == goal_id:
+            return order, parent, True
+
+        frontier = array('i', [start_id])
+        while frontier:
+            if len(frontier) < self.min_parallel_frontier:
+                levels = [expand_frontier(graph, visited, frontier)]
+            else:
+                self._frontier[:len(frontier)] = frontier
+                step = -(-len(frontier) // self.processes)
+                bounds = range(0, len(frontier), step)
+                levels = self._pool.map(_expand_range, bounds,
+                                        [min(lo + step, len(frontier)) for lo in bounds])
+
+            # Merge in frontier order so each node keeps its sequential BFS parent
+            next_frontier = array('i')
+            for nodes, parents in levels:
+                for v, u in zip(nodes, parents):
+                    if not visited[v]:
+                        visited[v] = 1
+                        parent[v] = u
+                        next_frontier.append(v)
+                        if v == goal_id:
+                            order.extend(next_frontier)
+                            return order, parent, True
+            order.extend(next_frontier)
+            frontier = next_frontier
+            if progress is not None:
+                progress(len(order), len(frontier))
+        return order, parent, False
+
+    def close(self):
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._visited.release()
+        self._frontier.release()
+        for block in (self._visited_block, self._frontier_block):
+            block.close()
+            block.unlink()
+        self._shared.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
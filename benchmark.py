@@ -0,0 +1,428 @@
+"""Benchmark harness for the traversal engine.
+
+Timings use perf_counter_ns over repeated runs after a warmup, with the garbage
+collector paused. Memory is measured in a separate tracemalloc pass so that
+tracing overhead never inflates the timings.
+"""
+import argparse
+import csv
+import functools
+import gc
+import json
+import math
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import batch_traversal
+import graph_generators
+import traversal_engine
+
+DEFAULT_WARMUP = 3
+DEFAULT_REPEATS = 15
+
+# Two-sided 95% Student t critical values for 1..30 degrees of freedom
+_T95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+        2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+        2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+
+def summarize(samples):
+    """Summarize timing samples (ms) as median/p95/stddev and a 95% CI of the mean"""
+    ordered = sorted(samples)
+    n = len(ordered)
+    mean = statistics.fmean(ordered)
+    stddev = statistics.stdev(ordered) if n > 1 else 0.0
+    t = _T95[n - 2] if 1 < n <= len(_T95) + 1 else 1.96
+    half_width = t * stddev / math.sqrt(n)
+    return {
+        "runs": n,
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": mean,
+        "p95": ordered[max(0, math.ceil(0.95 * n) - 1)],
+        "stddev": stddev,
+        "ci_low": mean - half_width,
+        "ci_high": mean + half_width,
+    }
+
+
+def measure_memory(traversal, graph, start, goal=None):
+    """Run a traversal once under tracemalloc and return its peak allocation in KB"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        traversal(graph, start, goal)
+        current_mem, peak_mem = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_mem / 1024
+
+
+def benchmark_traversal(traversal, graph, start, goal=None,
+                        warmup=DEFAULT_WARMUP, repeats=DEFAULT_REPEATS):
+    """Time a traversal over repeated warm runs, then measure its memory separately"""
+    for _ in range(warmup):
+        path, stats = traversal(graph, start, goal)
+        if "error" in stats:
+            return stats
+
+    samples = []
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            path, stats = traversal(graph, start, goal)
+            samples.append(stats["execution_time"])
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    result = summarize(samples)
+    result["algorithm"] = stats["algorithm"]
+    result["nodes_visited"] = stats["nodes_visited"]
+    result["path_length"] = stats["path_length"]
+    result["memory_used"] = measure_memory(traversal, graph, start, goal)
+    return result
+
+
+def time_winner(columns):
+    """Pick the fastest of (name, result) columns, or "Tie" when its confidence
+    interval overlaps another's"""
+    name, best = min(columns, key=lambda column: column[1]["ci_high"])
+    for other_name, other in columns:
+        if other is not best and other["ci_low"] <= best["ci_high"]:
+            return "Tie"
+    return name
+
+
+def random_graph(num_nodes, num_edges, seed=0):
+    """Build a seeded random directed CSRGraph with integer node labels"""
+    rng = random.Random(seed)
+    edges = ((rng.randrange(num_nodes), rng.randrange(num_nodes)) for _ in range(num_edges))
+    return traversal_engine.CSRGraph.from_edges(range(num_nodes), edges)
+
+
+def bfs_scaling(sizes=(10_000, 100_000, 1_000_000, 2_000_000), avg_degree=8, seed=0, repeats=3):
+    """Median time of every BFS mode on growing random graphs"""
+    rows = []
+    for num_edges in sizes:
+        graph = random_graph(num_edges // avg_degree, num_edges, seed)
+        graph.reverse_csr()  # built once per graph, keep it out of the timings
+        for name, traversal in traversal_engine.BFS_MODES.items():
+            result = benchmark_traversal(traversal, graph, 0, warmup=1, repeats=repeats)
+            if "error" in result:
+                continue  # e.g. vectorized BFS without numpy and scipy
+            rows.append((name, num_edges, result["nodes_visited"], result["median"],
+                         result["median"] * 1e6 / num_edges))
+    return rows
+
+
+def batch_scaling(graph, sources, worker_counts=(1, 2, 4, 8)):
+    """Wall time of one batch BFS over the same sources with growing process counts,
+    including pool start-up and shared-memory setup"""
+    rows = []
+    for workers in worker_counts:
+        start_ns = time.perf_counter_ns()
+        for result in batch_traversal.batch_bfs(graph, sources, processes=workers):
+            pass
+        seconds = (time.perf_counter_ns() - start_ns) / 1e9
+        baseline = seconds if not rows else rows[0][1]
+        rows.append((workers, seconds, len(sources) / seconds, baseline / seconds))
+    return rows
+
+
+def parallel_scaling(graph, start=0, worker_counts=(1, 2, 4, 8), repeats=3):
+    """Median time of parallel BFS per process count, with its speedup over the
+    sequential breadth_first_search; pool start-up is kept out of the timings"""
+    sequential = benchmark_traversal(traversal_engine.breadth_first_search, graph, start,
+                                     warmup=1, repeats=repeats)["median"]
+    rows = [("sequential", sequential, 1.0)]
+    for workers in worker_counts:
+        with batch_traversal.ParallelBFS(graph, workers) as traversal:
+            median = benchmark_traversal(traversal, graph, start, warmup=1, repeats=repeats)["median"]
+        rows.append((workers, median, sequential / median))
+    return rows
+
+
+SUITE_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+SUITE_FIELDS = ("family", "mode", "nodes", "edges", "status", "nodes_visited", "median", "p95",
+                "memory_used", "frontier_peak")
+
+
+def _time_limited(traversal, seconds):
+    """Wrap a traversal so that each run raises TraversalCancelled after seconds"""
+    def run(graph, start, goal=None):
+        deadline = time.perf_counter() + seconds
+
+        def progress(nodes_visited, frontier_size):
+            if time.perf_counter() > deadline:
+                raise traversal_engine.TraversalCancelled()
+
+        return traversal(graph, start, goal, progress=progress)
+    return run
+
+
+def suite_modes():
+    """(name, traversal) for every BFS and DFS mode of the engine"""
+    return ([(f"BFS {name}", traversal) for name, traversal in traversal_engine.BFS_MODES.items()]
+            + [(f"DFS {name}", traversal) for name, traversal in traversal_engine.DFS_MODES.items()])
+
+
+def scaling_suite(families=graph_generators.FAMILIES, sizes=SUITE_SIZES, seed=0, repeats=3,
+                  time_limit=30.0):
+    """Run every traversal mode from node 0 of each seeded graph family at each size,
+    yielding one result dict (see SUITE_FIELDS) per family, size and mode.
+
+    Times are medians in ms and memory is the tracemalloc peak in KB. A run that
+    exceeds time_limit seconds is recorded with status "timeout" and the mode is
+    "skipped" at the larger sizes of that family; modes that cannot run here
+    (e.g. vectorized BFS without numpy) are left out.
+    """
+    for family in families:
+        timed_out = set()
+        for num_edges in sizes:
+            graph = graph_generators.generate(family, num_edges, seed)
+            graph.reverse_csr()  # built once per graph, keep it out of the timings
+            for name, traversal in suite_modes():
+                row = {"family": family, "mode": name, "nodes": len(graph), "edges": graph.num_edges,
+                       "status": "ok", "nodes_visited": None, "median": None, "p95": None,
+                       "memory_used": None, "frontier_peak": None}
+                if name in timed_out:
+                    row["status"] = "skipped"
+                    yield row
+                    continue
+                limited = _time_limited(traversal, time_limit)
+                try:
+                    result = benchmark_traversal(limited, graph, 0, warmup=1, repeats=repeats)
+                except traversal_engine.TraversalCancelled:
+                    timed_out.add(name)
+                    row["status"] = "timeout"
+                    yield row
+                    continue
+                if "error" in result:
+                    continue
+                row.update(nodes_visited=result["nodes_visited"], median=result["median"],
+                           p95=result["p95"], memory_used=result["memory_used"])
+                try:
+                    path, stats = _time_limited(functools.partial(traversal, counters=True), time_limit)(graph, 0)
+                    row["frontier_peak"] = stats["counters"]["frontier_peak"]
+                except traversal_engine.TraversalCancelled:
+                    pass  # timings made it under the limit but this extra run did not
+                yield row
+
+
+def write_results(rows, path):
+    """Write suite rows to path as CSV if it ends in .csv, else as JSON"""
+    with open(path, "w", newline="") as f:
+        if path.endswith(".csv"):
+            writer = csv.DictWriter(f, SUITE_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(rows, f, indent=1)
+
+
+def load_results(path):
+    """Read suite rows written by write_results"""
+    with open(path, newline="") as f:
+        if not path.endswith(".csv"):
+            return json.load(f)
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        for key in ("nodes", "edges", "nodes_visited", "frontier_peak"):
+            row[key] = int(row[key]) if row[key] else None
+        for key in ("median", "p95", "memory_used"):
+            row[key] = float(row[key]) if row[key] else None
+    return rows
+
+
+def regressions(rows, baseline, tolerance=0.25, min_ms=1.0):
+    """Return (row, baseline_row) pairs whose median time grew by more than tolerance
+    (and by at least min_ms) over the baseline run on the same family, mode and size"""
+    previous = {(row["family"], row["mode"], row["edges"]): row
+                for row in baseline if row["status"] == "ok"}
+    slower = []
+    for row in rows:
+        old = previous.get((row["family"], row["mode"], row["edges"]))
+        if old is None or row["status"] != "ok":
+            continue
+        if row["median"] > old["median"] * (1 + tolerance) and row["median"] - old["median"] >= min_ms:
+            slower.append((row, old))
+    return slower
+
+
+def plot_scaling(rows, path):
+    """Save log-log curves of median time against edge count, one panel per family
+    and one line per mode"""
+    from matplotlib.figure import Figure
+
+    families = list(dict.fromkeys(row["family"] for row in rows))
+    modes = list(dict.fromkeys(row["mode"] for row in rows))
+    columns = min(3, len(families))
+    figure = Figure(figsize=(5 * columns, 4 * math.ceil(len(families) / columns)))
+    axes = list(figure.subplots(math.ceil(len(families) / columns), columns, squeeze=False).flat)
+    lines = {}
+    for ax, family in zip(axes, families):
+        for i, mode in enumerate(modes):
+            points = [(row["edges"], row["median"]) for row in rows
+                      if row["family"] == family and row["mode"] == mode and row["status"] == "ok"]
+            if points:
+                lines[mode], = ax.loglog(*zip(*points), marker="o", color=f"C{i % 10}")
+        ax.set_title(family)
+        ax.set_xlabel("Edges")
+        ax.set_ylabel("Median time (ms)")
+        ax.grid(True, which="both", alpha=0.3)
+    for ax in axes[len(families):]:
+        ax.set_visible(False)
+    axes[0].legend(lines.values(), lines.keys(), fontsize="small")
+    figure.tight_layout()
+    figure.savefig(path)
+
+
+def compare(graph, start, goal=None, warmup=DEFAULT_WARMUP, repeats=DEFAULT_REPEATS, stream=False):
+    """Benchmark BFS and DFS (plus bidirectional BFS when a goal is given) on one query.
+    With stream=True, BFS and DFS are timed through their event streams."""
+    if stream:
+        traversals = [("BFS", functools.partial(traversal_engine.traverse_events,
+                                                traversal_engine.bfs_events, "BFS")),
+                      ("DFS", functools.partial(traversal_engine.traverse_events,
+                                                traversal_engine.dfs_events, "Iterative DFS"))]
+    else:
+        traversals = [("BFS", traversal_engine.breadth_first_search),
+                      ("DFS", traversal_engine.iterative_depth_first_search)]
+    if goal is not None:
+        traversals.append(("Bidirectional", traversal_engine.bidirectional_bfs))
+    return [(name, benchmark_traversal(traversal, graph, start, goal, warmup, repeats))
+            for name, traversal in traversals]
+
+
+def _lowest(columns, key):
+    return min(columns, key=lambda column: column[1][key])[0]
+
+
+def format_comparison(columns):
+    """Format benchmark results, given as (name, result) columns, as a fixed-width table"""
+    names = [name for name, result in columns]
+    results = [result for name, result in columns]
+    width = 20 + 16 * (len(columns) + 1)
+
+    def row(label, values, winner=""):
+        return f"{label:<20} " + "".join(f"{value:<15} " for value in values) + f"{winner:<10}\n"
+
+    output = row("Metric", names, "Winner")
+    output += "-" * width + "\n"
+    output += row("Nodes Visited", [r["nodes_visited"] for r in results], _lowest(columns, "nodes_visited"))
+    for label, key in (("Median Time (ms)", "median"), ("p95 Time (ms)", "p95"),
+                       ("Stddev (ms)", "stddev")):
+        output += row(label, [f"{r[key]:.3f}" for r in results])
+    output += row("95% CI (ms)", [f"{r['ci_low']:.3f}-{r['ci_high']:.3f}" for r in results],
+                  time_winner(columns))
+    output += row("Memory Used (KB)", [f"{r['memory_used']:.2f}" for r in results],
+                  _lowest(columns, "memory_used"))
+    if all(r["path_length"] > 0 for r in results):
+        output += row("Path Length", [r["path_length"] for r in results], _lowest(columns, "path_length"))
+    output += row("Runs", [r["runs"] for r in results])
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark BFS vs DFS traversals")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compare_parser = subparsers.add_parser("compare", help="BFS vs DFS on a seeded random graph")
+    compare_parser.add_argument("--nodes", type=int, default=10_000)
+    compare_parser.add_argument("--edges", type=int, default=80_000)
+    compare_parser.add_argument("--seed", type=int, default=0)
+    compare_parser.add_argument("--start", type=int, default=0)
+    compare_parser.add_argument("--goal", type=int, default=None)
+    compare_parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    compare_parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    compare_parser.add_argument("--stream", action="store_true",
+                                help="time BFS/DFS by consuming their event streams")
+
+    scaling_parser = subparsers.add_parser("scaling", help="BFS modes on growing random graphs")
+    scaling_parser.add_argument("--sizes", type=int, nargs="+",
+                                default=[10_000, 100_000, 1_000_000, 2_000_000])
+    scaling_parser.add_argument("--repeats", type=int, default=3)
+
+    batch_parser = subparsers.add_parser("batch", help="multi-source BFS speedup vs process count")
+    batch_parser.add_argument("--nodes", type=int, default=100_000)
+    batch_parser.add_argument("--edges", type=int, default=400_000)
+    batch_parser.add_argument("--seed", type=int, default=0)
+    batch_parser.add_argument("--sources", type=int, default=256)
+    batch_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+
+    parallel_parser = subparsers.add_parser("parallel", help="parallel BFS speedup vs process count")
+    parallel_parser.add_argument("--nodes", type=int, default=1_000_000)
+    parallel_parser.add_argument("--edges", type=int, default=8_000_000)
+    parallel_parser.add_argument("--seed", type=int, default=0)
+    parallel_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parallel_parser.add_argument("--repeats", type=int, default=3)
+
+    suite_parser = subparsers.add_parser(
+        "suite", help="every mode on seeded graph families, saved as JSON/CSV and plotted")
+    suite_parser.add_argument("--families", nargs="+", choices=graph_generators.FAMILIES,
+                              default=list(graph_generators.FAMILIES))
+    suite_parser.add_argument("--sizes", type=int, nargs="+", default=list(SUITE_SIZES),
+                              help="approximate edge counts, e.g. 1000 up to 10000000")
+    suite_parser.add_argument("--seed", type=int, default=0)
+    suite_parser.add_argument("--repeats", type=int, default=3)
+    suite_parser.add_argument("--time-limit", type=float, default=30.0,
+                              help="seconds per run before a mode is skipped at larger sizes")
+    suite_parser.add_argument("--output", default="scaling.json", help="results file (.json or .csv)")
+    suite_parser.add_argument("--plot", default="scaling.png", help="scaling curves image")
+    suite_parser.add_argument("--baseline", help="earlier results file to check for regressions")
+    suite_parser.add_argument("--tolerance", type=float, default=0.25,
+                              help="allowed median slowdown over the baseline, as a fraction")
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        graph = random_graph(args.nodes, args.edges, args.seed)
+        print(format_comparison(compare(graph, args.start, args.goal, args.warmup, args.repeats, args.stream)), end="")
+    elif args.command == "batch":
+        graph = random_graph(args.nodes, args.edges, args.seed)
+        sources = random.Random(args.seed).sample(range(args.nodes), min(args.sources, args.nodes))
+        print(f"{'Workers':>8} {'Seconds':>10} {'Sources/s':>10} {'Speedup':>8}")
+        print("-" * 40)
+        for workers, seconds, rate, speedup in batch_scaling(graph, sources, args.workers):
+            print(f"{workers:>8} {seconds:>10.2f} {rate:>10.1f} {speedup:>8.2f}")
+    elif args.command == "suite":
+        rows = []
+        print(f"{'Family':<10} {'Mode':<26} {'Edges':>10} {'Visited':>10} {'Median (ms)':>12} "
+              f"{'Memory (KB)':>12} {'Peak':>9}")
+        print("-" * 95)
+        for row in scaling_suite(args.families, args.sizes, args.seed, args.repeats, args.time_limit):
+            rows.append(row)
+            if row["status"] != "ok":
+                print(f"{row['family']:<10} {row['mode']:<26} {row['edges']:>10} {row['status']:>10}")
+                continue
+            peak = row["frontier_peak"] if row["frontier_peak"] is not None else "-"
+            print(f"{row['family']:<10} {row['mode']:<26} {row['edges']:>10} {row['nodes_visited']:>10} "
+                  f"{row['median']:>12.2f} {row['memory_used']:>12.1f} {peak:>9}")
+        write_results(rows, args.output)
+        plot_scaling(rows, args.plot)
+        print(f"Saved {args.output} and {args.plot}")
+        if args.baseline:
+            slower = regressions(rows, load_results(args.baseline), args.tolerance)
+            for row, old in slower:
+                print(f"REGRESSION {row['family']} {row['mode']} {row['edges']} edges: "
+                      f"{old['median']:.2f} -> {row['median']:.2f} ms")
+            return 1 if slower else 0
+    elif args.command == "parallel":
+        graph = random_graph(args.nodes, args.edges, args.seed)
+        print(f"{'Workers':>10} {'Median (ms)':>12} {'Speedup':>8}")
+        print("-" * 32)
+        for workers, ms, speedup in parallel_scaling(graph, 0, args.workers, args.repeats):
+            print(f"{workers:>10} {ms:>12.1f} {speedup:>8.2f}")
+    else:
+        print(f"{'Mode':<22} {'Edges':>10} {'Visited':>10} {'Median (ms)':>12} {'ns/edge':>10}")
+        print("-" * 68)
+        for name, num_edges, visited, ms, ns_per_edge in bfs_scaling(args.sizes, repeats=args.repeats):
+            print(f"{name:<22} {num_edges:>10} {visited:>10} {ms:>12.1f} {ns_per_edge:>10.1f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Seeded synthetic graph families for benchmarks, built straight into CSR form.
+
+Every generator returns a CSRGraph whose labels are the node ids 0..n-1, and node
+0 is a natural start: the grid corner, the chain head, the tree root. The random
+families (gnp, power-law) are fully determined by their seed; the others ignore it.
+"""
+from array import array
+import math
+import random
+from traversal_engine import CSRGraph, _counting_sort
+
+FAMILIES = ("gnp", "power-law", "grid", "chain", "tree", "clique")
+
+
+def _csr(n, sources, targets):
+    offsets, targets = _counting_sort(n, sources, targets)
+    return CSRGraph(range(n), offsets, targets)
+
+
+def gnp_graph(n, p, seed=0):
+    """Directed Erdos-Renyi G(n, p): each of the n(n-1) ordered pairs is an edge with
+    probability p. Gaps between edges are drawn geometrically (Batagelj-Brandes), so
+    the cost is proportional to the edges generated, not to n squared."""
+    rng = random.Random(seed)
+    sources, targets = array('i'), array('i')
+    if n < 2 or p <= 0:
+        return _csr(n, sources, targets)
+    if p >= 1:
+        return clique_graph(n)
+    log_q = math.log(1.0 - p)
+    pairs = n * (n - 1)
+    i = -1
+    while True:
+        i += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if i >= pairs:
+            break
+        u, r = divmod(i, n - 1)
+        sources.append(u)
+        targets.append(r + (r >= u))  # skip the self loop
+    return _csr(n, sources, targets)
+
+
+def power_law_graph(n, attachments=4, seed=0):
+    """Scale-free graph by Barabasi-Albert preferential attachment: each new node links
+    to attachments existing nodes picked in proportion to their degree. Links are
+    stored in both directions, so hubs have large in- and out-degrees."""
+    rng = random.Random(seed)
+    sources, targets = array('i'), array('i')
+    ends = array('i')  # both endpoints of every link, so a uniform pick favours hubs
+    for v in range(n):
+        if v <= attachments:
+            chosen = range(v)
+        else:
+            chosen = set()
+            while len(chosen) < attachments:
+                chosen.add(ends[rng.randrange(len(ends))])
+            chosen = sorted(chosen)
+        for u in chosen:
+            sources.extend((u, v))
+            targets.extend((v, u))
+            ends.extend((u, v))
+    return _csr(n, sources, targets)
+
+
+def grid_graph(rows, cols):
+    """rows x cols lattice with edges both ways between horizontal and vertical
+    neighbours; node r * cols + c sits at row r, column c"""
+    sources, targets = array('i'), array('i')
+    for r in range(rows):
+        for c in range(cols):
+            u = r * cols + c
+            for dr, dc in ((-1, 0), (0, -1), (0, 1), (1, 0)):
+                if 0 <= r + dr < rows and 0 <= c + dc < cols:
+                    sources.append(u)
+                    targets.append(u + dr * cols + dc)
+    return _csr(rows * cols, sources, targets)
+
+
+def chain_graph(n):
+    """Directed path 0 -> 1 -> ... -> n-1, as deep as a graph of n nodes gets"""
+    return _csr(n, array('i', range(n - 1)), array('i', range(1, n)))
+
+
+def tree_graph(n, branching=32):
+    """Complete tree of n nodes with edges from parent to child; node i's children
+    are branching * i + 1 .. branching * i + branching"""
+    return _csr(n, array('i', [(v - 1) // branching for v in range(1, n)]), array('i', range(1, n)))
+
+
+def clique_graph(n):
+    """Complete directed graph: an edge between every ordered pair of distinct nodes"""
+    sources, targets = array('i'), array('i')
+    for u in range(n):
+        sources.extend(array('i', [u]) * (n - 1))
+        targets.extend(range(u))
+        targets.extend(range(u + 1, n))
+    return _csr(n, sources, targets)
+
+
+def generate(family, num_edges, seed=0, avg_degree=8, branching=32):
+    """Build a graph of one of FAMILIES with about num_edges edges.
+
+    gnp and power-law graphs get num_edges / avg_degree nodes; chains and trees
+    num_edges + 1; grids and cliques whatever side length comes closest.
+    """
+    if family == "gnp":
+        n = max(2, round(num_edges / avg_degree))
+        return gnp_graph(n, num_edges / (n * (n - 1)), seed)
+    if family == "power-law":
+        attachments = max(1, avg_degree // 2)
+        return power_law_graph(max(attachments + 1, num_edges // (2 * attachments)), attachments, seed)
+    if family == "grid":
+        side = max(2, round(math.sqrt(num_edges / 4)))
+        return grid_graph(side, side)
+    if family == "chain":
+        return chain_graph(num_edges + 1)
+    if family == "tree":
+        return tree_graph(num_edges + 1, branching)
+    if family == "clique":
+        return clique_graph(max(2, round((1 + math.sqrt(1 + 4 * num_edges)) / 2)))
+    raise ValueError(f"Unknown graph family '{family}'")
@@ -0,0 +1,125 @@
+"""Streaming import of large edge-list, CSV and TSV files"""
+import mmap
+import operator
+import os
+from traversal_engine import CSRGraph
+
+DEFAULT_CHUNK_BYTES = 8 << 20
+
+
+def sniff_delimiter(line):
+    """Guess the field delimiter of an edge line: tab, comma, else any whitespace"""
+    if '\t' in line:
+        return '\t'
+    if ',' in line:
+        return ','
+    return None
+
+
+def _data_lines(text):
+    lines = text.splitlines()
+    if '#' in text or '' in lines:
+        lines = [line for line in lines if line.strip() and not line.startswith('#')]
+    return lines
+
+
+def _parse_lines(lines, delimiter):
+    """Turn edge lines into a flat [u1, v1, u2, v2, ...] label list"""
+    fields = len(lines[0].split(delimiter))
+    # Column counts per line: fields - 1 delimiters, or fields whitespace-split tokens
+    if delimiter is None:
+        uniform = set(map(len, map(str.split, lines))) == {fields}
+    else:
+        uniform = set(map(operator.methodcaller('count', delimiter), lines)) == {fields - 1}
+    if fields >= 2 and uniform:
+        # Every line has the same number of columns: slice sources and targets
+        # straight out of the joined token list
+        if delimiter is None:
+            tokens = ' '.join(lines).split()
+        else:
+            tokens = list(map(str.strip, delimiter.join(lines).split(delimiter)))
+        if fields == 2:
+            return tokens
+        flat = [None] * (2 * len(lines))
+        flat[0::2] = tokens[0::fields]
+        flat[1::2] = tokens[1::fields]
+        return flat
+
+    flat = []
+    for line in lines:
+        parts = line.split(delimiter)
+        if not line.strip():
+            continue
+        if len(parts) < 2:
+            raise ValueError(f"Invalid edge line: '{line}'")
+        flat.append(parts[0].strip())
+        flat.append(parts[1].strip())
+    return flat
+
+
+def iter_edge_chunks(path, delimiter=None, skip_header=False,
+                     chunk_bytes=DEFAULT_CHUNK_BYTES, progress=None):
+    """Yield flat [u1, v1, u2, v2, ...] label lists parsed from a memory-mapped file.
+
+    Each line holds a source and a target, optionally followed by more columns
+    (such as weights) that are ignored. Blank lines and '#' comments are skipped.
+    The delimiter is sniffed from the first edge line when not given. Only one
+    chunk of about chunk_bytes is decoded at a time; progress(bytes_read,
+    total_bytes) is called after each one.
+    """
+    total = os.path.getsize(path)
+    if total == 0:
+        return
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        position = 0
+        first_chunk = True
+        while position < total:
+            end = min(position + chunk_bytes, total)
+            if end < total:
+                # Cut at the last newline so no line spans two chunks
+                newline = data.rfind(b'\n', position, end)
+                if newline < 0:
+                    newline = data.find(b'\n', end)
+                end = newline + 1 if newline >= 0 else total
+            lines = _data_lines(data[position:end].decode('utf-8'))
+            position = end
+            if first_chunk and lines:
+                first_chunk = False
+                if delimiter is None:
+                    delimiter = sniff_delimiter(lines[0])
+                if skip_header:
+                    lines = lines[1:]
+            if lines:
+                yield _parse_lines(lines, delimiter)
+            if progress is not None:
+                progress(position, total)
+
+
+def has_header(path, delimiter=None, sample_bytes=65536):
+    """Guess whether an edge file starts with a header row such as 'source,target'.
+
+    The first row is taken as a header only when its labels are text over
+    numeric edges; anything else is read as an edge.
+    """
+    with open(path, 'rb') as f:
+        sample = f.read(sample_bytes).decode('utf-8', errors='replace')
+    lines = _data_lines(sample)
+    if len(sample) == sample_bytes:
+        lines = lines[:-1]  # possibly cut short by the sample
+    if len(lines) < 2:
+        return False
+    if delimiter is None:
+        delimiter = sniff_delimiter(lines[0])
+    first = [label.strip() for label in lines[0].split(delimiter)[:2]]
+    if len(first) < 2:
+        return False
+    rows = [line.split(delimiter) for line in lines[1:]]
+    labels = {label.strip() for row in rows for label in row[:2]}
+    return not any(label.lstrip('-').isdigit() for label in first) and \
+        all(label.lstrip('-').isdigit() for label in labels)
+
+
+def load_edge_list(path, delimiter=None, skip_header=False, progress=None):
+    """Load an edge-list file straight into a CSRGraph, creating nodes implicitly"""
+    chunks = iter_edge_chunks(path, delimiter, skip_header, progress=progress)
+    return CSRGraph.from_edge_chunks(chunks)
@@ -0,0 +1,52 @@
+"""Graphviz layout computed once per graph version and reused for every frame"""
+import shlex
+from graphviz import Digraph
+
+
+class GraphLayout:
+    """Node positions and edge geometry from a single Graphviz run, in inches.
+
+    Coordinates use Graphviz's origin at the bottom-left. nodes maps a node name to
+    (x, y, width, height) of its ellipse; edges holds (tail, head, points) where
+    points are the cubic Bezier control points of the edge spline.
+    """
+
+    def __init__(self, width=0.0, height=0.0, nodes=None, edges=None):
+        self.width = width
+        self.height = height
+        self.nodes = nodes if nodes is not None else {}
+        self.edges = edges if edges is not None else []
+
+
+def compute_layout(graph, engine='dot'):
+    """Run Graphviz once on a networkx DiGraph and return its GraphLayout"""
+    if not graph.number_of_nodes():
+        return GraphLayout()
+    dot = Digraph(engine=engine)
+    for node in graph.nodes():
+        dot.node(str(node))
+    for u, v in graph.edges():
+        dot.edge(str(u), str(v), arrowhead='none')
+    return parse_plain(dot.pipe(format='plain').decode('utf-8'))
+
+
+def parse_plain(text):
+    """Parse Graphviz 'plain' output into a GraphLayout"""
+    layout = GraphLayout()
+    for line in text.splitlines():
+        fields = shlex.split(line)
+        if not fields:
+            continue
+        kind = fields[0]
+        if kind == 'graph':
+            layout.width, layout.height = float(fields[2]), float(fields[3])
+        elif kind == 'node':
+            layout.nodes[fields[1]] = tuple(float(f) for f in fields[2:6])
+        elif kind == 'edge':
+            count = int(fields[3])
+            coords = [float(f) for f in fields[4:4 + 2 * count]]
+            points = list(zip(coords[0::2], coords[1::2]))
+            layout.edges.append((fields[1], fields[2], points))
+        elif kind == 'stop':
+            break
+    return layout
@@ -0,0 +1,155 @@
+"""Compact binary CSR graph snapshots, memory-mapped on load.
+
+A snapshot is a fixed header followed by the CSR offsets (int64), the CSR
+targets (int32), padding to 8 bytes and the label table. Integer labels are
+stored as an int64 array; string labels as int64 end offsets followed by their
+UTF-8 bytes. Arrays use the byte order of the machine that wrote them, which
+is recorded in the header.
+"""
+from array import array
+import mmap
+import os
+import struct
+import sys
+import zlib
+from traversal_engine import CSRGraph
+
+MAGIC = b'CSRGRAPH'
+VERSION = 1
+
+# Header flags
+INT_LABELS = 1
+BIG_ENDIAN = 2
+
+# magic, version, flags, num_nodes, num_edges, label_bytes, payload_crc, header_crc
+_HEADER = struct.Struct('<8sIIQQQII')
+_NATIVE_ORDER = BIG_ENDIAN if sys.byteorder == 'big' else 0
+
+
+class LabelTable:
+    """Read-only sequence of string labels decoded on access from a mapped table"""
+
+    def __init__(self, ends, blob):
+        self._ends = ends
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._ends)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        start = self._ends[i - 1] if i > 0 else 0
+        return str(self._blob[start:self._ends[i]], 'utf-8')
+
+    def __iter__(self):
+        start = 0
+        for end in self._ends:
+            yield str(self._blob[start:end], 'utf-8')
+            start = end
+
+
+class MappedCSRGraph(CSRGraph):
+    """CSRGraph whose arrays are memoryviews over a mapped snapshot file.
+
+    Pickles as its path, so worker processes map the same file instead of
+    receiving a copy of the arrays; attached weights and reachability and landmark
+    indexes travel with it.
+    """
+
+    def __init__(self, path, data, labels, offsets, targets):
+        super().__init__(labels, offsets, targets)
+        self.path = path
+        self._data = data
+
+    def __reduce__(self):
+        return load_snapshot, (self.path, False), {"reachability": self.reachability,
+                                                   "weights": self.weights,
+                                                   "landmarks": self.landmarks}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+
+def _label_sections(labels):
+    """Return (flags, buffers) encoding the label table of a snapshot"""
+    if all(type(label) is int for label in labels):
+        return INT_LABELS, [array('q', labels)]
+    if not all(isinstance(label, str) for label in labels):
+        raise ValueError("Snapshot labels must be all str or all int")
+    encoded = [label.encode('utf-8') for label in labels]
+    ends = array('q', [0]) * len(encoded)
+    total = 0
+    for i, label in enumerate(encoded):
+        total += len(label)
+        ends[i] = total
+    return 0, [ends, b''.join(encoded)]
+
+
+def save_snapshot(graph, path):
+    """Write a CSRGraph to path as a snapshot and return the number of bytes written.
+
+    The file is written next to path and renamed into place, so readers never see
+    a partial snapshot.
+    """
+    flags, label_parts = _label_sections(graph.labels)
+    flags |= _NATIVE_ORDER
+    parts = [memoryview(graph.offsets).cast('B'), memoryview(graph.targets).cast('B')]
+    if len(parts[1]) % 8:
+        parts.append(bytes(8 - len(parts[1]) % 8))
+    label_parts = [memoryview(part).cast('B') for part in label_parts]
+    payload_crc = 0
+    for part in parts + label_parts:
+        payload_crc = zlib.crc32(part, payload_crc)
+    header = _HEADER.pack(MAGIC, VERSION, flags, len(graph), graph.num_edges,
+                          sum(map(len, label_parts)), payload_crc, 0)
+    header = header[:-4] + struct.pack('<I', zlib.crc32(header[:-4]))
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        for part in parts + label_parts:
+            f.write(part)
+    os.replace(temp_path, path)
+    return os.path.getsize(path)
+
+
+def load_snapshot(path, verify=True):
+    """Map a snapshot file and return a MappedCSRGraph reading straight from it.
+
+    Only the header is parsed up front. With verify=True the payload checksum is
+    checked too, which reads the whole file once; pass verify=False to open large
+    trusted snapshots instantly. Raises ValueError for files that are not valid
+    snapshots for this machine.
+    """
+    size = os.path.getsize(path)
+    if size < _HEADER.size:
+        raise ValueError(f"Not a graph snapshot: '{path}'")
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, flags, num_nodes, num_edges, label_bytes, payload_crc, header_crc = \
+        _HEADER.unpack_from(data)
+    if magic != MAGIC or zlib.crc32(data[:_HEADER.size - 4]) != header_crc:
+        raise ValueError(f"Not a graph snapshot: '{path}'")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    if flags & BIG_ENDIAN != _NATIVE_ORDER:
+        raise ValueError("Snapshot was written on a machine with a different byte order")
+
+    offsets_end = _HEADER.size + 8 * (num_nodes + 1)
+    targets_end = offsets_end + 4 * num_edges
+    labels_start = targets_end + (-targets_end % 8)
+    if size != labels_start + label_bytes:
+        raise ValueError(f"Snapshot is truncated or corrupt: '{path}'")
+    view = memoryview(data)
+    if verify and zlib.crc32(view[_HEADER.size:]) != payload_crc:
+        raise ValueError(f"Snapshot checksum mismatch: '{path}'")
+
+    offsets = view[_HEADER.size:offsets_end].cast('q')
+    targets = view[offsets_end:targets_end].cast('i')
+    if flags & INT_LABELS:
+        labels = view[labels_start:].cast('q')
+    else:
+        ends_end = labels_start + 8 * num_nodes
+        labels = LabelTable(view[labels_start:ends_end].cast('q'), view[ends_end:])
+    return MappedCSRGraph(path, data, labels, offsets, targets)
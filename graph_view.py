@@ -0,0 +1,148 @@
+"""Bounded views of large graphs for drawing: a neighborhood around the search, a
+condensation into SCC or cluster super-nodes, and a tile index for viewport culling"""
+from collections import deque
+import math
+import networkx as nx
+
+# Views with more nodes than this are laid out with sfdp, which scales far better
+# than dot's layered layout
+SFDP_THRESHOLD = 300
+
+# Node budget of neighborhood and collapsed views
+DEFAULT_VIEW_NODES = 200
+
+# Tiles per side of a layout's bounding square
+TILES_PER_SIDE = 16
+
+
+def layout_engine(num_nodes, threshold=SFDP_THRESHOLD):
+    """Return the Graphviz engine to lay out a view of num_nodes nodes with"""
+    return 'dot' if num_nodes <= threshold else 'sfdp'
+
+
+class GraphView:
+    """What gets drawn for a graph: view is a networkx DiGraph of at most a bounded
+    number of nodes, and owner maps each graph node to the view node that draws
+    it (None means every view node draws itself). kind is "full",
+    "neighborhood" or "collapsed"; center holds the nodes a neighborhood grew from.
+    """
+
+    def __init__(self, view, kind, owner=None, center=()):
+        self.view = view
+        self.kind = kind
+        self.owner = owner
+        self.center = tuple(center)
+
+    def __len__(self):
+        return self.view.number_of_nodes()
+
+    def view_node(self, node):
+        """Return the view node drawing node, or None if it is not shown"""
+        if self.owner is not None:
+            return self.owner.get(node)
+        return node if node in self.view else None
+
+
+def full_view(graph):
+    return GraphView(graph, "full")
+
+
+def neighborhood_view(graph, centers, max_nodes=DEFAULT_VIEW_NODES):
+    """The at most max_nodes nodes closest to centers, following edges both ways,
+    with the edges among them"""
+    centers = tuple(centers)
+    nodes = {}
+    queue = deque()
+    for center in centers:
+        if center in graph and center not in nodes and len(nodes) < max_nodes:
+            nodes[center] = None
+            queue.append(center)
+    while queue and len(nodes) < max_nodes:
+        node = queue.popleft()
+        for neighbor in (*graph.successors(node), *graph.predecessors(node)):
+            if neighbor not in nodes:
+                nodes[neighbor] = None
+                queue.append(neighbor)
+                if len(nodes) >= max_nodes:
+                    break
+    return GraphView(graph.subgraph(nodes), "neighborhood", center=centers)
+
+
+def condensed_view(graph, max_nodes=DEFAULT_VIEW_NODES):
+    """Collapse each strongly connected component into a super-node; when there are
+    more than max_nodes components, consecutive runs of them in topological order
+    become cluster super-nodes instead, so every edge still points forward.
+    Components of one node keep that node's name."""
+    condensation = nx.condensation(graph)
+    order = list(nx.topological_sort(condensation))
+    group_size = max(1, math.ceil(len(order) / max_nodes))
+    owner = {}
+    group_of = {}
+    view = nx.DiGraph()
+    for start in range(0, len(order), group_size):
+        group = order[start:start + group_size]
+        members = [node for c in group for node in condensation.nodes[c]['members']]
+        if len(members) == 1:
+            name = str(members[0])
+        elif group_size == 1:
+            name = f"SCC {len(view)} ({len(members)} nodes)"
+        else:
+            name = f"Cluster {len(view)} ({len(members)} nodes)"
+        view.add_node(name, size=len(members))
+        for c in group:
+            group_of[c] = name
+        for node in members:
+            owner[node] = name
+    view.add_edges_from((group_of[a], group_of[b]) for a, b in condensation.edges()
+                        if group_of[a] != group_of[b])
+    return GraphView(view, "collapsed", owner)
+
+
+class TileIndex:
+    """Buckets a GraphLayout's nodes and edges into square tiles, so drawing a
+    viewport only touches the items near it. The buckets are filled on the first
+    query, and edges go into every tile their bounding box overlaps."""
+
+    def __init__(self, layout, tiles_per_side=TILES_PER_SIDE):
+        self.layout = layout
+        self.tiles_per_side = tiles_per_side
+        self.tile_size = max(layout.width, layout.height, 1e-9) / tiles_per_side
+        self._nodes = None  # (column, row) -> [node name]
+        self._edges = None  # (column, row) -> [edge index]
+
+    def _tile_range(self, x0, y0, x1, y1):
+        size = self.tile_size
+        return (range(math.floor(x0 / size), math.floor(x1 / size) + 1),
+                range(math.floor(y0 / size), math.floor(y1 / size) + 1))
+
+    def _fill(self):
+        self._nodes = {}
+        self._edges = {}
+        for name, (x, y, w, h) in self.layout.nodes.items():
+            columns, rows = self._tile_range(x, y, x, y)
+            self._nodes.setdefault((columns[0], rows[0]), []).append(name)
+        for i, (u, v, points) in enumerate(self.layout.edges):
+            xs = [x for x, y in points]
+            ys = [y for x, y in points]
+            columns, rows = self._tile_range(min(xs), min(ys), max(xs), max(ys))
+            for column in columns:
+                for row in rows:
+                    self._edges.setdefault((column, row), []).append(i)
+
+    def visible(self, x0, y0, x1, y1, margin=0.5):
+        """Return (node names, edges) in the tiles overlapping the box, in layout
+        inches; margin widens the box so nodes straddling its border are kept"""
+        if self._nodes is None:
+            self._fill()
+        columns, rows = self._tile_range(x0 - margin, y0 - margin, x1 + margin, y1 + margin)
+        # Zoomed far out the box covers empty space; only the layout's tiles matter
+        last = self.tiles_per_side
+        columns = range(max(columns.start, 0), min(columns.stop, last + 1))
+        rows = range(max(rows.start, 0), min(rows.stop, last + 1))
+        nodes = []
+        edge_ids = set()
+        for column in columns:
+            for row in rows:
+                nodes.extend(self._nodes.get((column, row), ()))
+                edge_ids.update(self._edges.get((column, row), ()))
+        return nodes, [self.layout.edges[i] for i in sorted(edge_ids)]
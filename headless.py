@@ -0,0 +1,160 @@
+"""Headless traversal runner: answers a stream of JSONL queries without Tk.
+
+    python BFSvsDFS.py --headless --graph web.csrg < queries.jsonl > results.jsonl
+
+Each input line is a query such as {"algorithm": "BFS", "start": "A", "goal": "C"}.
+The algorithm is "BFS", "DFS" or "Informed". Optional fields are "mode" (a name
+from BFS_MODES, DFS_MODES or INFORMED_MODES; default "Standard", or "A*" for
+informed search), "max_depth" for the depth-limited modes, "heuristic" (a
+HEURISTICS name) for informed search, "graph" (a file to search instead of
+--graph) and "id", which is copied to the result. Each query gets one JSON line
+back with the search stats, or {"error": ...} if it could not run.
+"""
+import argparse
+import json
+import sys
+import graph_io
+import graph_snapshot
+import informed_search
+import traversal_engine
+from reachability import ReachabilityIndex
+
+ALGORITHMS = {"BFS": traversal_engine.BFS_MODES, "DFS": traversal_engine.DFS_MODES,
+              "INFORMED": informed_search.INFORMED_MODES}
+DEFAULT_MODES = {"INFORMED": "A*"}
+DEPTH_LIMITED = (traversal_engine.depth_limited_search, traversal_engine.iterative_deepening_search)
+
+
+def load_graph(path, reachability=False, verify=False):
+    """Load a snapshot (recognised by its magic bytes) or an edge-list file as a
+    CSRGraph; snapshots are only checksummed in full with verify=True"""
+    with open(path, "rb") as f:
+        is_snapshot = f.read(len(graph_snapshot.MAGIC)) == graph_snapshot.MAGIC
+    if is_snapshot:
+        graph = graph_snapshot.load_snapshot(path, verify=verify)
+    else:
+        graph = graph_io.load_edge_list(path, skip_header=graph_io.has_header(path))
+    if reachability:
+        graph.reachability = ReachabilityIndex.from_csr(graph)
+    return graph
+
+
+def _label(graph, label):
+    """JSON numbers and strings can both name a node: try label as given, then as the other type"""
+    if label is None or label in graph:
+        return label
+    if isinstance(label, int):
+        other = str(label)
+    elif isinstance(label, str) and label.lstrip("-").isdigit():
+        other = int(label)
+    else:
+        return label
+    return other if other in graph else label
+
+
+# Types each query field may take; node labels are JSON strings or integers
+FIELD_TYPES = {"algorithm": (str,), "mode": (str,), "heuristic": (str,), "graph": (str,),
+               "start": (str, int), "goal": (str, int, type(None)), "max_depth": (int,)}
+
+
+def check_fields(query):
+    """Return an error message for the first field of the wrong type, or None"""
+    for field, types in FIELD_TYPES.items():
+        value = query.get(field)
+        if field in query and (isinstance(value, bool) or not isinstance(value, types)):
+            return f"Field '{field}' has the wrong type: {json.dumps(value)}"
+    return None
+
+
+def run_query(query, graph, counters=False, paths=False):
+    """Run one query on graph and return its result dict"""
+    error = check_fields(query)
+    if error is not None:
+        return {"error": error}
+    algorithm = query.get("algorithm", "BFS").upper()
+    if algorithm not in ALGORITHMS:
+        return {"error": f"Unknown algorithm '{query.get('algorithm')}'"}
+    mode = query.get("mode", DEFAULT_MODES.get(algorithm, "Standard"))
+    search = ALGORITHMS[algorithm].get(mode)
+    if search is None:
+        return {"error": f"Unknown {algorithm} mode '{mode}'"}
+    options = {"counters": counters}
+    if "max_depth" in query:
+        if search not in DEPTH_LIMITED:
+            return {"error": "max_depth only applies to the depth-limited DFS modes"}
+        options["max_depth"] = query["max_depth"]
+    if "heuristic" in query:
+        if algorithm != "INFORMED":
+            return {"error": "heuristic only applies to informed search"}
+        if query["heuristic"] not in informed_search.HEURISTICS:
+            return {"error": f"Unknown heuristic '{query['heuristic']}'"}
+        options["heuristic"] = informed_search.HEURISTICS[query["heuristic"]]
+    if "start" not in query:
+        return {"error": "Query has no start node"}
+    path, stats = search(graph, _label(graph, query["start"]), _label(graph, query.get("goal")), **options)
+    if not paths:
+        stats.pop("traversal_path", None)
+    return stats
+
+
+def run(queries, output, default_graph=None, counters=False, paths=False, reachability=False,
+        verify=False):
+    """Answer JSONL queries from the queries file object, writing a result line per
+    query to output as soon as it is known. Returns the number of failed queries."""
+    graphs = {}
+    failures = 0
+    for line_number, line in enumerate(queries, 1):
+        if not line.strip():
+            continue
+        try:
+            query = json.loads(line)
+            if not isinstance(query, dict):
+                raise ValueError("expected a JSON object")
+        except ValueError as exc:
+            query, result = {}, {"error": f"Invalid query on line {line_number}: {exc}"}
+        else:
+            path = query.get("graph", default_graph)
+            try:
+                error = check_fields(query)
+                if error is not None:
+                    raise ValueError(error)
+                if path is None:
+                    raise ValueError("No graph given: pass --graph or set \"graph\" in the query")
+                if path not in graphs:
+                    graphs[path] = load_graph(path, reachability, verify)
+                result = run_query(query, graphs[path], counters, paths)
+            except (OSError, ValueError) as exc:
+                result = {"error": str(exc)}
+        if "id" in query:
+            result = {"id": query["id"], **result}
+        failures += "error" in result
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="BFSvsDFS.py --headless",
+                                     description="Answer JSONL traversal queries without the GUI")
+    parser.add_argument("--graph", help="edge-list or snapshot file searched by queries without a \"graph\"")
+    parser.add_argument("--queries", default="-", help="JSONL query file (default: stdin)")
+    parser.add_argument("--paths", action="store_true", help="include each full traversal path")
+    parser.add_argument("--counters", action="store_true", help="add search counters and phase times")
+    parser.add_argument("--reachability", action="store_true",
+                        help="index each graph so unreachable goals are answered without searching")
+    parser.add_argument("--verify", action="store_true",
+                        help="check each snapshot's payload checksum, reading the whole file")
+    args = parser.parse_args(argv)
+
+    queries = sys.stdin if args.queries == "-" else open(args.queries)
+    try:
+        failures = run(queries, sys.stdout, args.graph, args.counters, args.paths, args.reachability,
+                       args.verify)
+    finally:
+        if queries is not sys.stdin:
+            queries.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
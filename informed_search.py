@@ -0,0 +1,247 @@
+"""A* and greedy best-first search over a CSRGraph, guided by pluggable heuristics.
+
+A heuristic is a function heuristic(graph, goal_id) returning h(node_id), a lower
+bound on the cost from node_id to the goal (math.inf when the goal is known to be
+out of reach). Edge costs are graph.weights when set, else 1 per edge. The ALT
+heuristic bounds distances with the triangle inequality over precomputed
+shortest-path tables to and from a few landmark nodes; the tables are built once
+per graph and kept on graph.landmarks, so they travel with it to worker processes.
+"""
+from array import array
+import heapq
+import math
+from traversal_engine import PROGRESS_INTERVAL, _counting_sort, _run
+
+DEFAULT_LANDMARKS = 8
+
+# Distance tables mark nodes that cannot reach or be reached with -1
+UNREACHED = -1
+
+
+def _distances(offsets, heads, weights, source):
+    """Single-source shortest-path costs over a CSR adjacency: BFS hop counts when
+    weights is None, else Dijkstra with a lazily deleted heap"""
+    n = len(offsets) - 1
+    if weights is None:
+        dist = array('i', [UNREACHED]) * n
+        dist[source] = 0
+        frontier = [source]
+        level = 0
+        while frontier:
+            level += 1
+            next_frontier = []
+            for u in frontier:
+                for v in heads[offsets[u]:offsets[u + 1]]:
+                    if dist[v] < 0:
+                        dist[v] = level
+                        next_frontier.append(v)
+            frontier = next_frontier
+        return dist
+    dist = array('d', [UNREACHED]) * n
+    done = bytearray(n)
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = 1
+        for i in range(offsets[u], offsets[u + 1]):
+            v = heads[i]
+            cost = d + weights[i]
+            if not done[v] and (dist[v] < 0 or cost < dist[v]):
+                dist[v] = cost
+                heapq.heappush(heap, (cost, v))
+    return dist
+
+
+class LandmarkIndex:
+    """Shortest-path costs from and to each of a few landmark nodes.
+
+    Landmarks are picked by farthest-point selection: each new landmark is the
+    node farthest (in either direction) from every landmark so far, preferring
+    nodes no landmark reaches at all, so separate regions of the graph get their
+    own landmark. Tables are hop counts for unweighted graphs, costs otherwise.
+    """
+
+    def __init__(self, landmarks, from_landmark, to_landmark):
+        self.landmarks = landmarks
+        self.from_landmark = from_landmark  # from_landmark[i][v]: cost landmarks[i] -> v
+        self.to_landmark = to_landmark  # to_landmark[i][v]: cost v -> landmarks[i]
+
+    @classmethod
+    def from_csr(cls, graph, count=DEFAULT_LANDMARKS):
+        n = len(graph)
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        if weights is None:
+            in_offsets, in_heads = graph.reverse_csr()
+            in_weights = None
+        else:
+            sources = array('i')
+            for u in range(n):
+                sources.extend(array('i', [u]) * (offsets[u + 1] - offsets[u]))
+            in_offsets, in_edges = _counting_sort(n, targets, array('i', range(len(targets))))
+            in_heads = array('i', (sources[e] for e in in_edges))
+            in_weights = array('d', (weights[e] for e in in_edges))
+        landmarks, from_landmark, to_landmark = [], [], []
+        # nearest[v]: cost between v and its closest landmark, in either direction
+        nearest = [math.inf] * n
+        if n:
+            # Start from the node with the most out-edges, a likely hub
+            candidate = max(range(n), key=lambda u: offsets[u + 1] - offsets[u])
+        while n and len(landmarks) < min(count, n):
+            landmarks.append(candidate)
+            forward = _distances(offsets, targets, weights, candidate)
+            backward = _distances(in_offsets, in_heads, in_weights, candidate)
+            from_landmark.append(forward)
+            to_landmark.append(backward)
+            for v in range(n):
+                for d in (forward[v], backward[v]):
+                    if 0 <= d < nearest[v]:
+                        nearest[v] = d
+            candidate = max(range(n), key=nearest.__getitem__)
+            if nearest[candidate] == 0:
+                break  # every node is a landmark
+        return cls(landmarks, from_landmark, to_landmark)
+
+    def lower_bound(self, goal_id):
+        """Return h(v), the largest triangle-inequality bound on the cost v -> goal"""
+        bounds = [(from_l, from_l[goal_id], to_l, to_l[goal_id])
+                  for from_l, to_l in zip(self.from_landmark, self.to_landmark)]
+
+        def h(v):
+            best = 0
+            for from_l, from_goal, to_l, to_goal in bounds:
+                from_v = from_l[v]
+                if from_v >= 0:
+                    if from_goal < 0:
+                        return math.inf  # the landmark reaches v but not the goal
+                    if from_goal - from_v > best:
+                        best = from_goal - from_v
+                if to_goal >= 0:
+                    to_v = to_l[v]
+                    if to_v < 0:
+                        return math.inf  # the goal reaches the landmark but v doesn't
+                    if to_v - to_goal > best:
+                        best = to_v - to_goal
+            return best
+        return h
+
+
+def landmarks(graph, count=DEFAULT_LANDMARKS):
+    """Return graph.landmarks, building the LandmarkIndex on first use"""
+    if graph.landmarks is None:
+        graph.landmarks = LandmarkIndex.from_csr(graph, count)
+    return graph.landmarks
+
+
+def zero_heuristic(graph, goal_id):
+    """No guidance: A* becomes Dijkstra's algorithm (BFS order on unweighted graphs)"""
+    return lambda v: 0
+
+
+def alt_heuristic(graph, goal_id):
+    """Landmark (ALT) lower bounds from graph.landmarks"""
+    return landmarks(graph).lower_bound(goal_id)
+
+
+HEURISTICS = {
+    "Landmarks (ALT)": alt_heuristic,
+    "Zero": zero_heuristic,
+}
+
+
+def _informed(graph, start_id, goal_id, progress, heuristic, greedy):
+    """Best-first search ordered by cost + h (A*) or by h alone (greedy).
+
+    The open set is a binary heap with lazy deletion: a cheaper route to a queued
+    node pushes a new entry, and the outdated one is skipped when popped. Expanded
+    nodes are final and never reopened, which gives optimal paths for consistent
+    heuristics such as ALT and zero.
+    """
+    n = len(graph)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    h = heuristic(graph, goal_id) if goal_id >= 0 else (lambda v: 0)
+    cost = array('d', [math.inf]) * n
+    parent = array('i', [-1]) * n
+    closed = bytearray(n)
+    cost[start_id] = 0.0
+    parent[start_id] = start_id
+    # Entries are (priority, -cost, push count, node): among equal priorities the
+    # node furthest along its path comes first, then the earliest pushed
+    heap = [(h(start_id), 0.0, 0, start_id)]
+    pushes = 1
+    peak = 1
+    order = []
+
+    while heap:
+        current = heapq.heappop(heap)[3]
+        if closed[current]:
+            continue  # outdated entry
+        closed[current] = 1
+        order.append(current)
+        if progress is not None and len(order) % PROGRESS_INTERVAL == 0:
+            progress(len(order), len(heap))
+        if current == goal_id:
+            break
+        base = cost[current]
+        for i in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[i]
+            if closed[neighbor]:
+                continue
+            new_cost = base + (weights[i] if weights is not None else 1)
+            if new_cost < cost[neighbor]:
+                estimate = h(neighbor)
+                if estimate == math.inf:
+                    continue  # the goal cannot be reached through neighbor
+                cost[neighbor] = new_cost
+                parent[neighbor] = current
+                priority = estimate if greedy else new_cost + estimate
+                heapq.heappush(heap, (priority, -new_cost, pushes, neighbor))
+                pushes += 1
+                if len(heap) > peak:
+                    peak = len(heap)
+    found = goal_id >= 0 and closed[goal_id] == 1
+    stats = {"path_cost": cost[goal_id] if found else None,
+             "heap_pushes": pushes, "frontier_peak": peak}
+    return order, parent, found, stats
+
+
+def _heuristic_name(heuristic):
+    for name, known in HEURISTICS.items():
+        if known is heuristic:
+            return name
+    return getattr(heuristic, "__name__", "custom")
+
+
+def _search(algorithm, graph, start, goal, progress, heuristic, greedy, counters):
+    if graph.weights and min(graph.weights) < 0:
+        return [], {"error": f"{algorithm} needs non-negative edge weights"}
+    if heuristic is alt_heuristic and goal is not None and goal in graph:
+        landmarks(graph)  # build the tables before _run starts timing the search
+
+    def search(graph, start_id, goal_id, progress):
+        order, parent, found, stats = _informed(graph, start_id, goal_id, progress, heuristic, greedy)
+        stats["heuristic"] = _heuristic_name(heuristic)
+        return order, parent, found, stats
+    return _run(search, algorithm, graph, start, goal, progress, counters)
+
+
+def a_star_search(graph, start, goal=None, progress=None, heuristic=alt_heuristic, counters=False):
+    """Perform A*: expand nodes by path cost so far plus the heuristic's estimate of
+    the cost left, finding a cheapest path to the goal; without a goal this is
+    Dijkstra's algorithm over everything reachable"""
+    return _search("A*", graph, start, goal, progress, heuristic, False, counters)
+
+
+def greedy_best_first_search(graph, start, goal=None, progress=None, heuristic=alt_heuristic,
+                             counters=False):
+    """Perform greedy best-first search: expand the node the heuristic rates closest
+    to the goal. Usually visits fewer nodes than A*, but the path may cost more."""
+    return _search("Greedy best-first", graph, start, goal, progress, heuristic, True, counters)
+
+
+INFORMED_MODES = {
+    "A*": a_star_search,
+    "Greedy best-first": greedy_best_first_search,
+}
@@ -0,0 +1,111 @@
+"""Per-phase event counters and timings, exportable as JSON or a Chrome trace"""
+from contextlib import contextmanager, nullcontext
+import json
+import os
+import threading
+import time
+
+# Timed spans kept for the trace export; later spans are only added to the totals
+MAX_SPANS = 100_000
+
+_NO_PHASE = nullcontext()
+
+
+class Instruments:
+    """Counts named events and times code spans, grouped by phase.
+
+    Instrumented code calls count() and phase() unconditionally: while enabled is
+    false both return at once, so leaving the calls in place costs next to nothing.
+    Results of searches run with counters=True are added with add_search().
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.clear()
+
+    def clear(self):
+        self.counts = {}  # phase -> {counter: value}
+        self.totals = {}  # phase -> [calls, total ns]
+        self.spans = []  # (phase, start ns, duration ns, thread id)
+        self._origin = time.perf_counter_ns()
+
+    def count(self, phase, name, amount=1):
+        if self.enabled:
+            counts = self.counts.setdefault(phase, {})
+            counts[name] = counts.get(name, 0) + amount
+
+    def peak(self, phase, name, value):
+        """Keep the largest value seen for a counter"""
+        if self.enabled:
+            counts = self.counts.setdefault(phase, {})
+            counts[name] = max(counts.get(name, value), value)
+
+    def phase(self, name):
+        """Context manager timing the code inside it as one span of phase name"""
+        return self._timed(name) if self.enabled else _NO_PHASE
+
+    @contextmanager
+    def _timed(self, name):
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self._add_span(name, start_ns, time.perf_counter_ns() - start_ns)
+
+    def _add_span(self, name, start_ns, duration_ns):
+        total = self.totals.setdefault(name, [0, 0])
+        total[0] += 1
+        total[1] += duration_ns
+        if len(self.spans) < MAX_SPANS:
+            self.spans.append((name, start_ns, duration_ns, threading.get_ident()))
+
+    def add_search(self, name, stats):
+        """Add the counters and phase times from a search's stats as phase '<name> search'"""
+        if not self.enabled:
+            return
+        phase = f"{name} search"
+        for counter, value in stats.get("counters", {}).items():
+            if counter.endswith(("_peak", "_depth")):
+                self.peak(phase, counter, value)
+            else:
+                self.count(phase, counter, value)
+        # Searches may run in another process, so their phases are laid end to end
+        # here rather than placed by their own clock
+        start_ns = time.perf_counter_ns()
+        for step, ms in stats.get("phases", {}).items():
+            self._add_span(f"{phase}: {step}", start_ns, int(ms * 1e6))
+            start_ns += int(ms * 1e6)
+
+    def as_dict(self):
+        return {
+            "counters": self.counts,
+            "phases": {name: {"calls": calls, "total_ms": ns / 1e6}
+                       for name, (calls, ns) in self.totals.items()},
+        }
+
+    def trace(self):
+        """Return the spans and counters in Chrome trace event format, readable by
+        chrome://tracing, Perfetto and speedscope"""
+        pid = os.getpid()
+        events = [{"name": name, "cat": name.split(":")[0], "ph": "X", "pid": pid, "tid": tid,
+                   "ts": (start_ns - self._origin) / 1000, "dur": duration_ns / 1000}
+                  for name, start_ns, duration_ns, tid in self.spans]
+        end = max((event["ts"] + event["dur"] for event in events), default=0)
+        events += [{"name": phase, "ph": "C", "pid": pid, "ts": end, "args": counts}
+                   for phase, counts in self.counts.items()]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save(self, path):
+        """Write a Chrome trace if path ends in .trace.json, else the as_dict() JSON"""
+        data = self.trace() if path.endswith(".trace.json") else self.as_dict()
+        with open(path, "w") as f:
+            json.dump(data, f, indent=1)
+
+    def summary(self):
+        """Format the counters and phase totals as text lines"""
+        lines = []
+        for name, (calls, ns) in self.totals.items():
+            lines.append(f"- {name}: {ns / 1e6:.3f} ms in {calls} calls")
+        for phase, counts in self.counts.items():
+            lines.append(f"- {phase}: " + ", ".join(f"{k} {v}" for k, v in counts.items()))
+        return "\n".join(lines) + "\n" if lines else "- nothing recorded yet\n"
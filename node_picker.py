@@ -0,0 +1,78 @@
+"""Start/goal node pickers that list only the labels matching what has been typed,
+looked up in a sorted label index, so a keystroke costs the same on any graph size"""
+from bisect import bisect_left, insort
+from tkinter import ttk
+
+# Matches listed in a picker's drop-down
+MATCH_LIMIT = 50
+
+# Adding more labels than this at once re-sorts the index instead of inserting each
+BULK_ADD = 64
+
+
+class NodeIndex:
+    """Node labels kept sorted as text, for prefix lookups by bisection"""
+
+    def __init__(self, labels=()):
+        self.labels = sorted(str(label) for label in labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        label = str(label)
+        i = bisect_left(self.labels, label)
+        return i < len(self.labels) and self.labels[i] == label
+
+    def add(self, labels):
+        labels = [str(label) for label in labels]
+        if len(labels) > BULK_ADD:
+            self.labels.extend(labels)
+            self.labels.sort()
+        else:
+            for label in labels:
+                insort(self.labels, label)
+
+    def remove(self, labels):
+        for label in labels:
+            label = str(label)
+            i = bisect_left(self.labels, label)
+            if i < len(self.labels) and self.labels[i] == label:
+                del self.labels[i]
+
+    def rebuild(self, labels):
+        self.labels = sorted(str(label) for label in labels)
+
+    def clear(self):
+        self.labels = []
+
+    def matches(self, prefix, limit=MATCH_LIMIT):
+        """Return up to limit labels starting with prefix, in sorted order"""
+        i = bisect_left(self.labels, prefix)
+        matches = []
+        for label in self.labels[i:i + limit]:
+            if not label.startswith(prefix):
+                break
+            matches.append(label)
+        return matches
+
+
+class NodePicker(ttk.Combobox):
+    """Editable combobox whose drop-down lists the index labels starting with the
+    typed text; with optional=True an empty entry heads the list"""
+
+    def __init__(self, master, index, textvariable, optional=False, limit=MATCH_LIMIT, **kwargs):
+        super().__init__(master, textvariable=textvariable, postcommand=self.refresh, **kwargs)
+        self.index = index
+        self.optional = optional
+        self.limit = limit
+        self.bind('<KeyRelease>', self.on_key)
+
+    def on_key(self, event):
+        if event.keysym not in ('Up', 'Down', 'Return', 'Escape', 'Tab'):
+            self.refresh()
+
+    def refresh(self):
+        """List the first matches for the current text"""
+        matches = self.index.matches(self.get().strip(), self.limit)
+        self['values'] = [''] + matches if self.optional else matches
@@ -0,0 +1,278 @@
+"""Reachability index over the condensation DAG of strongly connected components"""
+
+
+def strongly_connected(nodes, successors):
+    """Yield the strongly connected components of a graph as sets of nodes.
+
+    Iterative Tarjan: a component is yielded only after every component it can
+    reach, so the yield order is a reverse topological order of the condensation.
+    """
+    index = {}
+    lowlink = {}
+    stack = []
+    on_stack = set()
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors(root)))]
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = lowlink[neighbor] = len(index)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(successors(neighbor))))
+                    break
+                if neighbor in on_stack and index[neighbor] < lowlink[node]:
+                    lowlink[node] = index[neighbor]
+            else:
+                work.pop()
+                if work and lowlink[node] < lowlink[work[-1][0]]:
+                    lowlink[work[-1][0]] = lowlink[node]
+                if lowlink[node] == index[node]:
+                    members = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        members.add(member)
+                        if member == node:
+                            break
+                    yield members
+
+
+class ReachabilityIndex:
+    """Answers "can start reach goal?" without searching the graph.
+
+    Nodes are grouped into strongly connected components. Every component c has an
+    interval [low[c], high[c]] kept so that if c reaches d, d's interval lies inside
+    c's; a goal outside the start's interval is rejected in O(1). Otherwise a DFS
+    over the condensation DAG, pruned by the same test, decides. add_edge and
+    remove_edge update components and intervals locally instead of rebuilding.
+    """
+
+    def __init__(self, nodes=(), edges=()):
+        self._succ = {}  # node -> set of successors
+        self._pred = {}  # node -> set of predecessors
+        self.component = {}  # node -> component id
+        self.members = {}  # component id -> set of nodes
+        self._dag_succ = {}  # component -> {successor component: edge count}
+        self._dag_pred = {}  # component -> {predecessor component: edge count}
+        self._low = {}
+        self._high = {}
+        self._next_id = 0
+        for node in nodes:
+            self._add_vertex(node)
+        for u, v in edges:
+            self._add_vertex(u)
+            self._add_vertex(v)
+            self._succ[u].add(v)
+            self._pred[v].add(u)
+
+        # Components come out children first, so their ids are post-order ranks
+        for members in strongly_connected(self._succ, self._succ.__getitem__):
+            c = self._new_component(members)
+            for u in members:
+                for v in self._succ[u]:
+                    if self.component[v] != c:
+                        self._link(c, self.component[v])
+            self._low[c] = min([c] + [self._low[d] for d in self._dag_succ[c]])
+            self._high[c] = c
+
+    @classmethod
+    def from_networkx(cls, graph):
+        return cls(graph.nodes(), graph.edges())
+
+    @classmethod
+    def from_csr(cls, graph):
+        labels = graph.labels
+        edges = ((labels[u], labels[v]) for u in range(len(graph)) for v in graph.successors(u))
+        return cls(labels, edges)
+
+    def __len__(self):
+        return len(self._succ)
+
+    @property
+    def num_components(self):
+        return len(self.members)
+
+    def reachable(self, start, goal):
+        """Return True if goal can be reached from start (every node reaches itself)"""
+        if start not in self.component or goal not in self.component:
+            return False
+        return self._reaches(self.component[start], self.component[goal])
+
+    def add_node(self, node):
+        if node not in self._succ:
+            self._add_vertex(node)
+            c = self._new_component({node})
+            self._low[c] = self._high[c] = c
+
+    def add_edge(self, u, v):
+        self.add_node(u)
+        self.add_node(v)
+        if v in self._succ[u]:
+            return
+        self._succ[u].add(v)
+        self._pred[v].add(u)
+        cu, cv = self.component[u], self.component[v]
+        if cu == cv:
+            return
+        if self._reaches(cv, cu):
+            self._merge(cu, cv)
+        else:
+            self._link(cu, cv)
+            self._expand(cu, self._low[cv], self._high[cv])
+
+    def remove_edge(self, u, v):
+        if v not in self._succ.get(u, ()):
+            return
+        self._succ[u].discard(v)
+        self._pred[v].discard(u)
+        cu, cv = self.component[u], self.component[v]
+        if cu != cv:
+            self._unlink(cu, cv)
+        else:
+            self._split(cu)
+
+    def remove_node(self, node):
+        if node not in self._succ:
+            return
+        for v in list(self._succ[node]):
+            self.remove_edge(node, v)
+        for u in list(self._pred[node]):
+            self.remove_edge(u, node)
+        c = self.component.pop(node)
+        for table in (self.members, self._dag_succ, self._dag_pred, self._low, self._high):
+            del table[c]
+        del self._succ[node]
+        del self._pred[node]
+
+    def _add_vertex(self, node):
+        if node not in self._succ:
+            self._succ[node] = set()
+            self._pred[node] = set()
+
+    def _new_component(self, members):
+        c = self._next_id
+        self._next_id += 1
+        self.members[c] = members
+        self._dag_succ[c] = {}
+        self._dag_pred[c] = {}
+        for node in members:
+            self.component[node] = c
+        return c
+
+    def _link(self, a, b, count=1):
+        self._dag_succ[a][b] = self._dag_succ[a].get(b, 0) + count
+        self._dag_pred[b][a] = self._dag_pred[b].get(a, 0) + count
+
+    def _unlink(self, a, b):
+        if self._dag_succ[a][b] == 1:
+            del self._dag_succ[a][b]
+            del self._dag_pred[b][a]
+        else:
+            self._dag_succ[a][b] -= 1
+            self._dag_pred[b][a] -= 1
+
+    def _may_reach(self, a, b):
+        return self._low[a] <= self._low[b] and self._high[b] <= self._high[a]
+
+    def _reaches(self, a, b):
+        if a == b:
+            return True
+        if not self._may_reach(a, b):
+            return False
+        seen = {a}
+        stack = [a]
+        while stack:
+            for c in self._dag_succ[stack.pop()]:
+                if c == b:
+                    return True
+                if c not in seen and self._may_reach(c, b):
+                    seen.add(c)
+                    stack.append(c)
+        return False
+
+    def _expand(self, c, low, high):
+        """Widen c's interval and its ancestors' to cover [low, high]"""
+        stack = [c]
+        while stack:
+            c = stack.pop()
+            if self._low[c] <= low and high <= self._high[c]:
+                continue
+            self._low[c] = min(self._low[c], low)
+            self._high[c] = max(self._high[c], high)
+            stack.extend(self._dag_pred[c])
+
+    def _merge(self, cu, cv):
+        """Merge every component on a path cv -> ... -> cu after an edge cu -> cv
+        closed a cycle"""
+        forward = {cv}
+        stack = [cv]
+        while stack:
+            for c in self._dag_succ[stack.pop()]:
+                if c not in forward and self._may_reach(c, cu):
+                    forward.add(c)
+                    stack.append(c)
+        cycle = {cu}
+        stack = [cu]
+        while stack:
+            for c in self._dag_pred[stack.pop()]:
+                if c in forward and c not in cycle:
+                    cycle.add(c)
+                    stack.append(c)
+
+        low = min(self._low[c] for c in cycle)
+        high = max(self._high[c] for c in cycle)
+        old_succ = [(c, d, count) for c in cycle for d, count in self._dag_succ[c].items()]
+        old_pred = [(d, c, count) for c in cycle for d, count in self._dag_pred[c].items()]
+        members = set()
+        for c in cycle:
+            members |= self.members.pop(c)
+            for d in self._dag_succ.pop(c):
+                if d not in cycle:
+                    del self._dag_pred[d][c]
+            for d in self._dag_pred.pop(c):
+                if d not in cycle:
+                    del self._dag_succ[d][c]
+            del self._low[c], self._high[c]
+        merged = self._new_component(members)
+        self._low[merged], self._high[merged] = low, high
+        for c, d, count in old_succ:
+            if d not in cycle:
+                self._link(merged, d, count)
+        for d, c, count in old_pred:
+            if d not in cycle:
+                self._link(d, merged, count)
+        for d in list(self._dag_pred[merged]):
+            self._expand(d, low, high)
+
+    def _split(self, c):
+        """Recompute the components inside c after one of its internal edges went away"""
+        members = self.members[c]
+        pieces = list(strongly_connected(
+            members, lambda node: [v for v in self._succ[node] if v in members]))
+        if len(pieces) == 1:
+            return
+        # A piece reaches no more than c did, so c's interval stays valid for each
+        low, high = self._low[c], self._high[c]
+        for d in self._dag_succ.pop(c):
+            del self._dag_pred[d][c]
+        for d in self._dag_pred.pop(c):
+            del self._dag_succ[d][c]
+        del self.members[c], self._low[c], self._high[c]
+        for piece in pieces:
+            p = self._new_component(piece)
+            self._low[p], self._high[p] = low, high
+        for u in members:
+            cu = self.component[u]
+            for v in self._succ[u]:
+                if self.component[v] != cu:
+                    self._link(cu, self.component[v])
+            for v in self._pred[u]:
+                if v not in members:
+                    self._link(self.component[v], cu)
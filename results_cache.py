@@ -0,0 +1,93 @@
+"""LRU cache of traversal results keyed by graph version"""
+from collections import OrderedDict
+import sys
+
+DEFAULT_MAX_ENTRIES = 64
+DEFAULT_MAX_BYTES = 64 << 20
+
+
+def approximate_size(value):
+    """Approximate the bytes held by nested lists, tuples, sets, dicts and the
+    attributes of objects such as results documents, counting each shared object once"""
+    seen = set()
+    total = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__"):
+            stack.append(vars(item))
+    return total
+
+
+class ResultsCache:
+    """Least-recently-used cache of results with an entry count and memory cap.
+
+    Keys are tuples ending in the graph version they were computed on, e.g.
+    (algorithm, start, goal, version); drop_older(version) discards results of
+    earlier versions once the graph changes. hits and misses count get() calls.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()  # key -> (value, size)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key):
+        """Return the cached value for key, or None, marking it most recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value):
+        """Store value under key (re-measuring it if already present), evicting the
+        least recently used entries beyond the caps; values larger than the memory
+        cap are not cached"""
+        self.discard(key)
+        size = approximate_size(value)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self.nbytes += size
+        while len(self._entries) > self.max_entries or self.nbytes > self.max_bytes:
+            old_key, (old_value, old_size) = self._entries.popitem(last=False)
+            self.nbytes -= old_size
+
+    def discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[1]
+
+    def drop_older(self, version):
+        """Discard every result computed on a graph version before version"""
+        for key in [key for key in self._entries if key[-1] < version]:
+            self.discard(key)
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def summary(self):
+        return (f"{self.hits} hits, {self.misses} misses, {len(self)} entries "
+                f"({self.nbytes / 1024:.1f} KB of {self.max_bytes / 1024:.0f} KB)")
@@ -0,0 +1,229 @@
+"""Results panels that format only the lines on screen, so paths of millions of
+nodes are never joined into one string or handed to Tk whole"""
+from bisect import bisect_right
+from itertools import islice
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
+
+# Path nodes shown per line; longer paths continue on the following lines
+NODES_PER_LINE = 10
+
+
+class PathDocument:
+    """The lines of a results panel. Text is stored as lines and paths as the node
+    sequences themselves, so a path line is only formatted when it is shown,
+    searched or exported. Documents are read-only once built; + makes a new one.
+    """
+
+    def __init__(self, text=""):
+        self.segments = []  # (text lines, None, "") or (None, nodes, prefix)
+        self.starts = []  # first line number of each segment
+        self.num_lines = 0
+        if text:
+            self.add_text(text)
+
+    def __len__(self):
+        return self.num_lines
+
+    def __add__(self, other):
+        document = PathDocument()
+        for lines, nodes, prefix in self.segments + other.segments:
+            document._add((lines, nodes, prefix))
+        return document
+
+    def _add(self, segment):
+        lines, nodes, prefix = segment
+        self.segments.append(segment)
+        self.starts.append(self.num_lines)
+        self.num_lines += len(lines) if lines is not None else max(1, -(-len(nodes) // NODES_PER_LINE))
+
+    def add_text(self, text):
+        """Append text; a trailing newline ends the last line rather than adding an empty one"""
+        lines = text.split("\n")
+        if lines[-1] == "":
+            lines.pop()
+        if lines:
+            self._add((lines, None, ""))
+
+    def add_path(self, nodes, prefix=""):
+        """Append a path as ' -> ' separated lines of NODES_PER_LINE nodes, the first
+        starting with prefix and the rest indented to match"""
+        self._add((None, nodes, prefix))
+
+    def _segment_lines(self, segment, first=0):
+        lines, nodes, prefix = segment
+        if lines is not None:
+            yield from islice(lines, first, None)
+            return
+        indent = " " * len(prefix)
+        last = max(1, -(-len(nodes) // NODES_PER_LINE)) - 1
+        for i in range(first, last + 1):
+            chunk = " -> ".join(str(node) for node in nodes[i * NODES_PER_LINE:(i + 1) * NODES_PER_LINE])
+            yield (prefix if i == 0 else indent) + chunk + (" ->" if i < last else "")
+
+    def iter_lines(self, start=0):
+        """Yield the formatted lines from line start on, one at a time"""
+        i = max(0, bisect_right(self.starts, start) - 1)
+        for segment, segment_start in zip(self.segments[i:], self.starts[i:]):
+            yield from self._segment_lines(segment, max(0, start - segment_start))
+
+    def lines(self, start, stop):
+        return list(islice(self.iter_lines(start), max(0, stop - start)))
+
+    def text(self):
+        return "".join(line + "\n" for line in self.iter_lines())
+
+    def find(self, query, start=0, exact=False):
+        """Return (line, position) of the first match at or after line start, wrapping
+        around to the top, or None. Path nodes match when their label contains query
+        (equals it with exact=True) and position is the node's index in its path;
+        text lines only match without exact, with position None."""
+        first = None
+        for segment, segment_start in zip(self.segments, self.starts):
+            lines, nodes, prefix = segment
+            if lines is not None:
+                if exact:
+                    continue
+                matches = ((segment_start + i, None) for i, line in enumerate(lines) if query in line)
+            elif exact:
+                matches = ((segment_start + i // NODES_PER_LINE, i)
+                           for i, node in enumerate(nodes) if str(node) == query)
+            else:
+                matches = ((segment_start + i // NODES_PER_LINE, i)
+                           for i, node in enumerate(nodes) if query in str(node))
+            for match in matches:
+                if match[0] >= start:
+                    return match
+                if first is None:
+                    first = match
+        return first
+
+    def write(self, f):
+        """Write the document to a text file line by line"""
+        for line in self.iter_lines():
+            f.write(line + "\n")
+
+
+class ResultsView(ttk.Frame):
+    """Scrollable, searchable panel showing a PathDocument. Only the lines inside
+    the window are inserted into the Text widget; scrolling replaces them."""
+
+    def __init__(self, master, height=15, width=40):
+        super().__init__(master)
+        self.document = PathDocument()
+        self.top = 0
+        self.rows = height
+        self.match = None  # line of the last search hit, highlighted while in view
+
+        toolbar = ttk.Frame(self)
+        toolbar.pack(fill=tk.X)
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(toolbar, textvariable=self.search_var, width=12)
+        search_entry.pack(side=tk.LEFT, padx=2)
+        search_entry.bind('<Return>', lambda event: self.search())
+        ttk.Button(toolbar, text="Find", command=self.search).pack(side=tk.LEFT, padx=2)
+        ttk.Button(toolbar, text="Jump to Node", command=lambda: self.search(exact=True)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(toolbar, text="Export...", command=self.export).pack(side=tk.LEFT, padx=2)
+        self.status_var = tk.StringVar()
+        ttk.Label(toolbar, textvariable=self.status_var).pack(side=tk.LEFT, padx=5)
+
+        body = ttk.Frame(self)
+        body.pack(fill=tk.BOTH, expand=True)
+        body.rowconfigure(0, weight=1)
+        body.columnconfigure(0, weight=1)
+        self.text = tk.Text(body, height=height, width=width, wrap=tk.NONE, state=tk.DISABLED)
+        self.text.grid(row=0, column=0, sticky='nsew')
+        self.scrollbar = ttk.Scrollbar(body, orient=tk.VERTICAL, command=self.yview)
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+        x_scrollbar = ttk.Scrollbar(body, orient=tk.HORIZONTAL, command=self.text.xview)
+        x_scrollbar.grid(row=1, column=0, sticky='ew')
+        self.text.configure(xscrollcommand=x_scrollbar.set)
+        self.text.tag_configure('match', background='yellow')
+        self.line_height = tkfont.Font(font=self.text.cget('font')).metrics('linespace')
+
+        self.text.bind('<Configure>', self.on_resize)
+        self.text.bind('<MouseWheel>', lambda event: self.scroll_by(-3 if event.delta > 0 else 3))
+        self.text.bind('<Button-4>', lambda event: self.scroll_by(-3))
+        self.text.bind('<Button-5>', lambda event: self.scroll_by(3))
+        self.text.bind('<Prior>', lambda event: self.scroll_by(-self.rows))
+        self.text.bind('<Next>', lambda event: self.scroll_by(self.rows))
+
+    def show(self, document):
+        self.document = document
+        self.top = 0
+        self.match = None
+        self.status_var.set(f"{len(document)} lines" if len(document) > self.rows else "")
+        self.render()
+
+    def clear(self):
+        self.show(PathDocument())
+
+    def on_resize(self, event):
+        rows = max(1, event.height // self.line_height)
+        if rows != self.rows:
+            self.rows = rows
+            self.scroll_to(self.top)
+
+    def yview(self, *args):
+        """Scrollbar callback: ('moveto', fraction) or ('scroll', n, 'units' | 'pages')"""
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * len(self.document)))
+        elif args[0] == 'scroll':
+            self.scroll_to(self.top + int(args[1]) * (self.rows if args[2] == 'pages' else 1))
+
+    def scroll_to(self, top):
+        self.top = max(0, min(top, len(self.document) - self.rows))
+        self.render()
+
+    def scroll_by(self, lines):
+        """Event handler scrolling the document; 'break' keeps Text from scrolling its window"""
+        self.scroll_to(self.top + lines)
+        return "break"
+
+    def render(self):
+        """Put the lines in the window into the Text widget and update the scrollbar"""
+        text = self.text
+        text.configure(state=tk.NORMAL)
+        text.delete('1.0', tk.END)
+        text.insert('1.0', "\n".join(self.document.lines(self.top, self.top + self.rows)))
+        if self.match is not None and self.top <= self.match < self.top + self.rows:
+            row = self.match - self.top + 1
+            text.tag_add('match', f"{row}.0", f"{row}.end")
+        text.configure(state=tk.DISABLED)
+        total = max(len(self.document), 1)
+        self.scrollbar.set(self.top / total, min(1.0, (self.top + self.rows) / total))
+
+    def search(self, exact=False):
+        """Scroll to the next line containing the search text, or with exact=True to
+        the next path position of the node named by it"""
+        query = self.search_var.get().strip()
+        if not query:
+            return
+        start = self.match + 1 if self.match is not None else self.top
+        hit = self.document.find(query, start, exact)
+        if hit is None:
+            self.match = None
+            self.status_var.set(f"'{query}' not found")
+            self.render()
+            return
+        self.match, position = hit
+        if position is None:
+            self.status_var.set(f"Line {self.match + 1} of {len(self.document)}")
+        else:
+            self.status_var.set(f"{'Node' if exact else 'Match'} at path position {position + 1}")
+        self.scroll_to(self.match - self.rows // 3)
+
+    def export(self):
+        """Save the whole document to a text file, writing it a line at a time"""
+        path = filedialog.asksaveasfilename(title="Export Results", defaultextension=".txt",
+                                            filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            with open(path, "w") as f:
+                self.document.write(f)
+        except OSError as exc:
+            messagebox.showerror("Error", str(exc))
+            return
+        self.status_var.set(f"Exported {len(self.document)} lines")
@@ -0,0 +1,33 @@
+import pytest
+import graph_io
+
+
+def test_has_header_detects_text_over_numeric_edges(tmp_path):
+    path = tmp_path / "edges.csv"
+    path.write_text("source,target\n1,2\n2,3\n")
+    assert graph_io.has_header(path)
+
+
+def test_has_header_keeps_ordinary_first_edge(tmp_path):
+    numeric = tmp_path / "numeric.txt"
+    numeric.write_text("10 11\n1 2\n2 3\n3 4\n")
+    text = tmp_path / "text.csv"
+    text.write_text("A,B\nC,D\nE,F\n")
+    assert not graph_io.has_header(numeric)
+    assert not graph_io.has_header(text)
+    assert graph_io.load_edge_list(text, skip_header=graph_io.has_header(text)).num_edges == 3
+
+
+def test_ragged_lines_are_rejected_not_shifted(tmp_path):
+    path = tmp_path / "ragged.txt"
+    path.write_text("A B\nC D 5\nE\n")
+    with pytest.raises(ValueError, match="Invalid edge line"):
+        graph_io.load_edge_list(path)
+
+
+def test_extra_columns_are_ignored(tmp_path):
+    path = tmp_path / "weighted.csv"
+    path.write_text("A,B,1\nB,C\n")
+    graph = graph_io.load_edge_list(path)
+    assert graph.num_edges == 2
+    assert list(graph.labels) == ["A", "B", "C"]
@@ -0,0 +1,80 @@
+import pickle
+from array import array
+import pytest
+import graph_generators
+import graph_snapshot
+import informed_search
+from reachability import ReachabilityIndex
+from traversal_engine import CSRGraph
+
+
+def test_pickled_snapshot_keeps_attached_indexes(tmp_path):
+    path = str(tmp_path / "grid.csrg")
+    graph_snapshot.save_snapshot(graph_generators.grid_graph(5, 5), path)
+    graph = graph_snapshot.load_snapshot(path)
+    graph.weights = array('d', [2.0]) * graph.num_edges
+    graph.reachability = ReachabilityIndex.from_csr(graph)
+    informed_search.landmarks(graph)
+    copy = pickle.loads(pickle.dumps(graph))
+    assert isinstance(copy, graph_snapshot.MappedCSRGraph)
+    assert list(copy.weights) == list(graph.weights)
+    assert copy.reachability.reachable(0, 24)
+    assert copy.landmarks.landmarks == graph.landmarks.landmarks
+
+
+def round_trip(tmp_path, graph, verify=True):
+    path = str(tmp_path / "graph.csrg")
+    graph_snapshot.save_snapshot(graph, path)
+    return path, graph_snapshot.load_snapshot(path, verify=verify)
+
+
+def same_graph(a, b):
+    return (list(a.labels) == list(b.labels) and list(a.offsets) == list(b.offsets)
+            and list(a.targets) == list(b.targets))
+
+
+def test_round_trip_with_str_labels(tmp_path):
+    graph = CSRGraph.from_edges(["a", "b", "ü"], [("a", "b"), ("b", "ü"), ("ü", "a")])
+    path, loaded = round_trip(tmp_path, graph)
+    assert same_graph(graph, loaded)
+    assert loaded.node_id("ü") == 2
+
+
+def test_round_trip_with_int_labels(tmp_path):
+    graph = graph_generators.grid_graph(4, 4)
+    path, loaded = round_trip(tmp_path, graph)
+    assert same_graph(graph, loaded)
+    assert all(type(label) is int for label in loaded.labels)
+
+
+def test_snapshots_store_structure_not_weights(tmp_path):
+    # Snapshots store the structure; weights are attached to the loaded graph
+    graph = graph_generators.chain_graph(4)
+    graph.weights = array('d', [1.5, 2.5, 3.5])
+    path, loaded = round_trip(tmp_path, graph)
+    assert same_graph(graph, loaded)
+    assert loaded.weights is None
+
+
+def test_verify_detects_corrupt_payload_only_when_asked(tmp_path):
+    path, loaded = round_trip(tmp_path, graph_generators.chain_graph(50))
+    data = bytearray(open(path, 'rb').read())
+    data[-8] ^= 1  # a byte of the label table
+    with open(path, 'wb') as f:
+        f.write(data)
+    graph_snapshot.load_snapshot(path, verify=False)  # header-only check passes
+    with pytest.raises(ValueError, match="checksum"):
+        graph_snapshot.load_snapshot(path, verify=True)
+
+
+def test_rejects_files_that_are_not_snapshots(tmp_path):
+    path, loaded = round_trip(tmp_path, graph_generators.chain_graph(5))
+    data = bytearray(open(path, 'rb').read())
+    with open(path, 'wb') as f:
+        f.write(data[:-4])
+    with pytest.raises(ValueError, match="truncated"):
+        graph_snapshot.load_snapshot(path, verify=False)
+    other = tmp_path / "edges.txt"
+    other.write_text("a b\n" * 20)
+    with pytest.raises(ValueError, match="Not a graph snapshot"):
+        graph_snapshot.load_snapshot(str(other))
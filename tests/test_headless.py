@@ -0,0 +1,20 @@
+import io
+import json
+import headless
+
+
+def test_malformed_fields_fail_only_their_own_line(tmp_path):
+    graph = tmp_path / "edges.txt"
+    graph.write_text("A B\nB C\n")
+    queries = io.StringIO("\n".join([
+        '{"algorithm": "DFS", "mode": "Depth-limited", "start": "A", "max_depth": "x"}',
+        '{"start": ["A"]}',
+        '{"start": "A", "mode": {"m": 1}}',
+        '{"start": "A", "goal": "C"}',
+    ]))
+    output = io.StringIO()
+    failures = headless.run(queries, output, str(graph))
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert failures == 3
+    assert all("error" in result for result in results[:3])
+    assert results[3]["goal_path"] == ["A", "B", "C"]
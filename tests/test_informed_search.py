@@ -0,0 +1,62 @@
+import heapq
+import math
+import random
+from array import array
+import graph_generators
+import informed_search
+
+
+def shortest_costs(graph, source):
+    """Reference Dijkstra over the CSR arrays"""
+    costs = {source: 0}
+    heap = [(0, source)]
+    while heap:
+        cost, u = heapq.heappop(heap)
+        if cost > costs[u]:
+            continue
+        for i in range(graph.offsets[u], graph.offsets[u + 1]):
+            v = graph.targets[i]
+            new_cost = cost + (graph.weights[i] if graph.weights is not None else 1)
+            if new_cost < costs.get(v, math.inf):
+                costs[v] = new_cost
+                heapq.heappush(heap, (new_cost, v))
+    return costs
+
+
+def path_cost(graph, path):
+    total = 0
+    for u, v in zip(path, path[1:]):
+        edges = range(graph.offsets[u], graph.offsets[u + 1])
+        total += min(graph.weights[i] if graph.weights is not None else 1
+                     for i in edges if graph.targets[i] == v)
+    return total
+
+
+def check_graph(graph, rng):
+    """A* with ALT finds shortest paths, and the landmark bound never exceeds the
+    true cost to the goal"""
+    from_node = [shortest_costs(graph, v) for v in range(len(graph))]
+    for goal in rng.sample(range(len(graph)), 10):
+        h = informed_search.landmarks(graph).lower_bound(goal)
+        for v in range(len(graph)):
+            assert h(v) <= from_node[v].get(goal, math.inf) + 1e-9
+        for source in rng.sample(range(len(graph)), 5):
+            path, stats = informed_search.a_star_search(graph, source, goal=goal)
+            cost = from_node[source].get(goal)
+            if cost is None:
+                assert stats["goal_path"] == []
+            else:
+                assert math.isclose(stats["path_cost"], cost)
+                assert math.isclose(path_cost(graph, stats["goal_path"]), cost)
+
+
+def test_a_star_with_landmarks_finds_shortest_paths_unweighted():
+    rng = random.Random(3)
+    check_graph(graph_generators.gnp_graph(60, 0.05, seed=3), rng)
+
+
+def test_a_star_with_landmarks_finds_shortest_paths_weighted():
+    rng = random.Random(5)
+    graph = graph_generators.gnp_graph(60, 0.05, seed=5)
+    graph.weights = array('d', (rng.uniform(0.5, 10) for i in range(graph.num_edges)))
+    check_graph(graph, rng)
@@ -0,0 +1,8 @@
+from node_picker import NodeIndex
+
+
+def test_matches_lists_prefix_matches_in_order_up_to_limit():
+    index = NodeIndex(str(i) for i in range(1000))
+    assert index.matches("99") == ["99", "990", "991", "992", "993", "994", "995", "996", "997", "998", "999"]
+    assert index.matches("1", limit=3) == ["1", "10", "100"]
+    assert index.matches("z") == []
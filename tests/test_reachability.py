@@ -0,0 +1,51 @@
+import random
+from reachability import ReachabilityIndex
+
+
+def reachable_set(edges, start):
+    seen = {start}
+    frontier = [start]
+    while frontier:
+        u = frontier.pop()
+        for a, b in edges:
+            if a == u and b not in seen:
+                seen.add(b)
+                frontier.append(b)
+    return seen
+
+
+def test_incremental_updates_match_a_plain_search():
+    rng = random.Random(7)
+    for trial in range(20):
+        nodes = list(range(12))
+        edges = set()
+        index = ReachabilityIndex(nodes)
+        for step in range(60):
+            roll = rng.random()
+            if roll < 0.05:
+                node = rng.choice(nodes)
+                edges = {(u, v) for u, v in edges if node not in (u, v)}
+                index.remove_node(node)
+                index.add_node(node)
+            elif edges and roll < 0.4:
+                u, v = rng.choice(sorted(edges))
+                edges.discard((u, v))
+                index.remove_edge(u, v)
+            else:
+                u, v = rng.choice(nodes), rng.choice(nodes)
+                if (u, v) in edges:
+                    continue
+                edges.add((u, v))
+                index.add_edge(u, v)
+            for start in nodes:
+                expected = reachable_set(edges, start)
+                for goal in nodes:
+                    assert index.reachable(start, goal) == (goal in expected), (trial, step, start, goal)
+
+
+def test_removing_a_node_drops_its_edges():
+    index = ReachabilityIndex("abc", [("a", "b"), ("b", "c"), ("c", "a")])
+    index.remove_node("b")
+    assert not index.reachable("a", "c")
+    assert index.reachable("c", "a")
+    assert not index.reachable("a", "b")
@@ -0,0 +1,22 @@
+from results_cache import ResultsCache, approximate_size
+from results_view import PathDocument
+
+
+def test_documents_count_toward_the_memory_cap():
+    entry = {"key": 1, "results": [], "documents": {}}
+    cache = ResultsCache()
+    cache.put(1, entry)
+    before = cache.nbytes
+    document = PathDocument("x" * 10000 + "\n")
+    document.add_path(list(range(1000)))
+    entry["documents"]["BFS"] = document
+    cache.put(1, entry)
+    assert cache.nbytes - before > 10000
+    assert cache.nbytes == approximate_size(entry)
+
+
+def test_entries_with_oversized_documents_are_not_cached():
+    entry = {"key": 1, "results": [], "documents": {"BFS": PathDocument("x" * 5000)}}
+    cache = ResultsCache(max_bytes=4096)
+    cache.put(1, entry)
+    assert 1 not in cache
@@ -0,0 +1,40 @@
+import graph_generators
+import traversal_engine
+
+
+def test_iterative_deepening_stops_at_eccentricity_on_clique():
+    graph = graph_generators.clique_graph(60)
+    path, stats = traversal_engine.iterative_deepening_search(graph, 0)
+    assert stats["iterations"] == 2
+    assert stats["nodes_visited"] == 60
+
+
+def test_iterative_deepening_stops_at_eccentricity_on_grid():
+    graph = graph_generators.grid_graph(14, 14)
+    path, stats = traversal_engine.iterative_deepening_search(graph, 0)
+    assert stats["iterations"] == 27  # limits 0..26, the corner-to-corner distance
+    assert stats["nodes_visited"] == 196
+
+
+def test_iterative_deepening_unreachable_goal_stops():
+    graph = graph_generators.chain_graph(5)
+    path, stats = traversal_engine.iterative_deepening_search(graph, 4, goal=0)
+    assert stats["iterations"] == 1
+
+
+def star_with_cycle():
+    # 0 -> 1..100, plus the cycle 1 -> 2 -> ... -> 100 -> 1 among the leaves
+    edges = [(0, i) for i in range(1, 101)] + [(i, i % 100 + 1) for i in range(1, 101)]
+    return traversal_engine.CSRGraph.from_edges(range(101), edges)
+
+
+def test_dfs_counters_charge_stack_nodes_only_for_edges_they_scanned():
+    path, stats = traversal_engine.iterative_depth_first_search(star_with_cycle(), 0, goal=50, counters=True)
+    # 0 scans its edge to 1, then 1..49 each scan their cycle edge
+    assert stats["counters"]["edges_scanned"] == 50
+    assert "counters_estimated" not in stats
+
+
+def test_counters_of_other_modes_are_marked_estimated():
+    path, stats = traversal_engine.direction_optimizing_bfs(star_with_cycle(), 0, goal=50, counters=True)
+    assert stats["counters_estimated"] is True
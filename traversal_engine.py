@@ -0,0 +1,927 @@
+"""Headless BFS/DFS traversal engine over a compact CSR graph"""
+from array import array
+from collections import deque, namedtuple
+from functools import partial
+from itertools import accumulate, islice
+import importlib.util
+import operator
+import time
+import weakref
+
+# Searches report progress every PROGRESS_INTERVAL visited nodes
+PROGRESS_INTERVAL = 4096
+
+
+class TraversalCancelled(Exception):
+    """Raised from a progress callback to stop a running search"""
+
+
+class CSRGraph:
+    """Directed graph stored as compressed sparse rows over interned int node IDs.
+
+    Node labels are interned to ids 0..n-1 in insertion order. The successors of
+    node u are targets[offsets[u]:offsets[u + 1]], in the order the edges were added.
+    offsets and targets may be arrays or memoryviews (e.g. over a mapped snapshot);
+    labels may be any sequence, and the label -> id index is built on first use.
+    reachability may hold a ReachabilityIndex of the same graph; searches for a goal
+    it reports unreachable are then skipped. weights, if not None, is an array of
+    edge weights parallel to targets, and landmarks may hold the informed_search
+    LandmarkIndex of the graph; plain BFS/DFS ignore both.
+    """
+
+    def __init__(self, labels, offsets, targets, index=None):
+        self.labels = labels
+        self.offsets = offsets
+        self.targets = targets
+        self._index = index
+        self._reverse = None
+        self.reachability = None
+        self.weights = None
+        self.landmarks = None
+
+    @classmethod
+    def from_edges(cls, nodes, edges):
+        """Build a CSR graph from node labels and (u, v) label pairs"""
+        labels = []
+        index = {}
+
+        def intern(label):
+            node_id = index.get(label)
+            if node_id is None:
+                node_id = index[label] = len(labels)
+                labels.append(label)
+            return node_id
+
+        for node in nodes:
+            intern(node)
+        sources = array('i')
+        edge_targets = array('i')
+        for u, v in edges:
+            sources.append(intern(u))
+            edge_targets.append(intern(v))
+        offsets, targets = _counting_sort(len(labels), sources, edge_targets)
+        return cls(labels, offsets, targets)
+
+    @classmethod
+    def from_edge_chunks(cls, chunks, nodes=()):
+        """Build a CSR graph from chunks of flat [u1, v1, u2, v2, ...] label lists.
+
+        Labels are interned a chunk at a time with C-level dict and map calls, which
+        is much faster than from_edges for bulk loads.
+        """
+        builder = CSRBuilder(nodes)
+        for chunk in chunks:
+            builder.add(chunk)
+        return builder.build(cls)
+
+    @classmethod
+    def from_networkx(cls, graph, weight=None):
+        """Build a CSR graph from a networkx DiGraph, keeping its node and edge order.
+        With weight, the edges' weight attributes (default 1) become graph.weights,
+        provided at least one edge has that attribute."""
+        csr = cls.from_edges(graph.nodes(), graph.edges())
+        if weight is not None and any(weight in data for u, v, data in graph.edges(data=True)):
+            # DiGraph.edges() runs source by source in node order, which is the CSR edge order
+            csr.weights = array('d', (w for u, v, w in graph.edges(data=weight, default=1)))
+        return csr
+
+    def __getstate__(self):
+        # The label index is rebuilt on unpickling rather than shipped to workers
+        return self.labels, self.offsets, self.targets, self.reachability, self.weights, self.landmarks
+
+    def __setstate__(self, state):
+        labels, offsets, targets, reachability, weights, landmarks = state
+        self.__init__(labels, offsets, targets)
+        self.reachability = reachability
+        self.weights = weights
+        self.landmarks = landmarks
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = {label: i for i, label in enumerate(self.labels)}
+        return self._index
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.index
+
+    @property
+    def num_edges(self):
+        return len(self.targets)
+
+    def node_id(self, label):
+        return self.index[label]
+
+    def successors(self, node_id):
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def edge_chunks(self, chunk_edges=1 << 16, progress=None):
+        """Yield the edges as flat [u1, v1, u2, v2, ...] label lists of about
+        chunk_edges edges, calling progress(edges_done, num_edges) after each"""
+        labels, offsets, targets = self.labels, self.offsets, self.targets
+        flat = []
+        for u in range(len(self)):
+            label = labels[u]
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                flat.append(label)
+                flat.append(labels[v])
+            if len(flat) >= 2 * chunk_edges:
+                yield flat
+                flat = []
+                if progress is not None:
+                    progress(offsets[u + 1], self.num_edges)
+        if flat:
+            yield flat
+        if progress is not None:
+            progress(self.num_edges, self.num_edges)
+
+    def reverse_csr(self):
+        """Return (in_offsets, in_sources), the predecessor lists in CSR form"""
+        if self._reverse is None:
+            offsets = self.offsets
+            sources = array('i')
+            for u in range(len(self)):
+                sources.extend(array('i', [u]) * (offsets[u + 1] - offsets[u]))
+            self._reverse = _counting_sort(len(self), self.targets, sources)
+        return self._reverse
+
+    def predecessors(self, node_id):
+        in_offsets, in_sources = self.reverse_csr()
+        return in_sources[in_offsets[node_id]:in_offsets[node_id + 1]]
+
+
+class CSRBuilder:
+    """Interns edge chunks one at a time for callers that consume the chunks
+    themselves, then builds the CSRGraph; see CSRGraph.from_edge_chunks"""
+
+    def __init__(self, nodes=()):
+        self.index = {}
+        self.sources = array('i')
+        self.targets = array('i')
+        self.add_nodes(nodes)
+
+    def add_nodes(self, nodes):
+        """Intern node labels, e.g. isolated nodes no edge mentions"""
+        _intern_all(self.index, nodes)
+
+    def add(self, chunk):
+        """Add a flat [u1, v1, u2, v2, ...] label list"""
+        _intern_all(self.index, chunk)
+        ids = array('i', map(self.index.__getitem__, chunk))
+        self.sources.extend(ids[0::2])
+        self.targets.extend(ids[1::2])
+
+    def build(self, cls=CSRGraph):
+        offsets, targets = _counting_sort(len(self.index), self.sources, self.targets)
+        return cls(list(self.index), offsets, targets, self.index)
+
+
+def _intern_all(index, labels):
+    """Give every label not yet in index the next free id, in first-seen order"""
+    new_labels = [label for label in dict.fromkeys(labels) if label not in index]
+    index.update(zip(new_labels, range(len(index), len(index) + len(new_labels))))
+
+
+def _counting_sort(n, sources, edge_targets):
+    """Group edges by source into CSR offsets/targets, stable within each source"""
+    offsets = array('q', bytes(8 * (n + 1)))
+    for u in sources:
+        offsets[u + 1] += 1
+    offsets = array('q', accumulate(offsets))
+    if all(map(operator.le, sources, islice(sources, 1, None))):
+        # Already grouped by source, as edge-list files usually are
+        return offsets, array('i', edge_targets)
+    fill = array('q', offsets[:n])
+    targets = array('i', bytes(4 * len(edge_targets)))
+    for u, v in zip(sources, edge_targets):
+        targets[fill[u]] = v
+        fill[u] += 1
+    return offsets, targets
+
+
+def _goal_path(graph, parent, start_id, goal_id):
+    """Walk parent links back from goal to start and return the labels in order"""
+    path = [goal_id]
+    while path[-1] != start_id:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return [graph.labels[i] for i in path]
+
+
+def skip_unreachable(algorithm, graph, start, goal):
+    """Return the (path, stats) of a skipped search when graph.reachability shows the
+    goal cannot be reached from start, else None"""
+    if goal is None or graph.reachability is None:
+        return None
+    start_ns = time.perf_counter_ns()
+    if graph.reachability.reachable(start, goal):
+        return None
+    return [], {
+        "algorithm": algorithm,
+        "traversal_path": [],
+        "goal_path": [],
+        "nodes_visited": 0,
+        "execution_time": (time.perf_counter_ns() - start_ns) / 1e6,  # in milliseconds
+        "path_length": 0,
+        "unreachable": True
+    }
+
+
+# Searches whose counters search_counters reproduces exactly; for every other
+# mode they are estimates and stats get "counters_estimated": True
+EXACT_COUNTERS = ("BFS", "Iterative DFS")
+
+
+def search_counters(graph, order, parent, found, depth_first=False):
+    """Count what a finished search did from its visit order and parent array.
+
+    Derived afterwards so the search loops carry no counting code: every visited
+    node but a found goal was expanded, scanning its out-edges (with depth_first,
+    the nodes left on the stack by a found goal only up to the edge to their path
+    child); redundant_edges are the scanned edges that led to an already
+    discovered node. frontier_peak is the largest queue (or, with depth_first,
+    stack) the search held, replayed from the parent links. This is exact for
+    plain BFS and DFS (EXACT_COUNTERS). Other modes are counted as if they were
+    one of those: levels that scan predecessors (bidirectional, bottom-up), stop
+    at discovery or re-enter nodes are not reproduced.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    expanded = len(order) - 1 if found else len(order)
+    edges_scanned = sum(offsets[u + 1] - offsets[u] for u in islice(order, expanded))
+    if depth_first and found:
+        # Each node on the final stack stopped at the first edge to its path child
+        v = order[-1]
+        while parent[v] != v:
+            u = parent[v]
+            end = offsets[u + 1]
+            edges_scanned -= end - (_first_edge(targets, offsets[u], end, v) + 1)
+            v = u
+    discovered = len(parent) - parent.count(-1)
+    depth = array('i', [-1]) * len(parent)
+    position = array('i', [-1]) * len(parent)
+    depth[order[0]] = 0
+    for i, u in enumerate(order):
+        position[u] = i
+        chain = []
+        while depth[u] < 0 and parent[u] >= 0:
+            chain.append(u)
+            u = parent[u]
+        if depth[u] >= 0:  # else not linked to the start, like a bidirectional backward half
+            for v in reversed(chain):
+                depth[v] = depth[parent[v]] + 1
+    max_depth = max(depth)
+    if depth_first:
+        frontier_peak = max_depth + 1
+    else:
+        # Replay the queue: expanding order[i] pops it and pushes the nodes it discovered
+        children = array('i', bytes(4 * len(order)))
+        for v, u in enumerate(parent):
+            if u >= 0 and u != v and position[u] >= 0:
+                children[position[u]] += 1
+        queue = frontier_peak = 1
+        for i in range(expanded):
+            queue += children[i] - 1
+            frontier_peak = max(frontier_peak, queue)
+    return {
+        "nodes_expanded": expanded,
+        "nodes_discovered": discovered,
+        "edges_scanned": edges_scanned,
+        "redundant_edges": max(0, edges_scanned - (discovered - 1)),
+        "frontier_peak": frontier_peak,
+        "max_depth": max_depth,
+    }
+
+
+def _first_edge(targets, begin, end, v):
+    """Index of the first edge to v in targets[begin:end]"""
+    for i in range(begin, end):
+        if targets[i] == v:
+            return i
+    return end - 1
+
+
+def _run(search, algorithm, graph, start, goal, progress=None, counters=False):
+    """Resolve labels, run a search over node ids and package path and stats.
+
+    progress, if given, is called as progress(nodes_visited, frontier_size) while
+    the search runs and may raise TraversalCancelled to abort it.
+
+    Only wall time is measured here; memory is profiled in a separate pass by
+    benchmark.measure_memory so tracing overhead never lands in execution_time.
+    With counters=True stats also get "counters" (see search_counters, and
+    "counters_estimated" for modes outside EXACT_COUNTERS) and
+    "phases", the ms spent resolving labels, searching and packaging the result;
+    otherwise nothing is counted.
+    """
+    resolve_ns = time.perf_counter_ns()
+    if start not in graph:
+        return [], {"error": "Start node not in graph"}
+    skipped = skip_unreachable(algorithm, graph, start, goal)
+    if skipped is not None:
+        return skipped
+    start_id = graph.index[start]
+    goal_id = graph.index.get(goal, -1) if goal is not None else -1
+
+    start_ns = time.perf_counter_ns()
+    order, parent, found, *extra = search(graph, start_id, goal_id, progress)
+    elapsed_ns = time.perf_counter_ns() - start_ns
+
+    path = [graph.labels[i] for i in order]
+    goal_path = _goal_path(graph, parent, start_id, goal_id) if found else []
+    stats = {
+        "algorithm": algorithm,
+        "traversal_path": path,
+        "goal_path": goal_path,
+        "nodes_visited": len(order),
+        "execution_time": elapsed_ns / 1e6,  # in milliseconds
+        "path_length": len(goal_path)
+    }
+    if extra:
+        stats.update(extra[0])
+    if counters:
+        stats["phases"] = {"resolve": (start_ns - resolve_ns) / 1e6, "search": elapsed_ns / 1e6,
+                           "package": (time.perf_counter_ns() - start_ns - elapsed_ns) / 1e6}
+        stats["counters"] = search_counters(graph, order, parent, found, "DFS" in algorithm)
+        if algorithm not in EXACT_COUNTERS:
+            stats["counters_estimated"] = True
+        if "frontier_peak" in stats:
+            # Searches over a priority queue track its peak themselves; a replay can't
+            stats["counters"]["frontier_peak"] = stats.pop("frontier_peak")
+    return path, stats
+
+
+def _bfs(graph, start_id, goal_id, progress=None):
+    offsets, targets = graph.offsets, graph.targets
+    discovered = bytearray(len(graph))
+    parent = array('i', [-1]) * len(graph)
+    discovered[start_id] = 1
+    parent[start_id] = start_id
+    queue = deque([start_id])
+    order = []
+
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        if progress is not None and len(order) % PROGRESS_INTERVAL == 0:
+            progress(len(order), len(queue))
+        if current == goal_id:
+            return order, parent, True
+        for neighbor in targets[offsets[current]:offsets[current + 1]]:
+            if not discovered[neighbor]:
+                discovered[neighbor] = 1
+                parent[neighbor] = current
+                queue.append(neighbor)
+    return order, parent, False
+
+
+def _dfs(graph, start_id, goal_id, progress=None):
+    # The stack holds the current path plus, per node, a cursor into its CSR
+    # successor range, so memory is bounded by the path depth rather than edges
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(len(graph))
+    parent = array('i', [-1]) * len(graph)
+    visited[start_id] = 1
+    parent[start_id] = start_id
+    order = [start_id]
+    if start_id == goal_id:
+        return order, parent, True
+    stack = [start_id]
+    cursors = [offsets[start_id]]
+
+    while stack:
+        current = stack[-1]
+        i, end = cursors[-1], offsets[current + 1]
+        while i < end and visited[targets[i]]:
+            i += 1
+        if i == end:
+            stack.pop()
+            cursors.pop()
+            continue
+        cursors[-1] = i + 1
+        neighbor = targets[i]
+        visited[neighbor] = 1
+        parent[neighbor] = current
+        order.append(neighbor)
+        if progress is not None and len(order) % PROGRESS_INTERVAL == 0:
+            progress(len(order), len(stack))
+        if neighbor == goal_id:
+            return order, parent, True
+        stack.append(neighbor)
+        cursors.append(offsets[neighbor])
+    return order, parent, False
+
+
+def _depth_limited(graph, start_id, goal_id, max_depth, progress=None):
+    # Like _dfs but nodes are remembered by the shallowest depth they were reached
+    # at, and re-entered when a shorter route appears so nothing within max_depth
+    # is missed. Also returns whether the limit cut the search off: some node whose
+    # shallowest depth is max_depth has a successor that was never reached.
+    offsets, targets = graph.offsets, graph.targets
+    depth_of = array('i', [-1]) * len(graph)
+    parent = array('i', [-1]) * len(graph)
+    depth_of[start_id] = 0
+    parent[start_id] = start_id
+    order = [start_id]
+    if start_id == goal_id:
+        return order, parent, True, False
+    stack = [start_id]
+    cursors = [offsets[start_id]]
+
+    while stack:
+        depth = len(stack) - 1
+        current = stack[-1]
+        i, end = cursors[-1], offsets[current + 1]
+        if depth >= max_depth:
+            stack.pop()
+            cursors.pop()
+            continue
+        next_depth = depth + 1
+        while i < end and 0 <= depth_of[targets[i]] <= next_depth:
+            i += 1
+        if i == end:
+            stack.pop()
+            cursors.pop()
+            continue
+        cursors[-1] = i + 1
+        neighbor = targets[i]
+        if depth_of[neighbor] < 0:
+            order.append(neighbor)
+            if progress is not None and len(order) % PROGRESS_INTERVAL == 0:
+                progress(len(order), len(stack))
+        depth_of[neighbor] = next_depth
+        parent[neighbor] = current
+        if neighbor == goal_id:
+            return order, parent, True, False
+        stack.append(neighbor)
+        cursors.append(offsets[neighbor])
+    # Decided after the pass: a node first entered at max_depth may have been
+    # re-entered at a shallower depth and had its successors explored since
+    cut_off = any(depth_of[u] == max_depth and
+                  any(depth_of[v] < 0 for v in targets[offsets[u]:offsets[u + 1]])
+                  for u in order)
+    return order, parent, False, cut_off
+
+
+def _iterative_deepening(graph, start_id, goal_id, progress=None, max_depth=None):
+    limit = 0
+    total_visits = 0
+    while True:
+        order, parent, found, cut_off = _depth_limited(graph, start_id, goal_id, limit, progress)
+        total_visits += len(order)
+        if found or not cut_off or (max_depth is not None and limit >= max_depth):
+            break
+        if progress is not None:
+            # Later iterations revisit known nodes without reporting, so report
+            # here too to keep the search cancellable
+            progress(len(order), 0)
+        limit += 1
+    return order, parent, found, {"depth_limit": limit, "iterations": limit + 1,
+                                  "total_visits": total_visits}
+
+
+DEFAULT_DEPTH_LIMIT = 10
+
+# Direction switching thresholds from Beamer et al., "Direction-Optimizing BFS"
+TOP_DOWN_ALPHA = 14
+BOTTOM_UP_BETA = 24
+
+
+def _direction_optimizing_bfs(graph, start_id, goal_id, progress=None):
+    n = len(graph)
+    offsets, targets = graph.offsets, graph.targets
+    in_offsets, in_sources = graph.reverse_csr()
+    visited = bytearray(n)
+    parent = array('i', [-1]) * n
+    visited[start_id] = 1
+    parent[start_id] = start_id
+    order = [start_id]
+    if start_id == goal_id:
+        return order, parent, True
+
+    frontier = [start_id]
+    frontier_edges = offsets[start_id + 1] - offsets[start_id]
+    unexplored_edges = graph.num_edges - frontier_edges
+    top_down = True
+
+    while frontier:
+        # Go bottom-up once the frontier touches a large share of the remaining
+        # edges, and back top-down when the frontier shrinks again
+        if top_down and frontier_edges > unexplored_edges / TOP_DOWN_ALPHA:
+            top_down = False
+        elif not top_down and len(frontier) < n / BOTTOM_UP_BETA:
+            top_down = True
+
+        next_frontier = []
+        if top_down:
+            for current in frontier:
+                for neighbor in targets[offsets[current]:offsets[current + 1]]:
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        parent[neighbor] = current
+                        next_frontier.append(neighbor)
+                        if neighbor == goal_id:
+                            order.extend(next_frontier)
+                            return order, parent, True
+        else:
+            in_frontier = bytearray(n)
+            for current in frontier:
+                in_frontier[current] = 1
+            for node, seen in enumerate(visited):
+                if seen:
+                    continue
+                for predecessor in in_sources[in_offsets[node]:in_offsets[node + 1]]:
+                    if in_frontier[predecessor]:
+                        visited[node] = 1
+                        parent[node] = predecessor
+                        next_frontier.append(node)
+                        if node == goal_id:
+                            order.extend(next_frontier)
+                            return order, parent, True
+                        break
+
+        frontier_edges = 0
+        for node in next_frontier:
+            frontier_edges += offsets[node + 1] - offsets[node]
+        unexplored_edges -= frontier_edges
+        order.extend(next_frontier)
+        frontier = next_frontier
+        if progress is not None:
+            progress(len(order), len(frontier))
+    return order, parent, False
+
+
+def _bidirectional_bfs(graph, start_id, goal_id, progress=None):
+    if goal_id < 0:
+        return _bfs(graph, start_id, goal_id, progress)
+    n = len(graph)
+    offsets, targets = graph.offsets, graph.targets
+    in_offsets, in_sources = graph.reverse_csr()
+    parent = array('i', [-1]) * n  # forward tree: next hop towards start
+    child = array('i', [-1]) * n  # backward tree: next hop towards goal
+    side = bytearray(n)  # bit 1: reached from start, bit 2: reached from goal
+    parent[start_id] = start_id
+    side[start_id] = 1
+    order = [start_id]
+    if start_id == goal_id:
+        return order, parent, True
+    child[goal_id] = goal_id
+    side[goal_id] = 2
+    order.append(goal_id)
+
+    forward, backward = [start_id], [goal_id]
+    meet = -1
+    while forward and backward and meet < 0:
+        next_frontier = []
+        # Expand whichever frontier is smaller by one full level
+        if len(forward) <= len(backward):
+            for current in forward:
+                for neighbor in targets[offsets[current]:offsets[current + 1]]:
+                    if side[neighbor] & 1:
+                        continue
+                    parent[neighbor] = current
+                    if side[neighbor] & 2:
+                        meet = neighbor
+                        break
+                    side[neighbor] = 1
+                    next_frontier.append(neighbor)
+                if meet >= 0:
+                    break
+            forward = next_frontier
+        else:
+            for current in backward:
+                for predecessor in in_sources[in_offsets[current]:in_offsets[current + 1]]:
+                    if side[predecessor] & 2:
+                        continue
+                    child[predecessor] = current
+                    if side[predecessor] & 1:
+                        meet = predecessor
+                        break
+                    side[predecessor] = 2
+                    next_frontier.append(predecessor)
+                if meet >= 0:
+                    break
+            backward = next_frontier
+        order.extend(next_frontier)
+        if progress is not None:
+            progress(len(order), len(forward) + len(backward))
+
+    if meet < 0:
+        return order, parent, False
+    # Splice the backward half onto the forward tree so the goal path follows parent links
+    node = meet
+    while node != goal_id:
+        parent[child[node]] = node
+        node = child[node]
+    return order, parent, True
+
+
+# SciPy adjacency matrices of the graphs vectorized_bfs has run on
+_matrices = weakref.WeakKeyDictionary()
+
+
+def adjacency_matrix(graph):
+    """Return the graph as a boolean SciPy CSR matrix, built once per graph"""
+    matrix = _matrices.get(graph)
+    if matrix is None:
+        import numpy as np
+        from scipy import sparse
+        n = len(graph)
+        index_type = np.int32 if graph.num_edges < 2 ** 31 else np.int64
+        indptr = np.array(graph.offsets, dtype=index_type)
+        indices = np.array(graph.targets, dtype=index_type)
+        data = np.ones(graph.num_edges, dtype=bool)
+        matrix = _matrices[graph] = sparse.csr_matrix((data, indices, indptr), shape=(n, n))
+    return matrix
+
+
+def _vectorized_bfs(graph, start_id, goal_id, progress=None):
+    import numpy as np
+    matrix = adjacency_matrix(graph)
+    visited = np.zeros(len(graph), dtype=bool)
+    parent = np.full(len(graph), -1, dtype=np.int64)
+    claim = np.full(len(graph), np.iinfo(np.int64).max)  # first scan position per node
+    visited[start_id] = True
+    parent[start_id] = start_id
+    levels = [np.array([start_id])]
+    visited_count = 1
+    found = start_id == goal_id
+
+    frontier = levels[0]
+    while frontier.size and not found:
+        # Successors of the whole frontier in one gather, in the order a sequential
+        # BFS would scan them, keeping only those not yet visited
+        rows = matrix[frontier]
+        sources = np.repeat(frontier, np.diff(rows.indptr))
+        fresh = ~visited[rows.indices]
+        targets, sources = rows.indices[fresh], sources[fresh]
+        # The first scan of each node discovers it: keep those, in discovery order.
+        # claim needs no reset, since every node claimed here is visited afterwards
+        position = np.arange(targets.size)
+        np.minimum.at(claim, targets, position)
+        first = position[claim[targets] == position]
+        frontier = targets[first]
+        visited[frontier] = True
+        parent[frontier] = sources[first]
+        if goal_id >= 0 and visited[goal_id]:
+            frontier = frontier[:np.flatnonzero(frontier == goal_id)[0] + 1]
+            found = True
+        levels.append(frontier)
+        visited_count += frontier.size
+        if progress is not None:
+            progress(visited_count, frontier.size)
+    return np.concatenate(levels).tolist(), parent.tolist(), found
+
+
+def breadth_first_search(graph, start, goal=None, progress=None, counters=False):
+    """Perform BFS on a CSRGraph and return path with statistics"""
+    return _run(_bfs, "BFS", graph, start, goal, progress, counters)
+
+
+def iterative_depth_first_search(graph, start, goal=None, progress=None, counters=False):
+    """Perform Iterative DFS on a CSRGraph and return path with statistics"""
+    return _run(_dfs, "Iterative DFS", graph, start, goal, progress, counters)
+
+
+def direction_optimizing_bfs(graph, start, goal=None, progress=None, counters=False):
+    """Perform level-synchronous BFS that switches between top-down and bottom-up
+    steps by frontier size, stopping as soon as the goal is discovered"""
+    return _run(_direction_optimizing_bfs, "BFS (direction-optimizing)", graph, start, goal,
+                progress, counters)
+
+
+def vectorized_bfs(graph, start, goal=None, progress=None, counters=False):
+    """Perform BFS that expands each frontier level with NumPy/SciPy sparse-matrix
+    operations; needs numpy and scipy, which are imported on first use"""
+    if importlib.util.find_spec("numpy") is None or importlib.util.find_spec("scipy") is None:
+        return [], {"error": "Vectorized BFS needs numpy and scipy installed"}
+    return _run(_vectorized_bfs, "BFS (vectorized)", graph, start, goal, progress, counters)
+
+
+def depth_limited_search(graph, start, goal=None, progress=None, max_depth=DEFAULT_DEPTH_LIMIT,
+                         counters=False):
+    """Perform DFS that never goes deeper than max_depth edges from start"""
+    def search(graph, start_id, goal_id, progress):
+        order, parent, found, cut_off = _depth_limited(graph, start_id, goal_id, max_depth, progress)
+        return order, parent, found, {"depth_limit": max_depth}
+    return _run(search, "Depth-limited DFS", graph, start, goal, progress, counters)
+
+
+def iterative_deepening_search(graph, start, goal=None, progress=None, max_depth=None,
+                               counters=False):
+    """Perform depth-limited DFS with limits 0, 1, 2, ... until the goal is found or
+    nothing is cut off; the path and stats are those of the final iteration"""
+    def search(graph, start_id, goal_id, progress):
+        return _iterative_deepening(graph, start_id, goal_id, progress, max_depth)
+    return _run(search, "Iterative deepening DFS", graph, start, goal, progress, counters)
+
+
+def bidirectional_bfs(graph, start, goal=None, progress=None, counters=False):
+    """Perform BFS forward from start over successors and backward from goal over
+    predecessors until the frontiers meet; without a goal this is a plain BFS"""
+    if goal is None or goal not in graph:
+        return breadth_first_search(graph, start, goal, progress, counters)
+    return _run(_bidirectional_bfs, "Bidirectional BFS", graph, start, goal, progress, counters)
+
+
+BFS_MODES = {
+    "Standard": breadth_first_search,
+    "Direction-optimizing": direction_optimizing_bfs,
+    "Bidirectional": bidirectional_bfs,
+    "Vectorized": vectorized_bfs,
+}
+
+DFS_MODES = {
+    "Standard": iterative_depth_first_search,
+    "Depth-limited": depth_limited_search,
+    "Iterative deepening": iterative_deepening_search,
+}
+
+
+# Event stream API: generators that yield TraversalEvents lazily, so consumers can
+# stream results or stop early. Abandoning the iterator abandons the search.
+DISCOVER = "discover"  # node enqueued (BFS) or pushed (DFS) by parent
+VISIT = "visit"  # node dequeued (BFS) or entered (DFS)
+GOAL_FOUND = "goal-found"
+
+TraversalEvent = namedtuple("TraversalEvent", "kind node parent depth")
+# Builds a TraversalEvent from a 4-tuple without namedtuple's Python-level __new__
+_event = partial(tuple.__new__, TraversalEvent)
+
+
+def bfs_events(graph, start, goal=None):
+    """Lazily yield BFS events; the goal is reported as soon as it is visited"""
+    if start not in graph:
+        return
+    labels, offsets, targets = graph.labels, graph.offsets, graph.targets
+    start_id = graph.index[start]
+    goal_id = graph.index.get(goal, -1) if goal is not None else -1
+    depth = array('i', [-1]) * len(graph)
+    depth[start_id] = 0
+    queue = deque([start_id])
+    yield _event((DISCOVER, start, None, 0))
+
+    while queue:
+        current = queue.popleft()
+        label = labels[current]
+        yield _event((VISIT, label, None, depth[current]))
+        if current == goal_id:
+            yield _event((GOAL_FOUND, label, None, depth[current]))
+            return
+        next_depth = depth[current] + 1
+        for neighbor in targets[offsets[current]:offsets[current + 1]]:
+            if depth[neighbor] < 0:
+                depth[neighbor] = next_depth
+                queue.append(neighbor)
+                yield _event((DISCOVER, labels[neighbor], label, next_depth))
+
+
+def dfs_events(graph, start, goal=None):
+    """Lazily yield iterator-stack DFS events; each push is a discover and a visit"""
+    if start not in graph:
+        return
+    labels, offsets, targets = graph.labels, graph.offsets, graph.targets
+    start_id = graph.index[start]
+    goal_id = graph.index.get(goal, -1) if goal is not None else -1
+    visited = bytearray(len(graph))
+    visited[start_id] = 1
+    yield _event((DISCOVER, start, None, 0))
+    yield _event((VISIT, start, None, 0))
+    if start_id == goal_id:
+        yield _event((GOAL_FOUND, start, None, 0))
+        return
+    stack = [start_id]
+    cursors = [offsets[start_id]]
+
+    while stack:
+        current = stack[-1]
+        i, end = cursors[-1], offsets[current + 1]
+        while i < end and visited[targets[i]]:
+            i += 1
+        if i == end:
+            stack.pop()
+            cursors.pop()
+            continue
+        cursors[-1] = i + 1
+        neighbor = targets[i]
+        visited[neighbor] = 1
+        label, depth = labels[neighbor], len(stack)
+        yield _event((DISCOVER, label, labels[current], depth))
+        yield _event((VISIT, label, labels[current], depth))
+        if neighbor == goal_id:
+            yield _event((GOAL_FOUND, label, None, depth))
+            return
+        stack.append(neighbor)
+        cursors.append(offsets[neighbor])
+
+
+class EventCollector:
+    """Builds the usual path and stats dict incrementally from a stream of events"""
+
+    def __init__(self, algorithm, start, goal=None):
+        self.algorithm = algorithm
+        self.start = start
+        self.goal = goal
+        self.path = []
+        self.parent = {start: None}
+        self.found = False
+        self.max_frontier = 0
+        self.max_depth = 0
+        self._discovered = 0
+        self._start_ns = time.perf_counter_ns()
+
+    def add(self, event):
+        kind = event.kind
+        if kind == DISCOVER:
+            self._discovered += 1
+            if event.parent is not None:
+                self.parent[event.node] = event.parent
+        elif kind == VISIT:
+            self.path.append(event.node)
+            frontier = self._discovered - len(self.path)
+            if frontier > self.max_frontier:
+                self.max_frontier = frontier
+            if event.depth > self.max_depth:
+                self.max_depth = event.depth
+        elif kind == GOAL_FOUND:
+            self.found = True
+
+    @property
+    def frontier_size(self):
+        return self._discovered - len(self.path)
+
+    def counters(self, graph):
+        """Count what the streamed search did, like search_counters"""
+        index, offsets, targets = graph.index, graph.offsets, graph.targets
+        expanded = self.path[:-1] if self.found else self.path
+        edges_scanned = sum(offsets[u + 1] - offsets[u] for u in map(index.__getitem__, expanded))
+        if self.found and "DFS" in self.algorithm:
+            node = self.path[-1]
+            while self.parent[node] is not None:
+                u, v = index[self.parent[node]], index[node]
+                edges_scanned -= offsets[u + 1] - (_first_edge(targets, offsets[u], offsets[u + 1], v) + 1)
+                node = self.parent[node]
+        return {
+            "nodes_expanded": len(expanded),
+            "nodes_discovered": self._discovered,
+            "edges_scanned": edges_scanned,
+            "redundant_edges": max(0, edges_scanned - (self._discovered - 1)),
+            # A DFS stream discovers and visits together; its stack holds the path
+            "frontier_peak": self.max_depth + 1 if "DFS" in self.algorithm else self.max_frontier,
+            "max_depth": self.max_depth,
+        }
+
+    def result(self):
+        goal_path = []
+        if self.found:
+            node = self.goal
+            while node is not None:
+                goal_path.append(node)
+                node = self.parent[node]
+            goal_path.reverse()
+        stats = {
+            "algorithm": self.algorithm,
+            "traversal_path": self.path,
+            "goal_path": goal_path,
+            "nodes_visited": len(self.path),
+            "execution_time": (time.perf_counter_ns() - self._start_ns) / 1e6,  # in milliseconds
+            "path_length": len(goal_path)
+        }
+        return self.path, stats
+
+
+def traverse_events(events, algorithm, graph, start, goal=None, progress=None):
+    """Drive an event stream function to the end and return path with statistics"""
+    if start not in graph:
+        return [], {"error": "Start node not in graph"}
+    skipped = skip_unreachable(algorithm, graph, start, goal)
+    if skipped is not None:
+        return skipped
+    collector = EventCollector(algorithm, start, goal)
+    for event in events(graph, start, goal):
+        collector.add(event)
+        if (progress is not None and event.kind == VISIT
+                and len(collector.path) % PROGRESS_INTERVAL == 0):
+            progress(len(collector.path), collector.frontier_size)
+    return collector.result()
+
+
+def first_visits(graph, start, k, events=bfs_events):
+    """Return the first k nodes visited from start without exploring further"""
+    visits = (event.node for event in events(graph, start) if event.kind == VISIT)
+    return list(islice(visits, k))
+
+
+def is_reachable(graph, start, goal):
+    """Answer whether goal can be reached from start, from graph.reachability when
+    set, else by a BFS that stops as soon as the goal is found"""
+    if graph.reachability is not None and start in graph:
+        return graph.reachability.reachable(start, goal)
+    return any(event.kind == GOAL_FOUND for event in bfs_events(graph, start, goal))
+
+
+# Modes that have an event stream, keyed like BFS_MODES / DFS_MODES
+BFS_EVENT_STREAMS = {"Standard": bfs_events}
+DFS_EVENT_STREAMS = {"Standard": dfs_events}
@@ -0,0 +1,1273 @@
+"""Tk visualizer for BFS and DFS traversals; opened by BFSvsDFS.py, which imports
+this module only when the GUI is wanted"""
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+import networkx as nx
+import functools
+import queue
+import time
+import traversal_engine
+import graph_layout
+import graph_view
+import graph_io
+import graph_snapshot
+import informed_search
+from instrumentation import Instruments
+from reachability import ReachabilityIndex
+from results_cache import ResultsCache
+from animation import AnimationScheduler
+from node_picker import NodeIndex, NodePicker
+from results_view import PathDocument, ResultsView
+from traversal_worker import TraversalWorker
+import benchmark
+import batch_traversal
+
+class GraphTraversalGUI:
+    POLL_INTERVAL_MS = 50
+    PARALLEL_MODE = "Parallel"
+    MAX_DRAWN_NODES = 2000
+    VIEW_MODES = ("Auto", "Full", "Neighborhood", "Collapsed SCCs")
+    MIN_ZOOM, MAX_ZOOM = 0.1, 50.0
+    LABEL_MIN_SCALE = 20  # pixels per layout inch below which labels are left out
+    
+    def __init__(self, root):
+        self.root = root
+        self.root.title("BFS vs Iterative DFS Graph Traversal Visualizer")
+        self.root.geometry("1400x900")
+        
+        # Initialize graph and traversal data
+        self.graph = nx.DiGraph()
+        self.reachability = None  # built before the first search when enabled, then kept in step with edits
+        self.node_index = NodeIndex()  # sorted labels behind the start/goal pickers
+        self._csr = None
+        self._layout = None
+        self._node_items = None
+        self._node_colors = {}
+        self.view = None  # GraphView being drawn, rebuilt after edits
+        self._tiles = None
+        self.zoom = 1.0
+        self.pan = (0.0, 0.0)
+        self._drag = None
+        self._redraw_pending = False
+        self._parallel_bfs = None
+        self.bfs_path = []
+        self.dfs_path = []
+        self.bfs_stats = {}
+        self.dfs_stats = {}
+        self.bfs_bench = {}
+        self.dfs_bench = {}
+        self.extra_results = {}  # other algorithms shown beside BFS/DFS: name -> (stats, bench)
+        
+        # Finished runs are cached per graph version; mark_graph_changed bumps the version
+        self.graph_version = 0
+        self.results_cache = ResultsCache()
+        self.results_entry = None  # cache entry of the results on display
+        
+        # Search counters and render timings, recorded while "Instrument" is ticked
+        self.instruments = Instruments(enabled=False)
+        
+        # Animation control
+        self.animation_speed = 1.0
+        self.animation_current = None
+        self.animation_visited = set()
+        self.animation_visited_color = 'lightgreen'
+        
+        self.setup_ui()
+        self.animation = AnimationScheduler(self.root, self.render_animation_frame,
+                                            self.speed_var.get)
+        
+        # Traversals run on a background worker; results arrive via poll_worker
+        self.worker = TraversalWorker()
+        self.pending_action = None
+        self.pending_key = None
+        self.pending_results = []
+        self.pending_prepared = None  # called with the value a "Prepare" job built
+        self.prepared_value = None
+        self.batch_total = 0
+        self.batch_done = 0
+        self.batch_started = 0.0
+        self.streaming = False
+        self.polling = False
+        self.imported_graph = None
+        self.imported_csr = None
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+    def setup_ui(self):
+        # Main container
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Left panel for graph input and controls (increase width)
+        left_frame = ttk.LabelFrame(main_frame, text="Graph Input & Controls", padding=10)
+        left_frame.pack(side=tk.LEFT, fill=tk.Y, padx=(0, 5))
+        left_frame.config(width=450)  # Increased width
+        left_frame.pack_propagate(False)
+        
+        # Graph input section
+        graph_frame = ttk.LabelFrame(left_frame, text="Graph Definition", padding=5)
+        graph_frame.pack(fill=tk.X, pady=(0, 10))
+
+        # Node input
+        node_input_frame = ttk.Frame(graph_frame)
+        node_input_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(node_input_frame, text="Node:").pack(side=tk.LEFT)
+        self.node_entry = ttk.Entry(node_input_frame, width=15)
+        self.node_entry.pack(side=tk.LEFT, padx=2)
+        self.node_entry.pack(fill=tk.X, pady=2)
+        self.node_entry.insert(0, "A,B,C,D,E,F,G,H,I,J,K,L,M,N,O,P,Q,R,S,T,U,V,W,X,Y,Z")
+        ttk.Button(node_input_frame, text="Add Node", command=self.add_node).pack(side=tk.LEFT, padx=2)
+        ttk.Button(node_input_frame, text="Remove Node", command=self.remove_node).pack(side=tk.LEFT, padx=2)
+
+        # Edge input
+        edge_input_frame = ttk.Frame(graph_frame)
+        edge_input_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(edge_input_frame, text="Edge (A-B):").pack(side=tk.LEFT)
+        self.edge_entry = ttk.Entry(edge_input_frame, width=15)
+        self.edge_entry.pack(side=tk.LEFT, padx=2)
+        self.edge_entry.pack(fill=tk.X, pady=2)
+        self.edge_entry.insert(0, "A-B,B-C,C-D,D-E,E-F,E-P,F-G,P-G,G-H,G-X,H-I,H-Z,B-O,B-R,K-L,A-K,L-R,K-J,J-Q,J-S,J-Y,Q-T,Y-T,Y-W,W-A,T-M,T-U,U-N,N-V")
+        ttk.Button(edge_input_frame, text="Add Edge", command=self.add_edge).pack(side=tk.LEFT, padx=2)
+        ttk.Button(edge_input_frame, text="Remove Edge", command=self.remove_edge).pack(side=tk.LEFT, padx=2)
+
+        # Buttons to import edges from a file and to clear the graph
+        file_frame = ttk.Frame(graph_frame)
+        file_frame.pack(pady=5)
+        ttk.Button(file_frame, text="Import Edges...", command=self.import_edges).pack(side=tk.LEFT, padx=2)
+        ttk.Button(file_frame, text="Open Snapshot...", command=self.open_snapshot).pack(side=tk.LEFT, padx=2)
+        ttk.Button(file_frame, text="Save Snapshot...", command=self.save_snapshot).pack(side=tk.LEFT, padx=2)
+        self.verify_snapshot_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(file_frame, text="Verify on Open", variable=self.verify_snapshot_var).pack(side=tk.LEFT, padx=2)
+        ttk.Button(file_frame, text="Clear Graph", command=self.clear_graph).pack(side=tk.LEFT, padx=2)
+
+        # Traversal controls
+        control_frame = ttk.LabelFrame(left_frame, text="Traversal Controls", padding=5)
+        control_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(control_frame, text="Start Node:").pack(anchor=tk.W)
+        self.start_node_var = tk.StringVar()
+        self.start_node_combo = NodePicker(control_frame, self.node_index, self.start_node_var, width=15)
+        self.start_node_combo.pack(fill=tk.X, pady=2)
+        
+        ttk.Label(control_frame, text="Goal Node (optional):").pack(anchor=tk.W, pady=(10, 0))
+        self.goal_node_var = tk.StringVar()
+        self.goal_node_combo = NodePicker(control_frame, self.node_index, self.goal_node_var,
+                                          optional=True, width=15)
+        self.goal_node_combo.pack(fill=tk.X, pady=2)
+        
+        ttk.Label(control_frame, text="BFS Mode:").pack(anchor=tk.W, pady=(10, 0))
+        self.bfs_mode_var = tk.StringVar(value="Standard")
+        self.bfs_mode_combo = ttk.Combobox(control_frame, textvariable=self.bfs_mode_var,
+                                         values=list(traversal_engine.BFS_MODES) + [self.PARALLEL_MODE],
+                                         state="readonly", width=15)
+        self.bfs_mode_combo.pack(fill=tk.X, pady=2)
+        
+        ttk.Label(control_frame, text="DFS Mode:").pack(anchor=tk.W, pady=(10, 0))
+        dfs_mode_frame = ttk.Frame(control_frame)
+        dfs_mode_frame.pack(fill=tk.X, pady=2)
+        self.dfs_mode_var = tk.StringVar(value="Standard")
+        self.dfs_mode_combo = ttk.Combobox(dfs_mode_frame, textvariable=self.dfs_mode_var,
+                                         values=list(traversal_engine.DFS_MODES),
+                                         state="readonly", width=15)
+        self.dfs_mode_combo.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Label(dfs_mode_frame, text="Depth Limit:").pack(side=tk.LEFT, padx=(5, 0))
+        self.depth_limit_var = tk.IntVar(value=traversal_engine.DEFAULT_DEPTH_LIMIT)
+        ttk.Spinbox(dfs_mode_frame, from_=0, to=1000000, textvariable=self.depth_limit_var,
+                    width=6).pack(side=tk.LEFT, padx=2)
+        
+        # Informed search joins "Compare Both" as another column when a goal is set
+        ttk.Label(control_frame, text="Informed Search (with a goal):").pack(anchor=tk.W, pady=(10, 0))
+        informed_frame = ttk.Frame(control_frame)
+        informed_frame.pack(fill=tk.X, pady=2)
+        self.informed_mode_var = tk.StringVar(value="A*")
+        ttk.Combobox(informed_frame, textvariable=self.informed_mode_var,
+                     values=list(informed_search.INFORMED_MODES),
+                     state="readonly", width=15).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Label(informed_frame, text="Heuristic:").pack(side=tk.LEFT, padx=(5, 0))
+        self.heuristic_var = tk.StringVar(value="Landmarks (ALT)")
+        ttk.Combobox(informed_frame, textvariable=self.heuristic_var,
+                     values=list(informed_search.HEURISTICS),
+                     state="readonly", width=15).pack(side=tk.LEFT, padx=2)
+        
+        # Animation speed control
+        speed_frame = ttk.Frame(control_frame)
+        speed_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Label(speed_frame, text="Animation Speed:").pack(side=tk.LEFT)
+        self.speed_var = tk.DoubleVar(value=1.0)
+        speed_scale = ttk.Scale(speed_frame, from_=0.1, to=3.0, variable=self.speed_var, 
+                               orient=tk.HORIZONTAL, length=150)
+        speed_scale.pack(side=tk.RIGHT, fill=tk.X, expand=True)
+        
+        # Buttons
+        button_frame = ttk.Frame(control_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        ttk.Button(button_frame, text="Run BFS", command=self.run_bfs).pack(side=tk.LEFT, padx=2)
+        ttk.Button(button_frame, text="Run DFS", command=self.run_dfs).pack(side=tk.LEFT, padx=2)
+        ttk.Button(button_frame, text="Compare Both", command=self.compare_algorithms).pack(side=tk.LEFT, padx=2)
+        ttk.Button(button_frame, text="Clear Results", command=self.clear_results).pack(side=tk.LEFT, padx=2)
+        
+        batch_frame = ttk.Frame(control_frame)
+        batch_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Button(batch_frame, text="Batch BFS (all start nodes)", command=self.run_batch).pack(side=tk.LEFT, padx=2)
+        self.instrument_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(batch_frame, text="Instrument", variable=self.instrument_var,
+                        command=self.toggle_instruments).pack(side=tk.LEFT, padx=2)
+        ttk.Button(batch_frame, text="Export Counters...", command=self.export_counters).pack(side=tk.LEFT, padx=2)
+        
+        # Search status and cancellation
+        status_frame = ttk.Frame(control_frame)
+        status_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Button(status_frame, text="Stop Search", command=self.stop_search).pack(side=tk.LEFT, padx=2)
+        self.reachability_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(status_frame, text="Reachability Index", variable=self.reachability_var,
+                        command=self.toggle_reachability).pack(side=tk.LEFT, padx=2)
+        self.status_var = tk.StringVar(value="Ready")
+        ttk.Label(status_frame, textvariable=self.status_var).pack(side=tk.LEFT, padx=5)
+        
+        # Animation playback controls
+        playback_frame = ttk.Frame(control_frame)
+        playback_frame.pack(fill=tk.X, pady=(5, 0))
+        ttk.Button(playback_frame, text="Pause", command=lambda: self.animation.pause()).pack(side=tk.LEFT, padx=2)
+        ttk.Button(playback_frame, text="Resume", command=lambda: self.animation.resume()).pack(side=tk.LEFT, padx=2)
+        ttk.Button(playback_frame, text="Cancel", command=lambda: self.animation.cancel()).pack(side=tk.LEFT, padx=2)
+        
+        # Results display
+        results_frame = ttk.LabelFrame(left_frame, text="Results", padding=5)
+        results_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Create notebook for tabbed results
+        self.results_notebook = ttk.Notebook(results_frame)
+        self.results_notebook.pack(fill=tk.BOTH, expand=True)
+        
+        # BFS Results tab
+        self.bfs_frame = ttk.Frame(self.results_notebook)
+        self.results_notebook.add(self.bfs_frame, text="BFS Results")
+        
+        self.bfs_panel = ResultsView(self.bfs_frame)
+        self.bfs_panel.pack(fill=tk.BOTH, expand=True)
+        
+        # DFS Results tab
+        self.dfs_frame = ttk.Frame(self.results_notebook)
+        self.results_notebook.add(self.dfs_frame, text="DFS Results")
+        
+        self.dfs_panel = ResultsView(self.dfs_frame)
+        self.dfs_panel.pack(fill=tk.BOTH, expand=True)
+        
+        # Comparison Results tab
+        self.comparison_frame = ttk.Frame(self.results_notebook)
+        self.results_notebook.add(self.comparison_frame, text="Comparison")
+        self.comparison_panel = ResultsView(self.comparison_frame)
+        self.comparison_panel.pack(fill=tk.BOTH, expand=True)
+        
+        # Batch Results tab
+        self.batch_frame = ttk.Frame(self.results_notebook)
+        self.results_notebook.add(self.batch_frame, text="Batch")
+        self.batch_text = scrolledtext.ScrolledText(self.batch_frame, height=15, width=40)
+        self.batch_text.pack(fill=tk.BOTH, expand=True)
+        
+        # Right panel for graph visualization (decrease width)
+        right_frame = ttk.LabelFrame(main_frame, text="Graph Visualization", padding=10)
+        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        right_frame.config(width=700)  # Decreased width
+        right_frame.pack_propagate(False)
+
+        # Which part of the graph is drawn; large graphs default to a neighborhood
+        view_frame = ttk.Frame(right_frame)
+        view_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(view_frame, text="View:").pack(side=tk.LEFT)
+        self.view_mode_var = tk.StringVar(value="Auto")
+        view_combo = ttk.Combobox(view_frame, textvariable=self.view_mode_var,
+                                  values=self.VIEW_MODES, state="readonly", width=15)
+        view_combo.pack(side=tk.LEFT, padx=2)
+        view_combo.bind('<<ComboboxSelected>>', lambda event: self.change_view())
+        ttk.Button(view_frame, text="Fit", command=self.fit_view).pack(side=tk.LEFT, padx=2)
+        ttk.Label(view_frame, text="Wheel zooms, drag pans").pack(side=tk.LEFT, padx=5)
+
+        # Canvas the cached Graphviz layout is drawn on; frames only recolor nodes
+        self.graph_canvas = tk.Canvas(right_frame, background='white', highlightthickness=0)
+        self.graph_canvas.pack(fill=tk.BOTH, expand=True)
+        self.graph_canvas.bind('<Configure>', lambda event: self.redraw_graph())
+        self.graph_canvas.bind('<MouseWheel>', lambda event: self.zoom_view(event, 1.2 if event.delta > 0 else 1 / 1.2))
+        self.graph_canvas.bind('<Button-4>', lambda event: self.zoom_view(event, 1.2))
+        self.graph_canvas.bind('<Button-5>', lambda event: self.zoom_view(event, 1 / 1.2))
+        self.graph_canvas.bind('<ButtonPress-1>', self.start_pan)
+        self.graph_canvas.bind('<B1-Motion>', self.pan_view)
+        self.graph_canvas.bind('<ButtonRelease-1>', self.end_pan)
+        
+    def current_view(self):
+        """Return the GraphView being drawn, choosing it from the View setting on first use"""
+        if self.view is None:
+            mode = self.view_mode_var.get()
+            if mode == "Auto":
+                mode = "Full" if self.graph.number_of_nodes() <= self.MAX_DRAWN_NODES else "Neighborhood"
+            if mode == "Neighborhood":
+                self.view = graph_view.neighborhood_view(self.graph, self.view_centers())
+            elif mode == "Collapsed SCCs":
+                self.view = graph_view.condensed_view(self.graph)
+            else:
+                self.view = graph_view.full_view(self.graph)
+        return self.view
+    
+    def view_centers(self):
+        """Nodes a neighborhood view grows from: the animated node, else the start node"""
+        for node in (self.animation_current, self.node_label(self.start_node_var.get())):
+            if node is not None and node != '' and node in self.graph:
+                return [node]
+        return [next(iter(self.graph.nodes), None)]
+    
+    def graph_layout(self):
+        """Return the Graphviz layout of the current view, running Graphviz only after edits"""
+        if self._layout is None:
+            view = self.current_view()
+            with self.instruments.phase("layout"):
+                self._layout = graph_layout.compute_layout(view.view, graph_view.layout_engine(len(view)))
+            self._tiles = graph_view.TileIndex(self._layout)
+        return self._layout
+    
+    def canvas_size(self):
+        """Canvas width and height (default 700x600 before the first resize)"""
+        canvas = self.graph_canvas
+        width = canvas.winfo_width() if canvas.winfo_width() > 1 else 700
+        height = canvas.winfo_height() if canvas.winfo_height() > 1 else 600
+        return width, height
+    
+    def view_transform(self, layout):
+        """Return (scale, x_offset, y_offset) mapping layout inches to canvas pixels"""
+        width, height = self.canvas_size()
+        scale = min(width / layout.width, height / layout.height, 100) * self.zoom
+        x_offset = (width - layout.width * scale) / 2 + self.pan[0]
+        y_offset = (height - layout.height * scale) / 2 + self.pan[1]
+        return scale, x_offset, y_offset
+    
+    def redraw_graph(self):
+        """Draw the visible part of the current view from the cached layout, keeping
+        the current node colors"""
+        self._redraw_pending = False
+        with self.instruments.phase("draw"):
+            canvas = self.graph_canvas
+            canvas.delete('all')
+            self._node_items = {}
+            view = self.current_view()
+            if len(view) > self.MAX_DRAWN_NODES:
+                canvas.create_text(canvas.winfo_width() / 2, canvas.winfo_height() / 2,
+                                   text=f"Graph too large to draw ({self.graph.number_of_nodes()} nodes, "
+                                        f"{self.graph.number_of_edges()} edges); "
+                                        f"pick the Neighborhood or Collapsed SCCs view")
+                return
+            layout = self.graph_layout()
+            if not layout.nodes:
+                return
+        
+            width, height = self.canvas_size()
+            scale, x_offset, y_offset = self.view_transform(layout)
+        
+            def to_canvas(x, y):
+                return x_offset + x * scale, y_offset + (layout.height - y) * scale
+        
+            # Only tiles overlapping the canvas are drawn; panning or zooming redraws
+            nodes, edges = self._tiles.visible(-x_offset / scale, layout.height - (height - y_offset) / scale,
+                                               (width - x_offset) / scale, layout.height + y_offset / scale)
+            for u, v, points in edges:
+                coords = [c for x, y in points for c in to_canvas(x, y)]
+                canvas.create_line(*coords, smooth='raw')
+            self.instruments.count("draw", "edges", len(edges))
+            self.instruments.count("draw", "nodes", len(nodes))
+            self.instruments.count("draw", "culled nodes", len(layout.nodes) - len(nodes))
+            font_size = max(6, int(scale / 7))
+            for node in nodes:
+                x, y, w, h = layout.nodes[node]
+                cx, cy = to_canvas(x, y)
+                rx, ry = w * scale / 2, h * scale / 2
+                color = self._node_colors.get(node, 'lightblue')
+                oval = canvas.create_oval(cx - rx, cy - ry, cx + rx, cy + ry, fill=color)
+                if scale >= self.LABEL_MIN_SCALE:
+                    canvas.create_text(cx, cy, text=node, font=('TkDefaultFont', font_size))
+                self._node_items[node] = oval
+    
+    def request_redraw(self):
+        """Redraw once the event loop is idle, folding bursts of zoom and pan events"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.root.after_idle(self.redraw_graph)
+    
+    def zoom_view(self, event, factor):
+        """Zoom by factor, keeping the layout point under the pointer in place"""
+        if not self._layout or not self._layout.nodes:
+            return
+        scale, x_offset, y_offset = self.view_transform(self._layout)
+        self.zoom = min(max(self.zoom * factor, self.MIN_ZOOM), self.MAX_ZOOM)
+        new_scale, new_x_offset, new_y_offset = self.view_transform(self._layout)
+        ratio = new_scale / scale
+        self.pan = (self.pan[0] + event.x - (event.x - x_offset) * ratio - new_x_offset,
+                    self.pan[1] + event.y - (event.y - y_offset) * ratio - new_y_offset)
+        self.request_redraw()
+    
+    def start_pan(self, event):
+        self._drag = (event.x, event.y)
+    
+    def pan_view(self, event):
+        """Move the drawn items with the pointer; the release redraws the newly exposed tiles"""
+        if self._drag is None:
+            return
+        dx, dy = event.x - self._drag[0], event.y - self._drag[1]
+        self._drag = (event.x, event.y)
+        self.pan = (self.pan[0] + dx, self.pan[1] + dy)
+        self.graph_canvas.move('all', dx, dy)
+    
+    def end_pan(self, event):
+        if self._drag is not None:
+            self._drag = None
+            self.request_redraw()
+    
+    def fit_view(self):
+        self.zoom = 1.0
+        self.pan = (0.0, 0.0)
+        self.redraw_graph()
+    
+    def reset_view(self):
+        """Forget the view and its layout so they are rebuilt on the next draw"""
+        self.view = None
+        self._layout = None
+        self._tiles = None
+        self._node_items = None
+        self._node_colors = {}
+        self.zoom = 1.0
+        self.pan = (0.0, 0.0)
+    
+    def change_view(self):
+        self.reset_view()
+        self.visualize_graph()
+    
+    def recolor_node(self, node, color):
+        """Change one node's fill on the canvas if it differs from its current color"""
+        node = str(node)  # drawn items are keyed by layout name, which is the label as text
+        if self._node_colors.get(node, 'lightblue') == color:
+            return
+        self.instruments.count("render", "recolors")
+        self._node_colors[node] = color
+        item = self._node_items.get(node)
+        if item is not None:
+            self.graph_canvas.itemconfigure(item, fill=color)
+    
+
+    def visualize_graph(self, bfs_visited=None, dfs_visited=None, bfs_current=None, dfs_current=None):
+        """Visualize the graph by recoloring the current view's nodes on the cached layout.
+        A view node drawing several graph nodes takes the color of the most prominent one."""
+        if self._node_items is None:
+            self.redraw_graph()
+        view = self.current_view()
+        if len(view) > self.MAX_DRAWN_NODES:
+            return
+        colors = {}
+        for nodes, color in ((dfs_visited, 'lightcoral'), ((dfs_current,), 'red'),
+                             (bfs_visited, 'lightgreen'), ((bfs_current,), 'red')):
+            for node in nodes or ():
+                shown = view.view_node(node)
+                if shown is not None:
+                    colors[shown] = color
+        with self.instruments.phase("render"):
+            for node in view.view:
+                self.recolor_node(node, colors.get(node, 'lightblue'))
+    
+    def csr_graph(self):
+        """Return the CSR snapshot of the current graph, rebuilding it after edits"""
+        if self._csr is None:
+            self._csr = traversal_engine.CSRGraph.from_networkx(self.graph, weight="weight")
+        return self._csr
+    
+    def search_graph(self):
+        """Return the CSR snapshot with the reachability index attached when enabled"""
+        graph = self.csr_graph()
+        graph.reachability = self.reachability if self.reachability_var.get() else None
+        return graph
+    
+    def toggle_reachability(self):
+        """Turning the index off frees it; it is built again before the next search"""
+        if not self.reachability_var.get():
+            self.reachability = None
+            if self._csr is not None:
+                self._csr.reachability = None
+    
+    def prepare_search(self, retry, landmarks=False):
+        """Build on the worker what the search needs but is missing: the reachability
+        index when enabled and, with landmarks=True, the ALT landmark tables, kept on
+        the CSR graph so they are pickled with it. Then call retry(); returns True
+        when the search can be submitted now."""
+        graph = self.csr_graph()
+        build_index = self.reachability_var.get() and self.reachability is None
+        build_landmarks = landmarks and graph.landmarks is None
+        if not (build_index or build_landmarks):
+            return True
+        
+        def build():
+            if build_landmarks:
+                informed_search.landmarks(graph)
+            return ReachabilityIndex.from_csr(graph) if build_index else None
+        
+        def finish(index):
+            if build_index:
+                self.reachability = index
+            retry()
+        self.pending_prepared = finish
+        self.worker.prepare(build)
+        self.start_polling("Prepare")
+        self.status_var.set("Building reachability index..." if build_index else "Building landmark tables...")
+        return False
+
+    def mark_graph_changed(self):
+        """Drop state derived from the graph after it has been edited"""
+        self.stop_search()
+        self.animation.cancel()
+        self.graph_version += 1
+        self.results_cache.drop_older(self.graph_version)
+        self.close_parallel_bfs()
+        self.results_entry = None
+        self._csr = None
+        self.reset_view()
+
+    def bfs_traversal(self):
+        """Return the engine BFS function for the selected BFS mode"""
+        if self.bfs_mode_var.get() == self.PARALLEL_MODE:
+            return self.parallel_bfs()
+        return traversal_engine.BFS_MODES[self.bfs_mode_var.get()]
+    
+    def parallel_bfs(self):
+        """Return the process-pool BFS for the current graph, starting its pool on first use"""
+        if self._parallel_bfs is None or self._parallel_bfs.graph is not self.csr_graph():
+            self.close_parallel_bfs()
+            self._parallel_bfs = batch_traversal.ParallelBFS(self.csr_graph())
+        return self._parallel_bfs
+    
+    def close_parallel_bfs(self):
+        if self._parallel_bfs is not None:
+            self._parallel_bfs.close()
+            self._parallel_bfs = None
+
+    def instrumented(self, traversal):
+        """Return traversal, made to collect search counters while instrumenting"""
+        if self.instruments.enabled:
+            return functools.partial(traversal, counters=True)
+        return traversal
+    
+    def toggle_instruments(self):
+        """Start recording counters from a clean slate, or stop recording"""
+        self.instruments.enabled = self.instrument_var.get()
+        self.instruments.clear()
+    
+    def export_counters(self):
+        """Save the recorded counters as JSON or as a Chrome trace"""
+        path = filedialog.asksaveasfilename(
+            title="Export Counters", defaultextension=".json",
+            filetypes=[("Counters JSON", "*.json"), ("Chrome trace", "*.trace.json")])
+        if not path:
+            return
+        try:
+            self.instruments.save(path)
+        except OSError as exc:
+            messagebox.showerror("Error", str(exc))
+            return
+        self.status_var.set(f"Exported counters to {path}")
+    
+    def breadth_first_search(self, start, goal=None):
+        """Perform BFS and return path with statistics"""
+        return self.bfs_traversal()(self.search_graph(), start, goal)
+    
+    def dfs_traversal(self):
+        """Return the engine DFS function for the selected DFS mode and depth limit"""
+        search = traversal_engine.DFS_MODES[self.dfs_mode_var.get()]
+        if search is traversal_engine.depth_limited_search:
+            return functools.partial(search, max_depth=self.depth_limit_var.get())
+        return search
+    
+    def informed_traversal(self):
+        """Return the selected informed search with the selected heuristic"""
+        search = informed_search.INFORMED_MODES[self.informed_mode_var.get()]
+        return functools.partial(search, heuristic=informed_search.HEURISTICS[self.heuristic_var.get()])
+    
+    def iterative_depth_first_search(self, start, goal=None):
+        """Perform Iterative DFS and return path with statistics"""
+        return self.dfs_traversal()(self.search_graph(), start, goal)
+    
+    def animate_traversal(self, path, algorithm_type, finished=True):
+        """Animate the traversal process without blocking the Tk event loop.
+        With finished=False more nodes can be put on self.animation.queue later."""
+        self.animation.cancel()
+        self.visualize_graph()
+        self.animation_visited_color = 'lightgreen' if algorithm_type == "BFS" else 'lightcoral'
+        self.animation_current = None
+        self.animation_visited = set()
+        self.animation.start(path, finished)
+    
+    def render_animation_frame(self, nodes):
+        """Draw one frame; when frames were coalesced only the newest node is current.
+        A neighborhood view follows the search, recentering when it walks off the view."""
+        self.instruments.count("animate", "frames")
+        self.instruments.count("animate", "nodes", len(nodes))
+        with self.instruments.phase("animate"):
+            self.animation_visited.update(nodes)
+            view = self.current_view()
+            if view.kind == "neighborhood" and view.view_node(nodes[-1]) is None:
+                self.animation_current = nodes[-1]
+                self.recenter_view()
+                return
+            if self.animation_current is not None:
+                self.recolor_view_node(self.animation_current, self.animation_visited_color)
+            for node in nodes[:-1]:
+                self.recolor_view_node(node, self.animation_visited_color)
+            self.animation_current = nodes[-1]
+            self.recolor_view_node(self.animation_current, 'red')
+    
+    def recolor_view_node(self, node, color):
+        shown = self.current_view().view_node(node)
+        if shown is not None:
+            self.recolor_node(shown, color)
+    
+    def recenter_view(self):
+        """Rebuild the neighborhood around the animated node and restore the animation's colors"""
+        self.instruments.count("animate", "recenters")
+        self.reset_view()
+        self.redraw_graph()
+        for node in self.view.view:
+            if node in self.animation_visited:
+                self.recolor_node(node, self.animation_visited_color)
+        self.recolor_node(self.animation_current, 'red')
+    
+    def traversal_query(self):
+        """Validate the graph and selected nodes, returning (start, goal) or None"""
+        if not self.graph.nodes():
+            messagebox.showerror("Error", "Please create a graph first")
+            return None
+        
+        start = self.node_label(self.start_node_var.get())
+        goal = self.node_label(self.goal_node_var.get()) if self.goal_node_var.get() else None
+        
+        if start == '':
+            messagebox.showerror("Error", "Please select a start node")
+            return None
+        for label, node in (("Start", start), ("Goal", goal)):
+            if node is not None and node not in self.graph:
+                messagebox.showerror("Error", f"{label} node '{node}' does not exist")
+                return None
+        return start, goal
+    
+    def node_label(self, text):
+        """Return the graph node the picker text names: the text itself, or the integer
+        it spells when the graph has integer labels (e.g. an opened snapshot)"""
+        if text not in self.graph and text.lstrip('-').isdigit() and int(text) in self.graph:
+            return int(text)
+        return text
+    
+    def run_bfs(self):
+        """Run BFS algorithm on the background worker"""
+        query = self.traversal_query()
+        if query is None:
+            return
+        key = self.results_key("BFS", query)
+        if self.serve_cached("BFS", key):
+            return
+        if not self.prepare_search(self.run_bfs):
+            return
+        events = traversal_engine.BFS_EVENT_STREAMS.get(self.bfs_mode_var.get())
+        if events is not None:
+            # Animate visits as the search streams them instead of after it ends
+            self.animate_traversal([], "BFS", finished=False)
+            self.worker.stream("BFS", events, "BFS", self.search_graph(), *query,
+                               counters=self.instruments.enabled)
+        else:
+            self.animation.cancel()
+            self.worker.run("BFS", self.instrumented(self.bfs_traversal()), self.search_graph(), *query)
+        self.start_polling("BFS", streaming=events is not None, key=key)
+    
+    def run_dfs(self):
+        """Run DFS algorithm on the background worker"""
+        query = self.traversal_query()
+        if query is None:
+            return
+        key = self.results_key("DFS", query)
+        if self.serve_cached("DFS", key):
+            return
+        if not self.prepare_search(self.run_dfs):
+            return
+        events = traversal_engine.DFS_EVENT_STREAMS.get(self.dfs_mode_var.get())
+        if events is not None:
+            self.animate_traversal([], "DFS", finished=False)
+            self.worker.stream("DFS", events, "Iterative DFS", self.search_graph(), *query,
+                               counters=self.instruments.enabled)
+        else:
+            self.animation.cancel()
+            self.worker.run("DFS", self.instrumented(self.dfs_traversal()), self.search_graph(), *query)
+        self.start_polling("DFS", streaming=events is not None, key=key)
+    
+    def compare_algorithms(self):
+        """Run and benchmark both algorithms in parallel worker processes"""
+        query = self.traversal_query()
+        if query is None:
+            return
+        if self.bfs_mode_var.get() == self.PARALLEL_MODE:
+            messagebox.showerror("Error", "Parallel BFS runs its own process pool and cannot run inside "
+                                          "Compare Both; pick another BFS mode or use "
+                                          "'python benchmark.py parallel'")
+            return
+        key = self.results_key("Compare", query)
+        if self.serve_cached("Compare", key):
+            return
+        start, goal = query
+        alt = informed_search.HEURISTICS[self.heuristic_var.get()] is informed_search.alt_heuristic
+        if not self.prepare_search(self.compare_algorithms, landmarks=goal is not None and alt):
+            return
+        self.animation.cancel()
+        self.bfs_bench = {}
+        self.dfs_bench = {}
+        self.extra_results = {}
+        traversals = [("BFS", self.bfs_traversal()),
+                      ("DFS", self.dfs_traversal())]
+        if goal is not None and self.bfs_traversal() is not traversal_engine.bidirectional_bfs:
+            traversals.append(("Bidirectional", traversal_engine.bidirectional_bfs))
+        if goal is not None:
+            traversals.append((self.informed_mode_var.get(), self.informed_traversal()))
+        traversals = [(name, self.instrumented(traversal)) for name, traversal in traversals]
+        self.worker.compare(traversals, self.search_graph(), *query)
+        self.start_polling("Compare", key=key)
+    
+    def run_batch(self):
+        """BFS from every node in the start list (towards the goal, if one is set)
+        across a process pool, listing results as they complete"""
+        query = self.traversal_query()
+        if query is None:
+            return
+        start, goal = query
+        sources = list(self.graph.nodes)
+        self.animation.cancel()
+        self.batch_text.delete('1.0', tk.END)
+        target = f" towards {goal}" if goal is not None else ""
+        self.batch_text.insert(tk.END, f"BATCH BFS from {len(sources)} sources{target}\n{'=' * 40}\n")
+        self.results_notebook.select(self.batch_frame)
+        self.batch_total = len(sources)
+        self.batch_done = 0
+        self.batch_started = time.perf_counter()
+        self.worker.batch(self.csr_graph(), sources, goal)
+        self.start_polling("Batch")
+    
+    def display_batch_results(self, results):
+        """Append one group of batch results to the Batch tab"""
+        lines = []
+        for result in results:
+            if "error" in result:
+                lines.append(f"{result['source']}: Error: {result['error']}")
+                continue
+            line = f"{result['source']}: {result['nodes_visited']} nodes visited, depth {result['depth']}"
+            if result['goal'] is not None:
+                distance = result['distance']
+                line += f", distance to {result['goal']}: {distance if distance is not None else 'unreachable'}"
+            lines.append(line)
+        if lines:
+            self.batch_text.insert(tk.END, "\n".join(lines) + "\n")
+        self.batch_done += len(results)
+        self.status_var.set(f"Batch: {self.batch_done}/{self.batch_total} sources")
+    
+    def results_key(self, action, query):
+        """Cache key of a BFS, DFS or Compare run of the selected modes on the current graph"""
+        dfs_mode = self.dfs_mode_var.get()
+        if traversal_engine.DFS_MODES[dfs_mode] is traversal_engine.depth_limited_search:
+            dfs_mode = f"{dfs_mode} ({self.depth_limit_var.get()})"
+        algorithm = {"BFS": self.bfs_mode_var.get(), "DFS": dfs_mode,
+                     "Compare": (self.bfs_mode_var.get(), dfs_mode,
+                                 self.informed_mode_var.get(), self.heuristic_var.get())}[action]
+        if self.instruments.enabled:
+            algorithm = (algorithm, "counters")  # instrumented stats carry counters
+        return (action, algorithm, *query, self.graph_version)
+    
+    def serve_cached(self, action, key):
+        """Show the cached results for key without searching; False on a cache miss"""
+        entry = self.results_cache.get(key)
+        if entry is None:
+            return False
+        self.stop_search()
+        if action == "Compare":
+            self.bfs_bench = {}
+            self.dfs_bench = {}
+            self.extra_results = {}
+        for result in entry["results"]:
+            self.apply_result(result)
+        self.results_entry = entry
+        self.streaming = False
+        self.finish_action(action, animate=False)
+        self.status_var.set(f"{action} served from cache")
+        return True
+    
+    def apply_result(self, result):
+        name, path, stats, bench = result
+        if name == "BFS":
+            self.bfs_path, self.bfs_stats, self.bfs_bench = path, stats, bench
+        elif name == "DFS":
+            self.dfs_path, self.dfs_stats, self.dfs_bench = path, stats, bench
+        else:
+            self.extra_results[name] = (stats, bench)
+    
+    def cached_document(self, name, build):
+        """Return build(), memoized in the cache entry of the results on display"""
+        entry = self.results_entry
+        if entry is None:
+            return build()
+        if name not in entry["documents"]:
+            entry["documents"][name] = build()
+            if entry["key"] in self.results_cache:
+                self.results_cache.put(entry["key"], entry)  # re-measure with the document
+        return entry["documents"][name]
+    
+    def start_polling(self, action, streaming=False, key=None):
+        """Remember what the current job is for and start polling for its messages"""
+        self.pending_action = action
+        self.pending_key = key
+        self.pending_results = []
+        self.prepared_value = None
+        self.streaming = streaming
+        self.status_var.set(f"Running {action}...")
+        if not self.polling:
+            self.polling = True
+            self.root.after(self.POLL_INTERVAL_MS, self.poll_worker)
+    
+    def poll_worker(self):
+        """Apply progress and results posted by the worker since the last poll"""
+        while self.pending_action is not None:
+            try:
+                job, kind, payload = self.worker.messages.get_nowait()
+            except queue.Empty:
+                break
+            if not self.worker.is_current(job):
+                continue
+            if kind == "progress":
+                name, nodes_visited, frontier_size = payload
+                self.status_var.set(f"{name}: {nodes_visited} nodes visited, frontier {frontier_size}")
+            elif kind == "events":
+                name, nodes = payload
+                for node in nodes:
+                    self.animation.queue.put(node)
+            elif kind == "result":
+                self.apply_result(payload)
+                self.pending_results.append(payload)
+                self.instruments.add_search(payload[0], payload[2])
+            elif kind == "prepared":
+                self.prepared_value = payload
+            elif kind == "batch":
+                self.display_batch_results(payload)
+            elif kind == "import-progress":
+                edges, done, total = payload
+                self.status_var.set(f"Importing: {edges} edges, {done * 100 // max(total, 1)}% read")
+            elif kind == "done":
+                action, self.pending_action = self.pending_action, None
+                if self.pending_key is not None:
+                    self.results_entry = {"key": self.pending_key, "results": self.pending_results, "documents": {}}
+                    self.results_cache.put(self.pending_key, self.results_entry)
+                self.finish_action(action)
+            elif kind == "error":
+                if self.streaming:
+                    self.animation.cancel()
+                self.pending_action = None
+                self.imported_graph = self.imported_csr = None
+                self.status_var.set("Failed")
+                messagebox.showerror("Error", payload)
+        if self.pending_action is not None:
+            self.root.after(self.POLL_INTERVAL_MS, self.poll_worker)
+        else:
+            self.polling = False
+    
+    def finish_action(self, action, animate=True):
+        """Display the results of a finished BFS, DFS, Compare or Import job; with
+        animate=False the final traversal state is shown without replaying it"""
+        self.status_var.set("Ready")
+        if action == "Prepare":
+            self.pending_prepared(self.prepared_value)
+            return
+        if action == "Import":
+            self.finish_import()
+            return
+        if action == "Batch":
+            seconds = time.perf_counter() - self.batch_started
+            self.batch_text.insert(tk.END, f"\n{self.batch_done} sources in {seconds:.2f} s "
+                                           f"({self.batch_done / max(seconds, 1e-9):.1f} sources/s)\n")
+            return
+        if self.streaming:
+            self.animation.queue.put(self.animation.END)
+        if action == "BFS":
+            self.display_results(self.bfs_stats, self.bfs_panel)
+            if not animate:
+                self.animation.cancel()
+                self.visualize_graph(bfs_visited=set(self.bfs_path))
+            elif not self.streaming:
+                self.animate_traversal(self.bfs_path, "BFS")
+            self.results_notebook.select(self.bfs_frame)
+        elif action == "DFS":
+            self.display_results(self.dfs_stats, self.dfs_panel)
+            if not animate:
+                self.animation.cancel()
+                self.visualize_graph(dfs_visited=set(self.dfs_path))
+            elif not self.streaming:
+                self.animate_traversal(self.dfs_path, "DFS")
+            self.results_notebook.select(self.dfs_frame)
+        else:
+            # Display individual results
+            self.display_results(self.bfs_stats, self.bfs_panel)
+            self.display_results(self.dfs_stats, self.dfs_panel)
+            
+            # Show final visualization with both traversals
+            self.visualize_graph(bfs_visited=set(self.bfs_path), dfs_visited=set(self.dfs_path))
+            
+            # Display comparison
+            self.display_comparison()
+            
+            # Switch to comparison tab
+            self.results_notebook.select(self.comparison_frame)
+    
+    def stop_search(self):
+        """Cancel the running traversal or import job, if any"""
+        if self.pending_action is not None:
+            self.worker.cancel()
+            if self.streaming:
+                self.animation.cancel()
+            self.pending_action = None
+            self.pending_key = None
+            self.imported_graph = self.imported_csr = None
+            self.status_var.set("Cancelled")
+    
+    def on_close(self):
+        self.worker.shutdown()
+        self.close_parallel_bfs()
+        self.root.destroy()
+    
+    def display_results(self, stats, panel):
+        """Display algorithm results in the specified results panel"""
+        if "error" in stats:
+            panel.show(PathDocument(f"Error: {stats['error']}\n"))
+            return
+        
+        document = self.cached_document(id(stats), lambda: self.format_results(stats))
+        if self.instruments.enabled:
+            document += PathDocument(f"\nSession Counters:\n{self.instruments.summary()}")
+        panel.show(document)
+    
+    def format_results(self, stats):
+        """Build the results document; paths are added as node lists, not joined strings"""
+        document = PathDocument(f"Algorithm: {stats['algorithm']}\n{'='*40}\n\n")
+        
+        document.add_text("Traversal Path:\n")
+        document.add_path(stats['traversal_path'])
+        
+        if stats['goal_path']:
+            document.add_text("\nPath to Goal:\n")
+            document.add_path(stats['goal_path'])
+        
+        output = f"\nPerformance Metrics:\n"
+        output += f"- Nodes Visited: {stats['nodes_visited']}\n"
+        output += f"- Execution Time: {stats['execution_time']:.3f} ms\n"
+        if "memory_used" in stats:
+            output += f"- Memory Used: {stats['memory_used']:.2f} KB\n"
+        if stats['path_length'] > 0:
+            output += f"- Path Length: {stats['path_length']}\n"
+        if stats.get("path_cost") is not None:
+            output += f"- Path Cost: {stats['path_cost']:g}\n"
+        if "heuristic" in stats:
+            output += f"- Heuristic: {stats['heuristic']} ({stats['heap_pushes']} heap pushes)\n"
+        if "depth_limit" in stats:
+            output += f"- Depth Limit: {stats['depth_limit']}\n"
+        if "iterations" in stats:
+            output += f"- Deepening Iterations: {stats['iterations']} ({stats['total_visits']} visits in total)\n"
+        if stats.get("unreachable"):
+            output += "- Goal is unreachable from the start node: search skipped by the reachability index\n"
+        if "counters" in stats:
+            estimated = " (estimated from the visit order)" if stats.get("counters_estimated") else ""
+            output += f"\nSearch Counters{estimated}:\n"
+            for name, value in stats["counters"].items():
+                output += f"- {name.replace('_', ' ').capitalize()}: {value}\n"
+        if "phases" in stats:
+            output += "\nPhase Times:\n"
+            for name, ms in stats["phases"].items():
+                output += f"- {name.capitalize()}: {ms:.3f} ms\n"
+        document.add_text(output)
+        return document
+    
+    def display_comparison(self):
+        """Display comparison between BFS and DFS in the comparison tab"""
+        if not self.bfs_stats or not self.dfs_stats:
+            document = PathDocument("Please run both algorithms first.\n")
+        else:
+            document = self.cached_document("comparison", self.format_comparison)
+        self.comparison_panel.show(document + PathDocument(f"\nRESULTS CACHE: {self.results_cache.summary()}\n"))
+    
+    def format_comparison(self):
+        document = PathDocument("ALGORITHM COMPARISON\n" + "=" * 50 + "\n\n")
+        
+        # Traversal comparison
+        document.add_text("TRAVERSAL PATHS:\n")
+        document.add_path(self.bfs_stats['traversal_path'], "BFS: ")
+        document.add_path(self.dfs_stats['traversal_path'], "DFS: ")
+        for name, (stats, bench) in self.extra_results.items():
+            document.add_path(stats['traversal_path'], f"{name}: ")
+        
+        # Goal path comparison
+        if self.bfs_stats['goal_path'] and self.dfs_stats['goal_path']:
+            document.add_text("\nPATHS TO GOAL:\n")
+            document.add_path(self.bfs_stats['goal_path'], "BFS: ")
+            document.add_path(self.dfs_stats['goal_path'], "DFS: ")
+            for name, (stats, bench) in self.extra_results.items():
+                document.add_path(stats['goal_path'], f"{name}: ")
+        
+        # Nodes an informed search saved over plain BFS
+        informed = [(name, stats) for name, (stats, bench) in self.extra_results.items() if "heuristic" in stats]
+        if informed:
+            document.add_text("\nINFORMED SEARCH:\n")
+            bfs_visited = self.bfs_stats['nodes_visited']
+            for name, stats in informed:
+                line = f"{name} ({stats['heuristic']}): {stats['nodes_visited']} nodes visited"
+                if bfs_visited:
+                    line += f", {1 - stats['nodes_visited'] / bfs_visited:.0%} fewer than BFS"
+                if stats['path_cost'] is not None:
+                    line += f", path cost {stats['path_cost']:g}"
+                document.add_text(line + "\n")
+        
+        # Performance comparison
+        if self.bfs_bench and self.dfs_bench:
+            document.add_text("\nPERFORMANCE COMPARISON:\n")
+            columns = [("BFS", self.bfs_bench), ("DFS", self.dfs_bench)]
+            columns += [(name, bench) for name, (stats, bench) in self.extra_results.items() if bench]
+            document.add_text(benchmark.format_comparison(columns))
+        return document
+    
+    def clear_results(self):
+        """Clear all results and visualizations"""
+        self.stop_search()
+        self.bfs_panel.clear()
+        self.dfs_panel.clear()
+        self.comparison_panel.clear()
+        self.batch_text.delete('1.0', tk.END)
+        
+        self.bfs_path = []
+        self.dfs_path = []
+        self.bfs_stats = {}
+        self.dfs_stats = {}
+        self.bfs_bench = {}
+        self.dfs_bench = {}
+        self.extra_results = {}
+        self.results_entry = None
+        
+        # Reset visualization
+        self.animation.cancel()
+        self.visualize_graph()
+    
+    def add_node(self):
+        nodes = [n.strip() for n in self.node_entry.get().split(',') if n.strip()]
+        if not nodes:
+            messagebox.showerror("Error", "Please enter at least one node name")
+            return
+        errors = []
+        new_nodes = {}
+        for node in nodes:
+            if node in self.graph or node in new_nodes:
+                errors.append(f"Node '{node}' already exists")
+            else:
+                new_nodes[node] = None
+        self.graph.add_nodes_from(new_nodes)
+        self.node_index.add(new_nodes)
+        if self.reachability is not None:
+            for node in new_nodes:
+                self.reachability.add_node(node)
+        self.mark_graph_changed()
+        self.update_node_edge_controls()
+        self.visualize_graph()
+        self.node_entry.delete(0, tk.END)
+        if errors:
+            messagebox.showerror("Error", "\n".join(errors))
+
+    def remove_node(self):
+        nodes = [n.strip() for n in self.node_entry.get().split(',') if n.strip()]
+        if not nodes:
+            messagebox.showerror("Error", "Please enter at least one node name")
+            return
+        errors = []
+        for node in nodes:
+            if node not in self.graph.nodes:
+                errors.append(f"Node '{node}' does not exist")
+            else:
+                self.graph.remove_node(node)
+                self.node_index.remove([node])
+                if self.reachability is not None:
+                    self.reachability.remove_node(node)
+        self.mark_graph_changed()
+        self.update_node_edge_controls()
+        self.visualize_graph()
+        self.node_entry.delete(0, tk.END)
+        if errors:
+            messagebox.showerror("Error", "\n".join(errors))
+
+    def add_edge(self):
+        edge_texts = [e.strip() for e in self.edge_entry.get().split(',') if e.strip()]
+        if not edge_texts:
+            messagebox.showerror("Error", "Please enter at least one edge as 'A-B'")
+            return
+        errors = []
+        new_edges = {}  # validated in one pass, then inserted together
+        for edge_text in edge_texts:
+            if '-' not in edge_text:
+                errors.append(f"Invalid edge format: '{edge_text}'")
+                continue
+            u, v = [x.strip() for x in edge_text.split('-', 1)]
+            if u not in self.graph or v not in self.graph:
+                errors.append(f"Both nodes must exist for edge '{u}-{v}'")
+                continue
+            if (u, v) in new_edges or self.graph.has_edge(u, v):
+                errors.append(f"Edge '{u}-{v}' already exists")
+                continue
+            new_edges[u, v] = None
+        self.graph.add_edges_from(new_edges)
+        if self.reachability is not None:
+            for u, v in new_edges:
+                self.reachability.add_edge(u, v)
+        self.mark_graph_changed()
+        self.visualize_graph()
+        self.edge_entry.delete(0, tk.END)
+        if errors:
+            messagebox.showerror("Error", "\n".join(errors))
+
+    def remove_edge(self):
+        edge_texts = [e.strip() for e in self.edge_entry.get().split(',') if e.strip()]
+        if not edge_texts:
+            messagebox.showerror("Error", "Please enter at least one edge as 'A-B'")
+            return
+        errors = []
+        for edge_text in edge_texts:
+            if '-' not in edge_text:
+                errors.append(f"Invalid edge format: '{edge_text}'")
+                continue
+            u, v = [x.strip() for x in edge_text.split('-', 1)]
+            if not self.graph.has_edge(u, v):
+                errors.append(f"Edge '{u}-{v}' does not exist")
+                continue
+            self.graph.remove_edge(u, v)
+            if self.reachability is not None:
+                self.reachability.remove_edge(u, v)
+        self.mark_graph_changed()
+        self.visualize_graph()
+        self.edge_entry.delete(0, tk.END)
+        if errors:
+            messagebox.showerror("Error", "\n".join(errors))
+    
+    def clear_graph(self):
+        self.graph.clear()
+        self.node_index.clear()
+        self.reachability = None
+        self.mark_graph_changed()
+        self.update_node_edge_controls()
+        self.visualize_graph()
+
+    def import_edges(self):
+        """Load an edge-list, CSV or TSV file on the background worker"""
+        path = filedialog.askopenfilename(
+            title="Import Edges",
+            filetypes=[("Edge lists", "*.txt *.edges *.csv *.tsv"), ("All files", "*.*")])
+        if not path:
+            return
+        self.stop_search()
+        skip_header = graph_io.has_header(path)
+        imported = nx.DiGraph()
+        self.imported_graph = imported
+        # The CSR graph searches will use is built alongside, so the first search
+        # after the import doesn't convert the whole graph on the Tk thread
+        existing = self.graph
+        builder = traversal_engine.CSRBuilder()
+        
+        # Runs on the worker thread; an import into a non-empty graph is merged
+        # into it, so its CSR graph starts from the current nodes and edges
+        def read_chunks(progress):
+            if existing.number_of_nodes():
+                builder.add_nodes(existing)
+                builder.add([label for edge in existing.edges() for label in edge])
+            return graph_io.iter_edge_chunks(path, skip_header=skip_header, progress=progress)
+        
+        # Runs on the worker thread: one bulk insert per parsed chunk
+        def consume(chunk):
+            imported.add_edges_from(zip(chunk[0::2], chunk[1::2]))
+            builder.add(chunk)
+        
+        self.worker.import_edges(read_chunks, consume, builder.build)
+        self.start_polling("Import")
+    
+    def open_snapshot(self):
+        """Replace the graph with a saved snapshot, traversing its mapped arrays directly"""
+        path = filedialog.askopenfilename(
+            title="Open Snapshot", filetypes=[("Graph snapshots", "*.csrg"), ("All files", "*.*")])
+        if not path:
+            return
+        self.stop_search()
+        try:
+            snapshot = graph_snapshot.load_snapshot(path, verify=self.verify_snapshot_var.get())
+        except (OSError, ValueError) as exc:
+            messagebox.showerror("Error", str(exc))
+            return
+        imported = nx.DiGraph()
+        self.imported_graph = imported
+        self.imported_csr = snapshot
+        
+        # The networkx copy is still needed for editing and drawing; build it off the Tk thread
+        def read_chunks(progress):
+            imported.add_nodes_from(snapshot.labels)
+            return snapshot.edge_chunks(progress=progress)
+        
+        def consume(chunk):
+            imported.add_edges_from(zip(chunk[0::2], chunk[1::2]))
+        
+        self.worker.import_edges(read_chunks, consume)
+        self.start_polling("Import")
+    
+    def save_snapshot(self):
+        """Write the current graph to a snapshot file"""
+        if not self.graph.nodes():
+            messagebox.showerror("Error", "Please create a graph first")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save Snapshot", defaultextension=".csrg",
+            filetypes=[("Graph snapshots", "*.csrg"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            size = graph_snapshot.save_snapshot(self.csr_graph(), path)
+        except (OSError, ValueError) as exc:
+            messagebox.showerror("Error", str(exc))
+            return
+        self.status_var.set(f"Saved snapshot ({size / 1024:.1f} KB)")
+    
+    def finish_import(self):
+        """Merge the imported edges into the graph (or replace it with an opened
+        snapshot) and redraw once"""
+        imported, self.imported_graph = self.imported_graph, None
+        snapshot, self.imported_csr = self.imported_csr, None
+        if self.graph.number_of_nodes() and snapshot is None:
+            self.graph.update(imported)
+        else:
+            self.graph = imported
+        self.node_index.rebuild(self.graph.nodes)
+        self.reachability = None
+        self.mark_graph_changed()
+        # An opened snapshot is searched in place; an edge import built its CSR graph on the worker
+        self._csr = snapshot if snapshot is not None else self.prepared_value
+        self.update_node_edge_controls()
+        self.visualize_graph()
+        self.status_var.set(f"Imported {imported.number_of_edges()} edges "
+                            f"({self.graph.number_of_nodes()} nodes, {self.graph.number_of_edges()} edges total)")
+    
+    def update_node_edge_controls(self):
+        """Keep the start and goal picks that survived an edit, defaulting the start to
+        the first node, and refresh the pickers' match lists"""
+        if self.node_label(self.start_node_var.get()) not in self.graph:
+            self.start_node_var.set(next(iter(self.graph), ''))
+        if self.node_label(self.goal_node_var.get()) not in self.graph:
+            self.goal_node_var.set('')
+        self.start_node_combo.refresh()
+        self.goal_node_combo.refresh()
+
+def main():
+    root = tk.Tk()
+    app = GraphTraversalGUI(root)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
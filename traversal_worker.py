@@ -0,0 +1,290 @@
+"""Background execution of traversals with progress reporting and cancellation"""
+from concurrent.futures import ProcessPoolExecutor, wait
+import functools
+import queue
+import threading
+import batch_traversal
+import benchmark
+from traversal_engine import TraversalCancelled, EventCollector, VISIT, skip_unreachable, traverse_events
+
+# Set in each pool process by _init_process
+_progress_queue = None
+_current_job = None
+
+
+def execute(name, traversal, graph, start, goal, report, is_current, run_benchmark=False):
+    """Run one traversal, then measure memory (or a full benchmark) in separate passes.
+
+    report(name, nodes_visited, frontier_size) receives progress; is_current() is
+    polled at every progress step and the search raises TraversalCancelled once it
+    turns false. Returns (name, path, stats, bench) where bench may be empty.
+    """
+    def progress(nodes_visited, frontier_size):
+        if not is_current():
+            raise TraversalCancelled()
+        report(name, nodes_visited, frontier_size)
+
+    def check_cancelled(nodes_visited, frontier_size):
+        if not is_current():
+            raise TraversalCancelled()
+
+    path, stats = traversal(graph, start, goal, progress=progress)
+    bench = {}
+    if "error" not in stats:
+        quiet = functools.partial(traversal, progress=check_cancelled)
+        if run_benchmark:
+            bench = benchmark.benchmark_traversal(quiet, graph, start, goal)
+            stats["memory_used"] = bench["memory_used"]
+        else:
+            stats["memory_used"] = benchmark.measure_memory(quiet, graph, start, goal)
+    return name, path, stats, bench
+
+
+def _init_process(progress_queue, current_job):
+    global _progress_queue, _current_job
+    _progress_queue = progress_queue
+    _current_job = current_job
+
+
+def _process_task(job, name, traversal, graph, start, goal):
+    def report(name, nodes_visited, frontier_size):
+        _progress_queue.put((job, "progress", (name, nodes_visited, frontier_size)))
+
+    return execute(name, traversal, graph, start, goal, report,
+                   lambda: _current_job.value == job, run_benchmark=True)
+
+
+class TraversalWorker:
+    """Runs traversals off the Tk thread and posts (job, kind, payload) messages.
+
+    kind is "progress" with (name, nodes_visited, frontier_size), "events" with
+    (name, visited_nodes) for streamed jobs, "result" with (name, path, stats,
+    bench), "import-progress" with (edges, done, total) for imports, "batch" with a
+    list of batch_traversal result dicts, "prepared" with the value built by a
+    prepare job, "done" once every traversal of the job finished, or "error" with a message.
+    Cancelled jobs post nothing further; callers should ignore messages whose job
+    is not the current one.
+    """
+
+    def __init__(self, processes=4):
+        self.messages = queue.Queue()
+        self.job = 0
+        self.processes = processes
+        self._pool = None
+        self._mp_queue = None
+        self._mp_job = None
+
+    def is_current(self, job):
+        return job == self.job
+
+    def run(self, name, traversal, graph, start, goal=None):
+        """Start a single traversal on a background thread and return its job id"""
+        job = self._next_job()
+
+        def report(name, nodes_visited, frontier_size):
+            self.messages.put((job, "progress", (name, nodes_visited, frontier_size)))
+
+        def target():
+            try:
+                result = execute(name, traversal, graph, start, goal, report,
+                                 lambda: self.is_current(job))
+            except TraversalCancelled:
+                return
+            except Exception as exc:
+                self.messages.put((job, "error", str(exc)))
+                return
+            self.messages.put((job, "result", result))
+            self.messages.put((job, "done", None))
+
+        threading.Thread(target=target, daemon=True).start()
+        return job
+
+    def stream(self, name, events, algorithm, graph, start, goal=None, batch_size=256, counters=False):
+        """Consume an event stream on a background thread, posting visited nodes in
+        batches while the search runs, then the collected path and stats (with
+        EventCollector.counters under "counters" if counters is true)"""
+        job = self._next_job()
+
+        def target():
+            if start not in graph:
+                self.messages.put((job, "result", (name, [], {"error": "Start node not in graph"}, {})))
+                self.messages.put((job, "done", None))
+                return
+            skipped = skip_unreachable(algorithm, graph, start, goal)
+            if skipped is not None:
+                self.messages.put((job, "result", (name, *skipped, {})))
+                self.messages.put((job, "done", None))
+                return
+            collector = EventCollector(algorithm, start, goal)
+            batch = []
+
+            def check_cancelled(nodes_visited, frontier_size):
+                if not self.is_current(job):
+                    raise TraversalCancelled()
+
+            try:
+                for event in events(graph, start, goal):
+                    collector.add(event)
+                    if event.kind != VISIT:
+                        continue
+                    batch.append(event.node)
+                    if len(batch) >= batch_size:
+                        if not self.is_current(job):
+                            return
+                        self.messages.put((job, "events", (name, batch)))
+                        self.messages.put((job, "progress", (name, len(collector.path),
+                                                             collector.frontier_size)))
+                        batch = []
+                self.messages.put((job, "events", (name, batch)))
+                path, stats = collector.result()
+                if counters:
+                    stats["counters"] = collector.counters(graph)
+                quiet = functools.partial(traverse_events, events, algorithm, progress=check_cancelled)
+                stats["memory_used"] = benchmark.measure_memory(quiet, graph, start, goal)
+            except TraversalCancelled:
+                return
+            except Exception as exc:
+                self.messages.put((job, "error", str(exc)))
+                return
+            self.messages.put((job, "result", (name, path, stats, {})))
+            self.messages.put((job, "done", None))
+
+        threading.Thread(target=target, daemon=True).start()
+        return job
+
+    def prepare(self, build):
+        """Call build() on a background thread and post its return value, for
+        indexes that searches need and that are too slow to build on the Tk thread"""
+        job = self._next_job()
+
+        def target():
+            try:
+                value = build()
+            except Exception as exc:
+                self.messages.put((job, "error", str(exc)))
+                return
+            self.messages.put((job, "prepared", value))
+            self.messages.put((job, "done", None))
+
+        threading.Thread(target=target, daemon=True).start()
+        return job
+
+    def import_edges(self, read_chunks, consume, finish=None):
+        """Load edges on a background thread, handing each chunk of flat [u1, v1, u2,
+        v2, ...] labels to consume() on that thread.
+
+        read_chunks(progress=...) returns the chunk iterator, e.g. a partial of
+        graph_io.iter_edge_chunks; it reports progress(done, total) in any unit.
+        finish(), if given, runs on the thread after the last chunk and its return
+        value is posted as "prepared".
+        """
+        job = self._next_job()
+
+        def target():
+            edges = 0
+
+            def progress(done, total):
+                self.messages.put((job, "import-progress", (edges, done, total)))
+
+            try:
+                for chunk in read_chunks(progress=progress):
+                    if not self.is_current(job):
+                        return
+                    consume(chunk)
+                    edges += len(chunk) // 2
+                if finish is not None:
+                    self.messages.put((job, "prepared", finish()))
+            except Exception as exc:
+                self.messages.put((job, "error", str(exc)))
+                return
+            self.messages.put((job, "done", None))
+
+        threading.Thread(target=target, daemon=True).start()
+        return job
+
+    def batch(self, graph, sources, goal=None, processes=None, batch_size=64):
+        """Run a multi-source BFS (towards goal, if given) across a process pool on a
+        background thread, posting results in groups as they complete"""
+        job = self._next_job()
+
+        def target():
+            goals = [goal] * len(sources) if goal is not None else None
+            results = batch_traversal.batch_bfs(graph, sources, goals, processes)
+            batch = []
+            try:
+                for result in results:
+                    if not self.is_current(job):
+                        return
+                    batch.append(result)
+                    if len(batch) >= batch_size:
+                        self.messages.put((job, "batch", batch))
+                        batch = []
+            except Exception as exc:
+                self.messages.put((job, "error", str(exc)))
+                return
+            finally:
+                results.close()
+            self.messages.put((job, "batch", batch))
+            self.messages.put((job, "done", None))
+
+        threading.Thread(target=target, daemon=True).start()
+        return job
+
+    def compare(self, traversals, graph, start, goal=None):
+        """Run each (name, traversal) pair in its own process, benchmarking each one"""
+        job = self._next_job()
+        pool = self._ensure_pool()
+        futures = [pool.submit(_process_task, job, name, traversal, graph, start, goal)
+                   for name, traversal in traversals]
+
+        def collect():
+            wait(futures)
+            for future in futures:
+                try:
+                    result = future.result()
+                except TraversalCancelled:
+                    return
+                except Exception as exc:
+                    self.messages.put((job, "error", str(exc)))
+                    return
+                self.messages.put((job, "result", result))
+            self.messages.put((job, "done", None))
+
+        threading.Thread(target=collect, daemon=True).start()
+        return job
+
+    def cancel(self):
+        """Stop the current job; running searches abort at their next progress step"""
+        self._next_job()
+
+    def shutdown(self):
+        self.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._mp_queue.put(None)
+            self._pool = None
+
+    def _next_job(self):
+        self.job += 1
+        if self._mp_job is not None:
+            self._mp_job.value = self.job
+        return self.job
+
+    def _ensure_pool(self):
+        if self._pool is None:
+            context = batch_traversal.spawn_context()
+            self._mp_queue = context.Queue()
+            self._mp_job = context.Value("i", self.job, lock=False)
+            self._pool = ProcessPoolExecutor(self.processes, mp_context=context,
+                                             initializer=_init_process,
+                                             initargs=(self._mp_queue, self._mp_job))
+            threading.Thread(target=self._forward_progress, args=(self._mp_queue,),
+                             daemon=True).start()
+        return self._pool
+
+    def _forward_progress(self, mp_queue):
+        while True:
+            message = mp_queue.get()
+            if message is None:
+                return
+            self.messages.put(message)